@@ -0,0 +1,61 @@
+"""
+FANS 분석 문서 컨텍스트
+요청마다 한 번만 만들어 문장 분리, 사전 매칭, 문장 감성 결과를 분석기끼리 공유
+"""
+
+from typing import List, Optional, Tuple
+
+from lexicon_matcher import LexiconHits, LexiconMatcher
+from sentiment_analyzer import SentimentAnalyzer
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """text.split('.')과 같은 기준의 문장 구간 [(시작, 끝), ...]"""
+    spans = []
+    start = 0
+    for idx, ch in enumerate(text):
+        if ch == '.':
+            spans.append((start, idx))
+            start = idx + 1
+    spans.append((start, len(text)))
+    return spans
+
+
+class AnalysisDocument:
+    """한 기사에 대한 분석 중간 결과"""
+
+    def __init__(self, text: str, matcher: LexiconMatcher, sentiment_analyzer: SentimentAnalyzer):
+        """
+        Args:
+            text: 원문
+            matcher: 감성/정당 사전이 모두 컴파일된 매처
+            sentiment_analyzer: 매칭 결과로 감성을 계산할 분석기
+        """
+        self.text = text
+        self.spans = sentence_spans(text)
+        self.hits = matcher.scan(text)
+        self.sentence_hits: List[LexiconHits] = self.hits.partition(self.spans)
+
+        self._sentiment_analyzer = sentiment_analyzer
+        self._sentiment: Optional[dict] = None
+        self._sentence_sentiments: List[Optional[dict]] = [None] * len(self.spans)
+
+    def sentence(self, idx: int) -> str:
+        """idx번째 문장 원문"""
+        start, end = self.spans[idx]
+        return self.text[start:end]
+
+    def sentence_sentiment(self, idx: int) -> dict:
+        """idx번째 문장 감성 (최초 요청 시 한 번만 계산)"""
+        if self._sentence_sentiments[idx] is None:
+            self._sentence_sentiments[idx] = self._sentiment_analyzer.analyze_hits(
+                self.sentence_hits[idx]
+            )
+        return self._sentence_sentiments[idx]
+
+    @property
+    def sentiment(self) -> dict:
+        """전체 텍스트 감성"""
+        if self._sentiment is None:
+            self._sentiment = self._sentiment_analyzer.analyze_hits(self.hits)
+        return self._sentiment
@@ -0,0 +1,137 @@
+"""
+FANS 분석 실행기
+CPU 작업을 워커 프로세스 풀로 보내 이벤트 루프를 막지 않도록 한다.
+대기 작업 수를 제한해 과부하 시 빠르게 거절(backpressure)한다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+import analysis_tasks
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusyError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+
+class AnalysisExecutor:
+    """분석 작업용 프로세스 풀 (대기열 상한 포함)"""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 queue_timeout: Optional[float] = None):
+        """
+        Args:
+            workers: 워커 프로세스 수 (0이면 프로세스 풀 없이 스레드 하나에서 실행)
+            max_pending: 실행 중 + 대기 중 작업 최대 수
+            queue_timeout: 대기열 자리가 날 때까지 기다릴 최대 시간(초)
+        """
+        if workers is None:
+            workers = int(os.getenv("ANALYSIS_WORKERS", os.cpu_count() or 1))
+        if max_pending is None:
+            max_pending = int(os.getenv("ANALYSIS_MAX_PENDING", max(workers, 1) * 4))
+        if queue_timeout is None:
+            queue_timeout = float(os.getenv("ANALYSIS_QUEUE_TIMEOUT", 5.0))
+
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+
+        self._pool = None
+        # 풀을 다시 만들 때마다 증가 (동시에 손상을 감지한 요청이 풀을 여러 번 다시 만들지 않도록)
+        self._generation = 0
+        self._rebuild_lock: Optional[asyncio.Lock] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._busy_seconds = 0.0
+
+    def start(self):
+        """풀 생성 (이벤트 루프 안에서 호출)"""
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._rebuild_lock = asyncio.Lock()
+        self._pool = self._create_pool()
+        logger.info(f"분석 실행기 시작: workers={self.workers}, max_pending={self.max_pending}")
+
+    def _create_pool(self):
+        if self.workers <= 0:
+            analysis_tasks.init_worker()
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
+
+        # fork는 이벤트 루프/스레드 상태까지 복제하므로 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=analysis_tasks.init_worker
+        )
+
+    async def _rebuild(self, generation: int):
+        """손상된 풀 교체 (같은 세대의 풀은 한 번만 다시 만듦)"""
+        async with self._rebuild_lock:
+            if self._generation != generation:
+                return
+            logger.error("분석 워커 풀이 손상되어 재생성합니다")
+            self.shutdown()
+            self._pool = self._create_pool()
+            self._generation += 1
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def submit(self, fn: Callable, *args):
+        """
+        작업을 풀에서 실행하고 결과를 기다림
+        대기열이 queue_timeout 동안 비지 않으면 ExecutorBusyError
+        """
+        if self._pool is None:
+            raise RuntimeError("분석 실행기가 시작되지 않았습니다")
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise ExecutorBusyError(f"분석 대기열이 가득 찼습니다 (max_pending={self.max_pending})")
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            generation = self._generation
+            try:
+                result = await loop.run_in_executor(self._pool, fn, *args)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되면 풀을 다시 만들고 한 번 재시도
+                await self._rebuild(generation)
+                result = await loop.run_in_executor(self._pool, fn, *args)
+            self._completed += 1
+            return result
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._busy_seconds += time.perf_counter() - started
+            self._pending -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "pool_restarts": self._generation,
+            "busy_seconds": round(self._busy_seconds, 3)
+        }
@@ -0,0 +1,165 @@
+"""
+FANS 분석 작업 함수
+워커 프로세스에서 실행되는 CPU 작업 모음 (분석기/사전은 프로세스당 한 번만 로드)
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sentiment_analyzer import SentimentAnalyzer
+from keyword_extractor import KeywordExtractor
+from political_analyzer import PoliticalAnalyzer
+from sentence_classifier import SentenceClassifier
+
+logger = logging.getLogger(__name__)
+
+# 사전/분석 로직이 바뀌면 올려서 이전 캐시 결과를 무효화
+ANALYZER_VERSION = "2.1.0"
+
+_analyzers = None
+
+
+class Analyzers:
+    """프로세스 단위로 공유하는 분석기 묶음"""
+
+    def __init__(self):
+        self.sentiment = SentimentAnalyzer()
+        self.keywords = KeywordExtractor()
+        self.political = PoliticalAnalyzer()
+        self.sentences = SentenceClassifier()
+
+
+def get_analyzers() -> Analyzers:
+    """현재 프로세스의 분석기 (최초 호출 시 로드)"""
+    global _analyzers
+    if _analyzers is None:
+        _analyzers = Analyzers()
+    return _analyzers
+
+
+def init_worker():
+    """워커 프로세스 초기화: 분석기와 사전 오토마톤을 미리 로드"""
+    get_analyzers()
+    logger.info(f"분석 워커 준비 완료 (pid={os.getpid()})")
+
+
+def format_keywords(keywords: list) -> list:
+    return [{"word": k, "score": float(s)} for k, s in keywords]
+
+
+def build_full_result(document, keywords: list, article_id: Optional[int], sentiment: dict) -> dict:
+    """/analyze/full 응답 본문 생성 (단건/배치 공용)"""
+    political_analyzer = get_analyzers().political
+    party_analysis = political_analyzer.analyze_party_mentions(document)
+    political_result = None
+    bias_score = 0.0
+    stance = "중립"
+
+    if party_analysis:
+        bias = political_analyzer.calculate_bias_score(document, party_analysis)
+        bias_score = bias['bias_score']
+        stance = bias['stance']
+        political_result = {
+            "party_analysis": party_analysis,
+            "bias_score": bias_score,
+            "stance": stance
+        }
+
+    return {
+        "article_id": article_id,
+        "sentiment": sentiment,
+        "keywords": format_keywords(keywords),
+        "political": political_result,
+        "bias_score": bias_score,
+        "political_leaning": stance,
+        "confidence": sentiment.get('confidence', 0.0),
+        "processed_at": datetime.now().isoformat()
+    }
+
+
+def model_versions() -> Dict[str, Optional[str]]:
+    """이 워커가 실제로 사용 중인 모델 버전 (IDF 모델, 문장 분류 모델)"""
+    analyzers = get_analyzers()
+    return {
+        "idf": analyzers.keywords.idf_version,
+        "sentence_model": analyzers.sentences.version
+    }
+
+
+def run_versioned(fn, *args) -> Tuple[Dict[str, Optional[str]], object]:
+    """
+    분석 작업을 실행하고 이 워커가 실제로 사용한 모델 버전을 함께 반환
+    (워커는 IDF 모델을 주기적으로만 다시 읽고 문장 분류 모델은 시작할 때 한 번 로드하므로
+    디스크의 최신 버전과 다를 수 있음)
+    """
+    result = fn(*args)
+    return model_versions(), result
+
+
+def run_sentiment(text: str) -> dict:
+    return get_analyzers().sentiment.analyze(text)
+
+
+def run_keywords(text: str, top_n: int = 10) -> list:
+    return format_keywords(get_analyzers().keywords.extract(text, top_n=top_n))
+
+
+def run_political(text: str) -> dict:
+    political_analyzer = get_analyzers().political
+    document = political_analyzer.build_document(text)
+    party_analysis = political_analyzer.analyze_party_mentions(document)
+    bias = political_analyzer.calculate_bias_score(document, party_analysis)
+
+    return {
+        "party_analysis": party_analysis,
+        "bias_score": bias['bias_score'],
+        "stance": bias['stance'],
+        "ruling_sentiment": bias['ruling_sentiment'],
+        "opposition_sentiment": bias['opposition_sentiment']
+    }
+
+
+def run_full(text: str, article_id: Optional[int] = None) -> dict:
+    analyzers = get_analyzers()
+    # 문장 분리/사전 매칭/문장 감성은 문서 하나로 한 번만 계산
+    document = analyzers.political.build_document(text)
+    keywords = analyzers.keywords.extract(text, top_n=10)
+    return build_full_result(document, keywords, article_id, document.sentiment)
+
+
+def run_sentiment_batch(texts: List[str]) -> list:
+    return get_analyzers().sentiment.analyze_batch(texts)
+
+
+def run_keywords_batch(texts: List[str], top_n: int = 10) -> list:
+    return [format_keywords(k) for k in get_analyzers().keywords.extract_batch(texts, top_n=top_n)]
+
+
+def run_political_batch(texts: List[str]) -> list:
+    return [run_political(text) for text in texts]
+
+
+def run_full_batch(articles: List[Tuple[str, Optional[int]]]) -> list:
+    """여러 기사 전체 분석 (키워드 행렬/감성 점수를 기사 전체에 대해 한 번에 계산)"""
+    analyzers = get_analyzers()
+    texts = [text for text, _ in articles]
+    documents = [analyzers.political.build_document(text) for text in texts]
+    sentiments = analyzers.sentiment.analyze_hits_batch([d.hits for d in documents])
+    keywords_list = analyzers.keywords.extract_batch(texts, top_n=10)
+
+    return [
+        build_full_result(document, keywords, article_id, sentiment)
+        for (_, article_id), document, keywords, sentiment
+        in zip(articles, documents, keywords_list, sentiments)
+    ]
+
+
+def run_sentence_types(text: str) -> dict:
+    return get_analyzers().sentences.classify_article(text)
+
+
+def run_sentence_types_batch(texts: List[str]) -> list:
+    """여러 기사 문장 유형 분류 (전체 문장을 모델별로 한 번에 예측)"""
+    return get_analyzers().sentences.classify_articles(texts)
@@ -0,0 +1,275 @@
+"""
+FANS KcELECTRA 문장 유형 추론 엔진 (CPU 최적화)
+sentence_type_trainer.py로 파인튜닝한 체크포인트를 서비스용으로 실행한다.
+
+- 백엔드: torch (동적 int8 양자화) 또는 ONNX Runtime
+- 문장을 길이순으로 묶고 배치마다 가장 긴 문장 길이까지만 패딩
+- torch / transformers / onnxruntime은 선택 의존성이라 사용할 때만 import
+
+ONNX 변환:
+    python electra_inference.py ./models/sentence_type_model --export-onnx --quantize
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "models", "sentence_type_model"
+)
+ONNX_FILE = "model.onnx"
+ONNX_INT8_FILE = "model.int8.onnx"
+
+
+def default_threads() -> int:
+    """워커 프로세스당 추론 스레드 수 (CPU 코어를 분석 워커 수로 나눔)"""
+    workers = max(int(os.getenv("ANALYSIS_WORKERS", 1) or 1), 1)
+    return max((os.cpu_count() or 1) // workers, 1)
+
+
+def directory_fingerprint(model_dir: str) -> str:
+    """
+    체크포인트 디렉터리 버전 (파일 이름/크기/수정 시각 해시)
+    가중치 파일이 수백 MB라 내용 대신 파일 정보로 판단 (재학습/교체하면 바뀜)
+    """
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(model_dir)):
+        path = os.path.join(model_dir, filename)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            digest.update(f"{filename}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def length_sorted_batches(lengths: List[int], batch_size: int) -> List[np.ndarray]:
+    """길이가 비슷한 문장끼리 묶은 배치별 원래 인덱스"""
+    order = np.argsort(np.asarray(lengths), kind='stable')
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def predict_logits(forward: Callable[[dict], np.ndarray], tokenizer, texts: List[str],
+                   batch_size: int = 32, max_length: int = 512) -> Optional[np.ndarray]:
+    """
+    동적 패딩 배치 추론
+    Args:
+        forward: 패딩된 numpy 입력 dict -> logits (배치 x 클래스)
+    Returns:
+        원래 문장 순서의 logits (문장이 없으면 None)
+    """
+    if not texts:
+        return None
+
+    # 패딩 없이 한 번에 토큰화해 길이만 먼저 구함
+    encodings = tokenizer(texts, truncation=True, max_length=max_length)
+    keys = list(encodings.keys())
+    lengths = [len(ids) for ids in encodings['input_ids']]
+
+    logits = None
+    for batch in length_sorted_batches(lengths, batch_size):
+        features = [{key: encodings[key][i] for key in keys} for i in batch]
+        padded = tokenizer.pad(features, padding='longest', return_tensors='np')
+        output = forward(dict(padded))
+        if logits is None:
+            logits = np.zeros((len(texts), output.shape[1]), dtype=np.float32)
+        logits[batch] = output
+    return logits
+
+
+def torch_forward(model, device=None) -> Callable[[dict], np.ndarray]:
+    """torch 모델용 forward (학습 스크립트 평가에도 사용)"""
+    import torch
+
+    def forward(inputs: dict) -> np.ndarray:
+        tensors = {key: torch.from_numpy(np.asarray(value, dtype=np.int64)) for key, value in inputs.items()}
+        if device is not None:
+            tensors = {key: value.to(device) for key, value in tensors.items()}
+        with torch.inference_mode():
+            return model(**tensors).logits.float().cpu().numpy()
+
+    return forward
+
+
+def onnx_forward(session) -> Callable[[dict], np.ndarray]:
+    input_names = [i.name for i in session.get_inputs()]
+
+    def forward(inputs: dict) -> np.ndarray:
+        feed = {name: np.asarray(inputs[name], dtype=np.int64) for name in input_names if name in inputs}
+        return session.run(None, feed)[0]
+
+    return forward
+
+
+def load_classes(model_dir: str, id2label: Optional[dict] = None) -> List[str]:
+    """label_map.json(학습 스크립트 저장 형식) 또는 모델 config의 라벨 순서"""
+    path = os.path.join(model_dir, "label_map.json")
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            reverse = json.load(f)['reverse_label_map']
+        return [reverse[str(i)] for i in range(len(reverse))]
+    return [id2label[i] for i in sorted(id2label)]
+
+
+def export_onnx(model_dir: str, quantize: bool = True, opset: int = 14) -> str:
+    """체크포인트를 ONNX로 변환 (quantize=True면 int8 동적 양자화본도 생성)"""
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    model = AutoModelForSequenceClassification.from_pretrained(model_dir)
+    model.eval()
+
+    sample = tokenizer(["문장 유형 분류 예시 문장입니다."], return_tensors='pt')
+    input_names = list(sample.keys())
+    path = os.path.join(model_dir, ONNX_FILE)
+    torch.onnx.export(
+        model,
+        tuple(sample[name] for name in input_names),
+        path,
+        input_names=input_names,
+        output_names=['logits'],
+        dynamic_axes={
+            **{name: {0: 'batch', 1: 'sequence'} for name in input_names},
+            'logits': {0: 'batch'}
+        },
+        opset_version=opset
+    )
+    logger.info(f"ONNX 변환 완료: {path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        int8_path = os.path.join(model_dir, ONNX_INT8_FILE)
+        quantize_dynamic(path, int8_path, weight_type=QuantType.QInt8)
+        logger.info(f"int8 양자화 완료: {int8_path}")
+        return int8_path
+    return path
+
+
+class ElectraSentenceClassifier:
+    """파인튜닝한 KcELECTRA 문장 유형 분류기 (SentenceClassifier의 문장 유형 모델로 사용 가능)"""
+
+    def __init__(self, model_dir: str = DEFAULT_MODEL_DIR, backend: Optional[str] = None,
+                 quantize: bool = True, batch_size: int = 32, max_length: int = 512,
+                 num_threads: Optional[int] = None):
+        """
+        Args:
+            backend: 'onnx' 또는 'torch' (None이면 ONNX 파일이 있을 때 onnx)
+            quantize: torch 백엔드는 Linear 층 동적 int8 양자화, onnx 백엔드는 int8 파일 우선
+            max_length: 문장 최대 토큰 수 (학습 때와 같은 값, 패딩은 배치별 최대 길이까지만)
+        """
+        from transformers import AutoTokenizer
+
+        self.model_dir = model_dir
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.num_threads = num_threads or default_threads()
+        self.name = "electra_sentence_type"
+
+        if backend is None:
+            has_onnx = any(os.path.exists(os.path.join(model_dir, f)) for f in (ONNX_INT8_FILE, ONNX_FILE))
+            backend = 'onnx' if has_onnx else 'torch'
+        self.backend = backend
+
+        started = time.perf_counter()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        if backend == 'onnx':
+            self._forward, id2label = self._load_onnx(quantize)
+        elif backend == 'torch':
+            self._forward, id2label = self._load_torch(quantize)
+        else:
+            raise ValueError(f"지원하지 않는 백엔드: {backend}")
+        self.classes = np.asarray(load_classes(model_dir, id2label))
+        self.version = f"{backend}-{directory_fingerprint(model_dir)}"
+
+        logger.info(
+            f"KcELECTRA 문장 분류기 로드: backend={backend}, quantize={quantize}, "
+            f"threads={self.num_threads}, {time.perf_counter() - started:.1f}초"
+        )
+
+    def _load_torch(self, quantize: bool):
+        import torch
+        from transformers import AutoModelForSequenceClassification
+
+        torch.set_num_threads(self.num_threads)
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_dir)
+        model.eval()
+        if quantize:
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return torch_forward(model), model.config.id2label
+
+    def _load_onnx(self, quantize: bool):
+        import onnxruntime as ort
+        from transformers import AutoConfig
+
+        path = os.path.join(self.model_dir, ONNX_INT8_FILE)
+        if not quantize or not os.path.exists(path):
+            path = os.path.join(self.model_dir, ONNX_FILE)
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.num_threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        return onnx_forward(session), AutoConfig.from_pretrained(self.model_dir).id2label
+
+    def predict_proba(self, sentences: List[str]) -> np.ndarray:
+        """문장별 클래스 확률 (문장 수 x 클래스 수)"""
+        logits = predict_logits(self._forward, self.tokenizer, sentences, self.batch_size, self.max_length)
+        if logits is None:
+            return np.zeros((0, len(self.classes)))
+        logits = logits - logits.max(axis=1, keepdims=True)
+        proba = np.exp(logits)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def predict(self, sentences: List[str]) -> List[str]:
+        proba = self.predict_proba(sentences)
+        return [str(label) for label in self.classes[proba.argmax(axis=1)]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KcELECTRA 문장 유형 모델 ONNX 변환 / 추론 속도 측정")
+    parser.add_argument("model_dir", nargs='?', default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--export-onnx", action="store_true")
+    parser.add_argument("--quantize", action="store_true")
+    parser.add_argument("--backend", choices=['onnx', 'torch'], default=None)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.export_onnx:
+        path = export_onnx(args.model_dir, quantize=args.quantize)
+        print(f"✅ ONNX 모델 저장 완료: {path}")
+        return
+
+    classifier = ElectraSentenceClassifier(args.model_dir, backend=args.backend, quantize=True)
+    article = [
+        "정부는 오늘 새로운 경제정책을 발표했다.",
+        "전문가들은 내년 경제가 회복될 것으로 예측한다.",
+        "이번 정책이 성공하려면 국민의 협조가 필요하다고 강조했다.",
+        "김 의원은 '정부 정책에 문제가 있다'고 말했다.",
+        "코스피 지수가 2% 상승했다.",
+        "분석가들은 주가가 더 오를 가능성이 있다고 본다."
+    ] * 5
+
+    classifier.predict_proba(article)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        labels = classifier.predict(article)
+    elapsed = (time.perf_counter() - started) / args.repeat * 1000
+
+    for sentence, label in list(zip(article, labels))[:6]:
+        print(f"{label}\t{sentence}")
+    print(f"\n기사 1건({len(article)}문장) 평균 {elapsed:.1f}ms (backend={classifier.backend})")
+
+
+if __name__ == "__main__":
+    main()
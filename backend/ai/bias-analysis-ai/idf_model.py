@@ -0,0 +1,417 @@
+"""
+FANS 코퍼스 문서 빈도(IDF) 모델
+뉴스 코퍼스 전체에서 모은 용어별 문서 빈도를 저장하고,
+키워드 추출 시 문서마다 벡터라이저를 학습하지 않고 변환만 하도록 한다.
+
+저장 형식 (model_dir/v{버전}/)
+- hashes.npy: 용어 해시(uint64, 오름차순) - 메모리 매핑
+- df.npy: 해시와 같은 순서의 문서 빈도(uint32) - 메모리 매핑
+- doc_hashes.npy: 이미 반영한 문서 본문 해시(uint64, 오름차순) - 같은 기사를 두 번 세지 않도록 사용
+- full_hashes.npy / full_df.npy: min_df로 자르기 전 전체 문서 빈도 (점진적 갱신의 누적 기준, min_df > 1일 때만)
+- meta.json: 문서 수, 버전, n-gram 범위
+model_dir/CURRENT 파일이 현재 버전 디렉토리를 가리킨다.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "idf")
+# 오래된 버전 삭제 시 남길 개수
+# 현재 버전과 직전 버전 외에 한 세대를 더 남겨, 직전 CURRENT를 읽고 로드 중인 워커가 지워진 디렉토리를 만나지 않도록 함
+KEEP_VERSIONS = 3
+LOAD_ATTEMPTS = 3
+
+
+def term_hash(term: str) -> int:
+    """용어를 64비트 해시로 변환"""
+    return int.from_bytes(hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def hash_terms(terms: Iterable[str]) -> np.ndarray:
+    return np.fromiter((term_hash(t) for t in terms), dtype=np.uint64)
+
+
+def current_version(model_dir: str) -> Optional[str]:
+    """현재 모델 버전 디렉토리 이름 (모델이 없으면 None)"""
+    try:
+        with open(os.path.join(model_dir, "CURRENT"), 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+class CurrentVersionCache:
+    """
+    CURRENT 파일을 요청마다 열지 않도록 캐시 (stat 결과가 바뀔 때만 다시 읽음)
+    publish_version은 os.replace로 교체하므로 inode가 바뀌어 mtime 해상도와 관계없이 감지됨
+    """
+
+    def __init__(self, model_dir: str):
+        self.model_dir = model_dir
+        self._stamp = None
+        self._version: Optional[str] = None
+
+    def get(self) -> Optional[str]:
+        try:
+            stat = os.stat(os.path.join(self.model_dir, "CURRENT"))
+        except FileNotFoundError:
+            self._stamp, self._version = None, None
+            return None
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            self._version = current_version(self.model_dir)
+            self._stamp = stamp
+        return self._version
+
+
+def publish_version(model_dir: str, version: str):
+    """CURRENT 포인터를 원자적으로 교체 (읽는 쪽은 항상 완성된 버전만 봄)"""
+    pointer_tmp = os.path.join(model_dir, "CURRENT.tmp")
+    with open(pointer_tmp, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(pointer_tmp, os.path.join(model_dir, "CURRENT"))
+
+
+def lookup_hashes(sorted_hashes: np.ndarray, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정렬된 해시 배열에서 조회
+    Returns:
+        (찾은 여부 마스크, 위치 배열) - 위치는 찾은 항목에 대해서만 유효
+    """
+    if not len(sorted_hashes):
+        return np.zeros(len(query), dtype=bool), np.zeros(len(query), dtype=np.int64)
+    pos = np.searchsorted(sorted_hashes, query)
+    pos = np.minimum(pos, len(sorted_hashes) - 1)
+    found = sorted_hashes[pos] == query
+    return found, pos
+
+
+class DocumentFrequencyModel:
+    """코퍼스 문서 빈도 모델 (점진적 갱신 가능)"""
+
+    def __init__(self, ngram_range: Tuple[int, int] = (1, 2)):
+        self.ngram_range = tuple(ngram_range)
+        self.analyzer = CountVectorizer(ngram_range=self.ngram_range).build_analyzer()
+
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.df = np.zeros(0, dtype=np.uint32)
+        self.doc_hashes = np.zeros(0, dtype=np.uint64)
+        self.n_docs = 0
+        self.version: Optional[str] = None
+        self.model_dir: Optional[str] = None
+
+        self._pending_df: Counter = Counter()
+        self._pending_docs = 0
+        self._pending_doc_hashes: set = set()
+        self._last_reload_check = 0.0
+
+    # ------------------------------------------------------------------
+    # 로드 / 저장
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, model_dir: str = DEFAULT_MODEL_DIR, mmap: bool = True,
+             full: bool = False) -> Optional['DocumentFrequencyModel']:
+        """
+        저장된 모델 로드 (없으면 None)
+        full=True면 min_df로 자르기 전 전체 문서 빈도를 읽음 (이어서 갱신하는 쪽에서 사용)
+        로드 도중 다른 프로세스가 버전을 교체·삭제하면 CURRENT를 다시 읽어 재시도
+        """
+        for attempt in range(LOAD_ATTEMPTS):
+            version = current_version(model_dir)
+            if version is None:
+                return None
+            try:
+                return cls._load_version(model_dir, version, mmap, full)
+            except FileNotFoundError:
+                if attempt == LOAD_ATTEMPTS - 1 or current_version(model_dir) == version:
+                    raise
+                logger.warning(f"IDF 모델 {version} 로드 중 삭제됨, 새 버전으로 재시도")
+
+    @classmethod
+    def _load_version(cls, model_dir: str, version: str, mmap: bool, full: bool) -> 'DocumentFrequencyModel':
+        version_dir = os.path.join(model_dir, version)
+        with open(os.path.join(version_dir, "meta.json"), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+
+        model = cls(ngram_range=meta.get('ngram_range', (1, 2)))
+        mmap_mode = 'r' if mmap else None
+        prefix = "full_" if full and os.path.exists(os.path.join(version_dir, "full_hashes.npy")) else ""
+        model.hashes = np.load(os.path.join(version_dir, f"{prefix}hashes.npy"), mmap_mode=mmap_mode)
+        model.df = np.load(os.path.join(version_dir, f"{prefix}df.npy"), mmap_mode=mmap_mode)
+        doc_hashes_path = os.path.join(version_dir, "doc_hashes.npy")
+        if os.path.exists(doc_hashes_path):
+            model.doc_hashes = np.load(doc_hashes_path, mmap_mode=mmap_mode)
+        model.n_docs = int(meta['n_docs'])
+        model.version = version
+        model.model_dir = model_dir
+        return model
+
+    def maybe_reload(self, min_interval: float = 30.0) -> bool:
+        """다른 프로세스가 새 버전을 저장했으면 다시 로드 (min_interval초마다 확인)"""
+        if self.model_dir is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._last_reload_check < min_interval:
+            return False
+        self._last_reload_check = now
+
+        version = current_version(self.model_dir)
+        if version is None or version == self.version:
+            return False
+
+        try:
+            fresh = DocumentFrequencyModel.load(self.model_dir)
+        except (OSError, ValueError) as e:
+            # 새 버전을 읽지 못하면 지금 모델을 계속 사용하고 다음 확인 때 다시 시도
+            logger.warning(f"IDF 모델 갱신 로드 실패, 기존 버전 {self.version} 유지: {e}")
+            return False
+        if fresh is None:
+            return False
+        self.hashes, self.df, self.n_docs, self.version = fresh.hashes, fresh.df, fresh.n_docs, fresh.version
+        self.doc_hashes = fresh.doc_hashes
+        logger.info(f"IDF 모델 갱신 로드: {self.version} (문서 {self.n_docs:,}개)")
+        return True
+
+    def save(self, model_dir: Optional[str] = None, min_df: int = 1) -> str:
+        """
+        대기 중인 갱신을 병합해 새 버전으로 저장
+        min_df 미만 용어는 조회용 배열(hashes/df)에서만 제외 (모델 크기 축소)
+        전체 문서 빈도는 full_*.npy와 메모리에 그대로 남겨, 다음 갱신에서 기준 이하 용어의 빈도가 0부터 다시 세어지지 않도록 함
+        """
+        model_dir = model_dir or self.model_dir or DEFAULT_MODEL_DIR
+        full_hashes, full_df = self._merged()
+        if min_df > 1:
+            keep = full_df >= min_df
+            hashes, df = full_hashes[keep], full_df[keep]
+        else:
+            hashes, df = full_hashes, full_df
+
+        version = f"v{int(time.time() * 1000)}"
+        version_dir = os.path.join(model_dir, version)
+        os.makedirs(version_dir, exist_ok=True)
+
+        np.save(os.path.join(version_dir, "hashes.npy"), hashes)
+        np.save(os.path.join(version_dir, "df.npy"), df)
+        if len(hashes) < len(full_hashes):
+            np.save(os.path.join(version_dir, "full_hashes.npy"), full_hashes)
+            np.save(os.path.join(version_dir, "full_df.npy"), full_df)
+        doc_hashes = np.union1d(
+            np.asarray(self.doc_hashes),
+            np.fromiter(self._pending_doc_hashes, dtype=np.uint64, count=len(self._pending_doc_hashes))
+        )
+        np.save(os.path.join(version_dir, "doc_hashes.npy"), doc_hashes)
+        n_docs = self.n_docs + self._pending_docs
+        with open(os.path.join(version_dir, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_docs': n_docs,
+                'n_terms': int(len(hashes)),
+                'ngram_range': list(self.ngram_range),
+                'created_at': datetime.now().isoformat()
+            }, f, ensure_ascii=False, indent=2)
+
+        publish_version(model_dir, version)
+
+        self.hashes, self.df, self.n_docs = full_hashes, full_df, n_docs
+        self.doc_hashes = doc_hashes
+        self.version, self.model_dir = version, model_dir
+        self._pending_df.clear()
+        self._pending_docs = 0
+        self._pending_doc_hashes.clear()
+
+        self._remove_old_versions(model_dir)
+        logger.info(f"IDF 모델 저장: {version_dir} (문서 {n_docs:,}개, 용어 {len(hashes):,}개)")
+        return version
+
+    def _merged(self) -> Tuple[np.ndarray, np.ndarray]:
+        """기존 배열과 대기 중인 문서 빈도 병합"""
+        if self._pending_df:
+            new_hashes = np.fromiter(self._pending_df.keys(), dtype=np.uint64, count=len(self._pending_df))
+            new_df = np.fromiter(self._pending_df.values(), dtype=np.uint32, count=len(self._pending_df))
+            all_hashes = np.concatenate([np.asarray(self.hashes), new_hashes])
+            all_df = np.concatenate([np.asarray(self.df), new_df])
+            hashes, inverse = np.unique(all_hashes, return_inverse=True)
+            df = np.zeros(len(hashes), dtype=np.uint32)
+            np.add.at(df, inverse, all_df)
+        else:
+            hashes, df = np.array(self.hashes), np.array(self.df)
+        return hashes, df
+
+    @staticmethod
+    def _remove_old_versions(model_dir: str):
+        versions = sorted(
+            name for name in os.listdir(model_dir)
+            if name.startswith('v') and os.path.isdir(os.path.join(model_dir, name))
+        )
+        for name in versions[:-KEEP_VERSIONS]:
+            shutil.rmtree(os.path.join(model_dir, name), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # 갱신 / 변환
+    # ------------------------------------------------------------------
+    def update(self, texts: Iterable[str]) -> int:
+        """
+        새 문서들의 문서 빈도를 누적 (save() 시 반영)
+        본문 해시로 이미 반영한 문서는 건너뜀 (캐시에서 밀려나 다시 분석된 기사 등)
+
+        Returns:
+            새로 반영한 문서 수
+        """
+        texts = [text or "" for text in texts]
+        seen, _ = lookup_hashes(np.asarray(self.doc_hashes), hash_terms(texts))
+        added = 0
+        for text, already in zip(texts, seen):
+            doc_hash = term_hash(text)
+            if already or doc_hash in self._pending_doc_hashes:
+                continue
+            self._pending_doc_hashes.add(doc_hash)
+            terms = set(self.analyzer(text))
+            self._pending_df.update(term_hash(t) for t in terms)
+            self._pending_docs += 1
+            added += 1
+        return added
+
+    @property
+    def pending_docs(self) -> int:
+        return self._pending_docs
+
+    def idf(self, terms: List[str]) -> np.ndarray:
+        """용어별 IDF (sklearn smooth_idf와 같은 식, 처음 보는 용어는 df=0)"""
+        if not terms:
+            return np.zeros(0, dtype=np.float64)
+
+        df = np.zeros(len(terms), dtype=np.float64)
+        found, pos = lookup_hashes(self.hashes, hash_terms(terms))
+        df[found] = self.df[pos[found]]
+
+        return np.log((1 + self.n_docs) / (1 + df)) + 1
+
+    def transform(self, texts: List[str]) -> Tuple[csr_matrix, List[str]]:
+        """
+        문서들을 L2 정규화 TF-IDF 희소 행렬로 변환
+        열은 이번 호출에 등장한 용어들이며 용어 목록을 함께 반환
+        """
+        vocabulary = {}
+        indptr, indices, counts = [0], [], []
+
+        for text in texts:
+            for term, count in Counter(self.analyzer(text or "")).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        terms = list(vocabulary)
+        if not terms:
+            # 빈 문서뿐이면 열이 없는 행렬 (normalize는 0열 행렬을 받지 않음)
+            return csr_matrix((len(texts), 0), dtype=np.float64), terms
+
+        indices = np.asarray(indices, dtype=np.int64)
+        data = np.asarray(counts, dtype=np.float64) * self.idf(terms)[indices]
+
+        matrix = csr_matrix((data, indices, np.asarray(indptr, dtype=np.int64)),
+                            shape=(len(texts), len(terms)))
+        return normalize(matrix, norm='l2', copy=False), terms
+
+
+class IdfUpdater:
+    """새 기사로 IDF 모델을 백그라운드에서 갱신하고 주기적으로 저장"""
+
+    def __init__(self, model_dir: str = DEFAULT_MODEL_DIR, flush_docs: int = 500,
+                 flush_interval: float = 600.0, min_df: int = 1):
+        self.model_dir = model_dir
+        self.flush_docs = flush_docs
+        self.flush_interval = flush_interval
+        self.min_df = min_df
+
+        self._model: Optional[DocumentFrequencyModel] = None
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def _get_model(self) -> DocumentFrequencyModel:
+        if self._model is None:
+            self._model = DocumentFrequencyModel.load(self.model_dir, mmap=False, full=True) or DocumentFrequencyModel()
+            self._model.model_dir = self.model_dir
+        return self._model
+
+    def add(self, texts: List[str]):
+        """문서 추가 (BackgroundTasks 등 이벤트 루프 밖에서 호출)"""
+        with self._lock:
+            model = self._get_model()
+            model.update(texts)
+
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if model.pending_docs >= self.flush_docs or (due and model.pending_docs):
+                self._flush(model)
+
+    def flush(self):
+        with self._lock:
+            model = self._get_model()
+            if model.pending_docs:
+                self._flush(model)
+
+    def _flush(self, model: DocumentFrequencyModel):
+        os.makedirs(self.model_dir, exist_ok=True)
+        model.save(self.model_dir, min_df=self.min_df)
+        self._last_flush = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            model = self._model
+            return {
+                "version": model.version if model else current_version(self.model_dir),
+                "n_docs": model.n_docs if model else None,
+                "pending_docs": model.pending_docs if model else 0
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스 코퍼스로 IDF 모델 생성/갱신")
+    parser.add_argument("corpus", help="기사 파일 (한 줄에 기사 하나, .jsonl이면 text 필드 사용)")
+    parser.add_argument("--model-dir", default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--min-df", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    model = DocumentFrequencyModel.load(args.model_dir, mmap=False, full=True) or DocumentFrequencyModel()
+
+    def read_corpus():
+        with open(args.corpus, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                yield json.loads(line).get('text', '') if args.corpus.endswith('.jsonl') else line
+
+    chunk = []
+    for text in read_corpus():
+        chunk.append(text)
+        if len(chunk) >= args.chunk_size:
+            model.update(chunk)
+            chunk = []
+            print(f"누적 문서 수: {model.n_docs + model.pending_docs:,}")
+    model.update(chunk)
+
+    os.makedirs(args.model_dir, exist_ok=True)
+    version = model.save(args.model_dir, min_df=args.min_df)
+    print(f"✅ IDF 모델 저장 완료: {args.model_dir}/{version}")
+
+
+if __name__ == "__main__":
+    main()
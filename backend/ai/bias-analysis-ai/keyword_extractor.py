@@ -1,24 +1,116 @@
 """
 FANS 키워드 추출 시스템
 TF-IDF 기반 키워드 추출
+- 코퍼스 IDF 모델(idf_model.py)이 있으면 변환 + 상위 k개 선택만 수행
+- 없으면 문서 단위로 TfidfVectorizer를 학습 (기존 방식)
 """
 
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from typing import Optional
+import logging
+import os
+import time
 import numpy as np
 
+from idf_model import DEFAULT_MODEL_DIR, DocumentFrequencyModel
+
+logger = logging.getLogger(__name__)
+
+def top_k_per_row(matrix, k: int) -> list:
+    """
+    CSR 행렬의 행마다 값 상위 k개 [(열 인덱스 배열, 값 배열), ...]
+    행을 밀집 배열로 바꾸지 않고 행의 비영 값에 부분 정렬(argpartition)만 수행
+    """
+    matrix = matrix.tocsr()
+    indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+    results = []
+
+    for row in range(matrix.shape[0]):
+        start, end = indptr[row], indptr[row + 1]
+        row_data = data[start:end]
+        nnz = end - start
+
+        if nnz > k > 0:
+            top = np.argpartition(-row_data, k - 1)[:k]
+        else:
+            top = np.arange(nnz if k > 0 else 0)
+
+        top = top[np.argsort(-row_data[top], kind='stable')]
+        results.append((indices[start:end][top], row_data[top]))
+
+    return results
+
 class KeywordExtractor:
-    def __init__(self):
-        self.vectorizer = None
+    def __init__(self, idf_model_dir: Optional[str] = None):
+        self.max_features = 100
+        self.ngram_range = (1, 2)
+        # 여러 문서를 함께 처리할 때 (코퍼스 IDF 모델이 없으면) 문서 묶음으로 IDF 학습
+        self.vectorizer = TfidfVectorizer(min_df=1, ngram_range=self.ngram_range)
+
+        # 코퍼스 IDF 모델 (문서 수가 idf_min_docs 이상일 때만 사용)
+        self.idf_model_dir = idf_model_dir or os.getenv("IDF_MODEL_DIR", DEFAULT_MODEL_DIR)
+        self.idf_min_docs = int(os.getenv("IDF_MIN_DOCS", 1000))
+        self.idf_model: Optional[DocumentFrequencyModel] = None
+        self._idf_checked_at = None
+        self._load_idf_model()
+
+    def _load_idf_model(self):
+        self._idf_checked_at = time.monotonic()
+        try:
+            self.idf_model = DocumentFrequencyModel.load(self.idf_model_dir)
+            if self.idf_model:
+                logger.info(f"IDF 모델 로드: {self.idf_model.version} (문서 {self.idf_model.n_docs:,}개)")
+        except Exception as e:
+            logger.error(f"IDF 모델 로드 실패, 문서 단위 TF-IDF 사용: {e}")
+            self.idf_model = None
+
+    @property
+    def idf_version(self) -> Optional[str]:
+        """현재 로드된 IDF 모델 버전 (결과 캐시 키에 사용, 모델이 없으면 None)"""
+        return self.idf_model.version if self.idf_model is not None else None
+
+    def corpus_model(self) -> Optional[DocumentFrequencyModel]:
+        """사용 가능한 코퍼스 IDF 모델 (없거나 문서 수가 부족하면 None)"""
+        if self.idf_model is None:
+            # 백그라운드 갱신으로 모델이 새로 생겼을 수 있으므로 주기적으로 확인
+            if time.monotonic() - self._idf_checked_at >= 30.0:
+                self._load_idf_model()
+            if self.idf_model is None:
+                return None
+        else:
+            self.idf_model.maybe_reload()
+
+        if self.idf_model.n_docs < self.idf_min_docs:
+            return None
+        return self.idf_model
+
+    @staticmethod
+    def _top_terms(matrix, feature_names, top_n: int) -> list:
+        """행마다 점수 상위 top_n개 [(용어, 점수), ...]"""
+        return [
+            [(feature_names[i], float(score)) for i, score in zip(indices, scores) if score > 0]
+            for indices, scores in top_k_per_row(matrix, top_n)
+        ]
 
     def extract(self, text: str, top_n: int = 10) -> list:
         """
         단일 텍스트에서 키워드 추출
         """
+        if not text or not text.strip():
+            return []
+
+        model = self.corpus_model()
+        if model is not None:
+            matrix, terms = model.transform([text])
+            if not terms:
+                return []
+            return self._top_terms(matrix, terms, top_n)[0]
+
         try:
             vectorizer = TfidfVectorizer(
-                max_features=100,
+                max_features=self.max_features,
                 min_df=1,
-                ngram_range=(1, 2)
+                ngram_range=self.ngram_range
             )
             tfidf_matrix = vectorizer.fit_transform([text])
             feature_names = vectorizer.get_feature_names_out()
@@ -33,23 +125,72 @@ class KeywordExtractor:
             print(f"키워드 추출 오류: {e}")
             return []
 
-    def extract_from_multiple(self, texts: list, top_n: int = 10) -> dict:
+    def extract_batch(self, texts: list, top_n: int = 10) -> list:
         """
-        여러 텍스트에서 키워드 추출
+        여러 텍스트에서 문서별 키워드 추출 (extract와 같은 기준)
+        전체 문서에 대해 카운트 행렬을 한 번만 만들고 희소 행 단위로 점수 계산
         """
+        if not texts:
+            return []
+
+        model = self.corpus_model()
+        if model is not None:
+            matrix, terms = model.transform(texts)
+            if not terms:
+                return [[] for _ in texts]
+            return self._top_terms(matrix, terms, top_n)
+
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
-            feature_names = self.vectorizer.get_feature_names_out()
+            vectorizer = CountVectorizer(ngram_range=self.ngram_range)
+            counts = vectorizer.fit_transform(texts).tocsr()
+        except ValueError:
+            # 모든 문서가 비어 있어 어휘를 만들 수 없는 경우
+            return [[] for _ in texts]
+
+        counts.sort_indices()
+        feature_names = vectorizer.get_feature_names_out()
+        results = []
+
+        for row in range(counts.shape[0]):
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            indices = counts.indices[start:end]
+            data = counts.data[start:end].astype(np.float64)
 
-            result = {}
-            for idx, text in enumerate(texts):
-                scores = tfidf_matrix[idx].toarray()[0]
-                keyword_scores = [(feature_names[i], scores[i])
-                                for i in range(len(scores)) if scores[i] > 0]
-                keyword_scores.sort(key=lambda x: x[1], reverse=True)
-                result[idx] = keyword_scores[:top_n]
+            # 단일 문서 TF-IDF는 IDF가 모두 1이므로 빈도 상위 max_features개의 L2 정규화 TF와 같음
+            if len(data) > self.max_features:
+                keep = np.sort(np.argsort(-data, kind='stable')[:self.max_features])
+                indices, data = indices[keep], data[keep]
 
-            return result
+            if len(data) == 0:
+                results.append([])
+                continue
+
+            scores = data / np.linalg.norm(data)
+            order = np.argsort(-scores, kind='stable')[:top_n]
+            results.append([(feature_names[indices[i]], scores[i]) for i in order])
+
+        return results
+
+    def extract_from_multiple(self, texts: list, top_n: int = 10, chunk_size: int = 5000) -> dict:
+        """
+        여러 텍스트에서 키워드 추출 (대량 백필용)
+        - 코퍼스 IDF 모델이 있으면 chunk_size개씩 나눠 변환 (메모리는 청크의 비영 원소 수에 비례)
+        - 없으면 전체 텍스트로 IDF를 학습해 문서 간 IDF를 반영
+        반환: {문서 인덱스: [(용어, 점수), ...]}
+        """
+        try:
+            model = self.corpus_model()
+            if model is not None:
+                result = {}
+                for offset in range(0, len(texts), chunk_size):
+                    matrix, terms = model.transform(texts[offset:offset + chunk_size])
+                    for row, keywords in enumerate(self._top_terms(matrix, terms, top_n)):
+                        result[offset + row] = keywords
+                return result
+
+            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            feature_names = self.vectorizer.get_feature_names_out()
+            return dict(enumerate(self._top_terms(tfidf_matrix, feature_names, top_n)))
         except Exception as e:
             print(f"키워드 추출 오류: {e}")
             return {}
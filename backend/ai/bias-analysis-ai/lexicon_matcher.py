@@ -0,0 +1,142 @@
+"""
+FANS 사전(lexicon) 매칭 엔진
+여러 키워드 사전을 하나의 Aho-Corasick 오토마톤으로 컴파일하여
+텍스트를 한 번만 훑으면서 모든 사전의 키워드 출현 위치를 찾는다.
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class LexiconHits:
+    """사전별 매칭 결과 (출현 위치와 횟수)"""
+
+    def __init__(self, positions: Optional[Dict[str, List[Tuple[int, int, str]]]] = None):
+        # 사전 이름 -> [(시작, 끝, 키워드), ...] (시작 위치 오름차순)
+        self.positions = positions or {}
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """사전별 전체 출현 횟수"""
+        return {name: len(hits) for name, hits in self.positions.items()}
+
+    def count(self, lexicon: str) -> int:
+        """사전의 전체 출현 횟수"""
+        return len(self.positions.get(lexicon, ()))
+
+    def keywords(self, lexicon: str) -> Set[str]:
+        """사전에서 한 번 이상 등장한 키워드 집합"""
+        return {keyword for _, _, keyword in self.positions.get(lexicon, ())}
+
+    def distinct_count(self, lexicon: str) -> int:
+        """사전에서 등장한 서로 다른 키워드 수"""
+        return len(self.keywords(lexicon))
+
+    def within(self, start: int, end: int) -> 'LexiconHits':
+        """[start, end) 구간에 완전히 포함되는 매칭만 남긴 결과"""
+        return LexiconHits({
+            name: [hit for hit in hits if hit[0] >= start and hit[1] <= end]
+            for name, hits in self.positions.items()
+        })
+
+    def partition(self, spans: List[Tuple[int, int]]) -> List['LexiconHits']:
+        """
+        정렬된 구간 목록 [(시작, 끝), ...]에 매칭을 한 번에 분배
+        구간 경계를 걸치는 매칭은 버린다.
+        """
+        starts = [start for start, _ in spans]
+        parts = [LexiconHits({name: [] for name in self.positions}) for _ in spans]
+
+        for name, hits in self.positions.items():
+            for hit in hits:
+                idx = bisect_right(starts, hit[0]) - 1
+                if idx >= 0 and hit[1] <= spans[idx][1]:
+                    parts[idx].positions[name].append(hit)
+
+        return parts
+
+
+class LexiconMatcher:
+    """여러 사전을 컴파일한 Aho-Corasick 다중 패턴 매처"""
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]], ignore_case: bool = False):
+        """
+        Args:
+            lexicons: 사전 이름 -> 키워드 목록
+            ignore_case: True면 키워드와 텍스트를 소문자로 비교
+        """
+        self.ignore_case = ignore_case
+        self.lexicon_names = list(lexicons.keys())
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str, int]]] = [[]]
+
+        for name, keywords in lexicons.items():
+            for keyword in keywords:
+                self._add(name, keyword)
+        self._build_failure_links()
+
+    def _add(self, lexicon: str, keyword: str):
+        """트라이에 키워드 추가"""
+        pattern = keyword.lower() if self.ignore_case else keyword
+        if not pattern:
+            return
+
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        entry = (lexicon, keyword, len(pattern))
+        if entry not in self._output[state]:
+            self._output[state].append(entry)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크를 만들고 출력 집합을 병합"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def scan(self, text: str) -> LexiconHits:
+        """
+        텍스트를 한 번 훑어 모든 사전의 매칭 위치를 반환
+        """
+        positions = {name: [] for name in self.lexicon_names}
+        if not text:
+            return LexiconHits(positions)
+
+        haystack = text.lower() if self.ignore_case else text
+        goto, fail, output = self._goto, self._fail, self._output
+
+        state = 0
+        for idx, ch in enumerate(haystack):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for lexicon, keyword, length in output[state]:
+                positions[lexicon].append((idx - length + 1, idx + 1, keyword))
+
+        for hits in positions.values():
+            hits.sort()
+
+        return LexiconHits(positions)
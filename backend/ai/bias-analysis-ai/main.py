@@ -3,16 +3,20 @@ FANS 편향성 분석 AI 서비스
 - 감성 분석, 키워드 추출, 정치 분석 통합
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+import asyncio
 import logging
+import os
 from datetime import datetime
 
-from sentiment_analyzer import SentimentAnalyzer
-from keyword_extractor import KeywordExtractor
-from political_analyzer import PoliticalAnalyzer
+import analysis_tasks
+from analysis_executor import AnalysisExecutor, ExecutorBusyError
+from result_cache import ResultCache, make_cache_key
+from idf_model import DEFAULT_MODEL_DIR, CurrentVersionCache, IdfUpdater
+from sentence_classifier import ModelUnavailableError
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,14 +34,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-sentiment_analyzer = SentimentAnalyzer()
-keyword_extractor = KeywordExtractor()
-political_analyzer = PoliticalAnalyzer()
+# 분석기는 워커 프로세스마다 한 번씩 로드 (analysis_tasks 참고)
+executor = AnalysisExecutor()
+
+# 같은 본문 재분석 방지용 결과 캐시
+result_cache = ResultCache(
+    max_entries=int(os.getenv("RESULT_CACHE_SIZE", 2048)),
+    db_path=os.getenv("RESULT_CACHE_DB")
+)
+
+# 코퍼스 IDF 모델: 새로 분석한 기사로 백그라운드 갱신 (워커는 새 버전을 자동으로 다시 로드)
+IDF_MODEL_DIR = os.getenv("IDF_MODEL_DIR", DEFAULT_MODEL_DIR)
+# 조회용 IDF 모델 버전 (CURRENT 파일이 바뀔 때만 다시 읽음)
+idf_current_version = CurrentVersionCache(IDF_MODEL_DIR)
+IDF_AUTO_UPDATE = os.getenv("IDF_AUTO_UPDATE", "true").lower() == "true"
+idf_updater = IdfUpdater(
+    model_dir=IDF_MODEL_DIR,
+    flush_docs=int(os.getenv("IDF_FLUSH_DOCS", 500)),
+    flush_interval=float(os.getenv("IDF_FLUSH_INTERVAL", 600))
+)
+
+# 배치 요청 한 번에 받을 최대 기사 수
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", 500))
 
 class AnalysisRequest(BaseModel):
     text: str
     article_id: Optional[int] = None
 
+class BatchAnalysisRequest(BaseModel):
+    articles: List[AnalysisRequest]
+
+class IdfUpdateRequest(BaseModel):
+    texts: List[str]
+
 class SentimentResponse(BaseModel):
     sentiment: str
     confidence: float
@@ -59,9 +88,121 @@ class FullAnalysisResponse(BaseModel):
     political: Optional[PoliticalResponse]
     processed_at: str
 
+def check_batch_size(request: BatchAnalysisRequest):
+    if len(request.articles) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"배치 크기 초과: {len(request.articles)} > {MAX_BATCH_SIZE}"
+        )
+
+async def run_analysis(fn, *args):
+    """분석 작업을 워커 풀에서 실행 (대기열 초과 시 503)"""
+    try:
+        return await executor.submit(fn, *args)
+    except ExecutorBusyError as e:
+        logger.warning(f"분석 요청 거절: {e}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ModelUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+# 워커가 마지막으로 보고한 문장 분류 모델 버전 (모델 파일은 워커 프로세스에서만 로드)
+worker_model_versions: Dict[str, Optional[str]] = {"sentence_model": None}
+
+def uses_idf(kind: str) -> bool:
+    return kind.startswith(("keywords", "full"))
+
+def uses_sentence_model(kind: str) -> bool:
+    return kind.startswith("sentence_types")
+
+def analysis_version(kind: str, versions: Dict[str, Optional[str]]) -> str:
+    """캐시 키용 버전 (키워드 결과는 IDF 모델, 문장 유형 결과는 분류 모델 버전도 반영)"""
+    version = analysis_tasks.ANALYZER_VERSION
+    if uses_idf(kind):
+        version += f"/{versions.get('idf')}"
+    if uses_sentence_model(kind):
+        version += f"/{versions.get('sentence_model')}"
+    return version
+
+def lookup_version(kind: str) -> Optional[str]:
+    """
+    조회용 버전: 최신 IDF 모델(CURRENT), 워커가 보고한 문장 분류 모델 기준
+    문장 분류 모델 버전을 아직 모르면 None (캐시 조회 생략)
+    """
+    if uses_sentence_model(kind) and worker_model_versions["sentence_model"] is None:
+        return None
+    return analysis_version(kind, {
+        "idf": idf_current_version.get() if uses_idf(kind) else None,
+        "sentence_model": worker_model_versions["sentence_model"]
+    })
+
+def remember_worker_versions(versions: Dict[str, Optional[str]]):
+    if versions.get("sentence_model") is not None:
+        worker_model_versions["sentence_model"] = versions["sentence_model"]
+
+def update_idf(texts: List[str]):
+    try:
+        idf_updater.add(texts)
+    except Exception as e:
+        logger.error(f"IDF 모델 갱신 실패: {e}")
+
+def feed_idf(kind: str, texts: List[str]):
+    """
+    처음 분석한 기사를 IDF 모델 갱신에 사용 (이벤트 루프 밖 스레드에서)
+    캐시에서 밀려나 다시 분석된 기사는 IdfUpdater가 본문 해시로 걸러 중복 집계하지 않음
+    """
+    if IDF_AUTO_UPDATE and texts and uses_idf(kind):
+        asyncio.get_running_loop().run_in_executor(None, update_idf, texts)
+
+async def cached_analysis(kind: str, text: str, fn, *args):
+    """캐시에 없을 때만 분석 작업 실행"""
+    version = lookup_version(kind)
+    result = await result_cache.aget(make_cache_key(kind, text, version)) if version is not None else None
+    if result is None:
+        versions, result = await run_analysis(analysis_tasks.run_versioned, fn, text, *args)
+        remember_worker_versions(versions)
+        # 워커가 아직 이전 모델을 쓰고 있었다면 그 버전 키로 저장 (새 버전 키를 오염시키지 않음)
+        result_cache.put(make_cache_key(kind, text, analysis_version(kind, versions)), result)
+        feed_idf(kind, [text])
+    return result
+
+async def cached_batch_analysis(kind: str, texts: List[str], batch_fn, make_args) -> list:
+    """
+    배치 중 캐시에 없는 기사만 모아 한 번에 분석
+    make_args(miss_indices)는 batch_fn에 넘길 인자 튜플을 반환
+    """
+    version = lookup_version(kind)
+    if version is not None:
+        results = await result_cache.aget_many([make_cache_key(kind, text, version) for text in texts])
+    else:
+        results = [None] * len(texts)
+    misses = [i for i, result in enumerate(results) if result is None]
+
+    if misses:
+        versions, computed = await run_analysis(analysis_tasks.run_versioned, batch_fn, *make_args(misses))
+        remember_worker_versions(versions)
+        computed_version = analysis_version(kind, versions)
+        for i, result in zip(misses, computed):
+            result_cache.put(make_cache_key(kind, texts[i], computed_version), result)
+            results[i] = result
+        feed_idf(kind, [texts[i] for i in misses])
+
+    return results
+
+def with_request_fields(result: dict, article_id: Optional[int]) -> dict:
+    """캐시된 전체 분석 결과에 요청별 필드 적용"""
+    return {**result, "article_id": article_id, "processed_at": datetime.now().isoformat()}
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("FANS Bias Analysis AI v2.0 시작")
+    executor.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    executor.shutdown()
+    result_cache.close()
+    if IDF_AUTO_UPDATE:
+        idf_updater.flush()
 
 @app.get("/")
 def read_root():
@@ -69,21 +210,33 @@ def read_root():
         "service": "FANS Bias Analysis AI",
         "version": "2.0.0",
         "status": "running",
-        "features": ["sentiment", "keywords", "political_bias"]
+        "features": ["sentiment", "keywords", "political_bias", "sentence_types", "batch"]
     }
 
 @app.get("/health")
 def health_check():
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "executor": executor.stats()
+    }
+
+@app.get("/cache/stats")
+def cache_stats():
+    """결과 캐시 적중/미스/제거 통계"""
+    return {
+        "analyzer_version": analysis_tasks.ANALYZER_VERSION,
+        "sentence_model_version": worker_model_versions["sentence_model"],
+        **result_cache.stats()
     }
 
 @app.post("/analyze/sentiment")
 async def analyze_sentiment(request: AnalysisRequest):
     try:
-        result = sentiment_analyzer.analyze(request.text)
+        result = await cached_analysis("sentiment", request.text, analysis_tasks.run_sentiment)
         return SentimentResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"감성 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -91,8 +244,10 @@ async def analyze_sentiment(request: AnalysisRequest):
 @app.post("/analyze/keywords")
 async def analyze_keywords(request: AnalysisRequest):
     try:
-        keywords = keyword_extractor.extract(request.text, top_n=10)
-        return {"keywords": [{"word": k, "score": float(s)} for k, s in keywords]}
+        keywords = await cached_analysis("keywords:10", request.text, analysis_tasks.run_keywords, 10)
+        return {"keywords": keywords}
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"키워드 추출 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -100,16 +255,9 @@ async def analyze_keywords(request: AnalysisRequest):
 @app.post("/analyze/political")
 async def analyze_political(request: AnalysisRequest):
     try:
-        party_analysis = political_analyzer.analyze_party_mentions(request.text)
-        bias = political_analyzer.calculate_bias_score(request.text)
-
-        return {
-            "party_analysis": party_analysis,
-            "bias_score": bias['bias_score'],
-            "stance": bias['stance'],
-            "ruling_sentiment": bias['ruling_sentiment'],
-            "opposition_sentiment": bias['opposition_sentiment']
-        }
+        return await cached_analysis("political", request.text, analysis_tasks.run_political)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"정치 분석 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -117,38 +265,137 @@ async def analyze_political(request: AnalysisRequest):
 @app.post("/analyze/full")
 async def analyze_full(request: AnalysisRequest):
     try:
-        sentiment = sentiment_analyzer.analyze(request.text)
-        keywords = keyword_extractor.extract(request.text, top_n=10)
-
-        party_analysis = political_analyzer.analyze_party_mentions(request.text)
-        political_result = None
-        bias_score = 0.0
-        stance = "중립"
-
-        if party_analysis:
-            bias = political_analyzer.calculate_bias_score(request.text)
-            bias_score = bias['bias_score']
-            stance = bias['stance']
-            political_result = {
-                "party_analysis": party_analysis,
-                "bias_score": bias_score,
-                "stance": stance
-            }
+        result = await cached_analysis("full", request.text, analysis_tasks.run_full)
+        return with_request_fields(result, request.article_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"전체 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/sentence-types")
+async def analyze_sentence_types(request: AnalysisRequest):
+    """문장별 유형(사실/추론/예측/대화) 및 편향 라벨 분류"""
+    try:
+        result = await cached_analysis("sentence_types", request.text, analysis_tasks.run_sentence_types)
+        return {"article_id": request.article_id, **result}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"문장 유형 분류 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/sentiment/batch")
+async def analyze_sentiment_batch(request: BatchAnalysisRequest):
+    check_batch_size(request)
+    try:
+        texts = [a.text for a in request.articles]
+        results = await cached_batch_analysis(
+            "sentiment", texts, analysis_tasks.run_sentiment_batch,
+            lambda misses: ([texts[i] for i in misses],)
+        )
+        return {
+            "count": len(results),
+            "results": [SentimentResponse(**r) for r in results]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 감성 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/analyze/keywords/batch")
+async def analyze_keywords_batch(request: BatchAnalysisRequest):
+    check_batch_size(request)
+    try:
+        texts = [a.text for a in request.articles]
+        keywords_list = await cached_batch_analysis(
+            "keywords:10", texts, analysis_tasks.run_keywords_batch,
+            lambda misses: ([texts[i] for i in misses], 10)
+        )
         return {
-            "article_id": request.article_id,
-            "sentiment": sentiment,
-            "keywords": [{"word": k, "score": float(s)} for k, s in keywords],
-            "political": political_result,
-            "bias_score": bias_score,
-            "political_leaning": stance,
-            "confidence": sentiment.get('confidence', 0.0),
-            "processed_at": datetime.now().isoformat()
+            "count": len(keywords_list),
+            "results": [{"keywords": k} for k in keywords_list]
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"전체 분석 오류: {e}")
+        logger.error(f"일괄 키워드 추출 오류: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/analyze/political/batch")
+async def analyze_political_batch(request: BatchAnalysisRequest):
+    check_batch_size(request)
+    try:
+        texts = [a.text for a in request.articles]
+        results = await cached_batch_analysis(
+            "political", texts, analysis_tasks.run_political_batch,
+            lambda misses: ([texts[i] for i in misses],)
+        )
+        return {"count": len(results), "results": results}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 정치 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/full/batch")
+async def analyze_full_batch(request: BatchAnalysisRequest):
+    """여러 기사 전체 분석 (키워드 행렬/감성 점수를 기사 전체에 대해 한 번에 계산)"""
+    check_batch_size(request)
+    try:
+        texts = [a.text for a in request.articles]
+        results = await cached_batch_analysis(
+            "full", texts, analysis_tasks.run_full_batch,
+            lambda misses: ([(texts[i], None) for i in misses],)
+        )
+        results = [
+            with_request_fields(result, article.article_id)
+            for article, result in zip(request.articles, results)
+        ]
+        return {"count": len(results), "results": results}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 전체 분석 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/analyze/sentence-types/batch")
+async def analyze_sentence_types_batch(request: BatchAnalysisRequest):
+    check_batch_size(request)
+    try:
+        texts = [a.text for a in request.articles]
+        results = await cached_batch_analysis(
+            "sentence_types", texts, analysis_tasks.run_sentence_types_batch,
+            lambda misses: ([texts[i] for i in misses],)
+        )
+        results = [
+            {"article_id": article.article_id, **result}
+            for article, result in zip(request.articles, results)
+        ]
+        return {"count": len(results), "results": results}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 문장 유형 분류 오류: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/keywords/idf/update")
+async def update_idf_model(request: IdfUpdateRequest, background_tasks: BackgroundTasks):
+    """기사 본문으로 코퍼스 IDF 모델 갱신 (백그라운드)"""
+    background_tasks.add_task(update_idf, request.texts)
+    return {"accepted": len(request.texts)}
+
+@app.post("/keywords/idf/flush")
+def flush_idf_model():
+    """대기 중인 IDF 갱신을 즉시 새 버전으로 저장"""
+    idf_updater.flush()
+    return idf_updater.stats()
+
+@app.get("/keywords/idf/stats")
+def idf_model_stats():
+    return idf_updater.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8002)
\ No newline at end of file
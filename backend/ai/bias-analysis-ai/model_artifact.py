@@ -0,0 +1,294 @@
+"""
+FANS 분류 모델 아티팩트
+pickle로 저장한 TfidfVectorizer + 선형 분류기를 배열 파일로 내보내고,
+메모리 매핑으로 읽어 예측 전용 객체를 만든다.
+(pickle 역직렬화 없이 로드, 워커 프로세스끼리 페이지 공유)
+
+저장 형식 (artifact_dir/v{버전}/)
+- vocab_hashes.npy: 어휘 용어 해시(uint64, 오름차순)
+- vocab_columns.npy: 해시와 같은 순서의 특징 열 번호(int64)
+- idf.npy: 특징별 IDF (use_idf=False면 없음)
+- coef.npy / intercept.npy: 선형 결정 함수 계수 (클래스 수 x 특징 수)
+- metadata.json: 벡터라이저 설정, 클래스, 확률 계산 방식, 파일별 sha256
+artifact_dir/CURRENT 파일이 현재 버전을 가리킨다 (idf_model과 같은 방식).
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.special import expit, softmax
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+from idf_model import current_version, hash_terms, lookup_hashes, publish_version
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
+ARTIFACT_DIR = os.path.join(MODEL_DIR, "artifacts")
+FORMAT_VERSION = 1
+
+# 변환 시 그대로 재현하는 벡터라이저 설정
+VECTORIZER_PARAMS = ['lowercase', 'strip_accents', 'token_pattern', 'ngram_range', 'stop_words']
+
+# 선형 분류기별 확률 계산 방식
+PROBA_SOFTMAX = 'softmax'      # 다항 로지스틱 회귀, MultinomialNB (결합 로그 우도)
+PROBA_OVR = 'ovr'              # one-vs-rest 로지스틱 회귀 (시그모이드 후 정규화)
+PROBA_BINARY = 'binary'        # 이진 로지스틱 회귀 (결정 함수 1열)
+
+
+class ArtifactError(Exception):
+    """아티팩트로 내보내거나 읽을 수 없음"""
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _linear_params(model):
+    """분류기에서 (coef, intercept, 확률 방식) 추출"""
+    name = type(model).__name__
+
+    if name == 'MultinomialNB':
+        # 결합 로그 우도 = X @ feature_log_prob_.T + class_log_prior_
+        return model.feature_log_prob_, model.class_log_prior_, PROBA_SOFTMAX
+
+    if name == 'LogisticRegression':
+        coef, intercept = model.coef_, model.intercept_
+        multi_class = getattr(model, 'multi_class', 'auto')
+        ovr = multi_class in ('ovr', 'warn') or (
+            multi_class == 'auto' and (len(model.classes_) <= 2 or model.solver == 'liblinear')
+        )
+        if coef.shape[0] == 1:
+            if ovr:
+                return coef, intercept, PROBA_BINARY
+            # 다항 이진 분류: sklearn은 [-d, d]에 softmax 적용
+            return np.vstack([-coef, coef]), np.concatenate([-intercept, intercept]), PROBA_SOFTMAX
+        return coef, intercept, PROBA_OVR if ovr else PROBA_SOFTMAX
+
+    raise ArtifactError(f"선형 모델이 아니어서 아티팩트로 내보낼 수 없습니다: {name}")
+
+
+def export_artifact(vectorizer, model, artifact_dir: str, name: Optional[str] = None) -> str:
+    """
+    학습된 벡터라이저 + 분류기를 새 아티팩트 버전으로 저장
+    Returns:
+        저장한 버전 이름
+    """
+    if getattr(vectorizer, 'analyzer', 'word') != 'word' or vectorizer.tokenizer or vectorizer.preprocessor:
+        raise ArtifactError("사용자 정의 analyzer/tokenizer/preprocessor는 지원하지 않습니다")
+    if vectorizer.stop_words is not None and not isinstance(vectorizer.stop_words, (list, tuple, set, frozenset)):
+        raise ArtifactError("불용어는 목록으로만 지원합니다")
+
+    coef, intercept, proba = _linear_params(model)
+
+    terms = list(vectorizer.vocabulary_)
+    columns = np.fromiter((vectorizer.vocabulary_[t] for t in terms), dtype=np.int64, count=len(terms))
+    hashes = hash_terms(terms)
+    order = np.argsort(hashes, kind='stable')
+    hashes, columns = hashes[order], columns[order]
+    if len(hashes) > 1 and np.any(hashes[1:] == hashes[:-1]):
+        raise ArtifactError("어휘 해시 충돌이 있어 내보낼 수 없습니다")
+
+    use_idf = bool(getattr(vectorizer, 'use_idf', False))
+    version = f"v{int(time.time() * 1000)}"
+    version_dir = os.path.join(artifact_dir, version)
+    os.makedirs(version_dir, exist_ok=True)
+
+    arrays = {
+        'vocab_hashes.npy': hashes,
+        'vocab_columns.npy': columns,
+        'coef.npy': np.ascontiguousarray(coef, dtype=np.float64),
+        'intercept.npy': np.asarray(intercept, dtype=np.float64)
+    }
+    if use_idf:
+        arrays['idf.npy'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    for filename, array in arrays.items():
+        np.save(os.path.join(version_dir, filename), array)
+
+    stop_words = vectorizer.stop_words
+    metadata = {
+        'format_version': FORMAT_VERSION,
+        'name': name or os.path.basename(os.path.normpath(artifact_dir)),
+        'model_type': type(model).__name__,
+        'vectorizer_type': type(vectorizer).__name__,
+        'vectorizer': {
+            'lowercase': vectorizer.lowercase,
+            'strip_accents': vectorizer.strip_accents,
+            'token_pattern': vectorizer.token_pattern,
+            'ngram_range': list(vectorizer.ngram_range),
+            'stop_words': sorted(stop_words) if stop_words is not None else None,
+            'binary': bool(getattr(vectorizer, 'binary', False)),
+            'sublinear_tf': bool(getattr(vectorizer, 'sublinear_tf', False)),
+            'use_idf': use_idf,
+            'norm': getattr(vectorizer, 'norm', None)
+        },
+        'classes': [c.item() if hasattr(c, 'item') else c for c in model.classes_],
+        'proba': proba,
+        'n_features': int(coef.shape[1]),
+        'n_terms': len(terms),
+        'created_at': datetime.now().isoformat(),
+        'checksums': {
+            filename: file_sha256(os.path.join(version_dir, filename)) for filename in arrays
+        }
+    }
+    with open(os.path.join(version_dir, "metadata.json"), 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+
+    publish_version(artifact_dir, version)
+    logger.info(f"모델 아티팩트 저장: {version_dir} (특징 {coef.shape[1]:,}개, 클래스 {len(model.classes_)}개)")
+    return version
+
+
+class LinearArtifactModel:
+    """아티팩트에서 복원한 예측 전용 TF-IDF + 선형 분류기"""
+
+    def __init__(self, metadata: dict, arrays: dict, version: str):
+        self.metadata = metadata
+        self.version = version
+        self.name = metadata['name']
+        self.classes = np.asarray(metadata['classes'])
+        self.proba_mode = metadata['proba']
+
+        params = metadata['vectorizer']
+        self.binary = params['binary']
+        self.sublinear_tf = params['sublinear_tf']
+        self.norm = params['norm']
+        self.analyzer = CountVectorizer(
+            **{key: params[key] for key in VECTORIZER_PARAMS if key != 'ngram_range'},
+            ngram_range=tuple(params['ngram_range'])
+        ).build_analyzer()
+
+        self.vocab_hashes = arrays['vocab_hashes.npy']
+        self.vocab_columns = arrays['vocab_columns.npy']
+        self.idf = arrays.get('idf.npy')
+        self.coef = arrays['coef.npy']
+        self.intercept = arrays['intercept.npy']
+        self.n_features = int(metadata['n_features'])
+
+    def transform(self, texts: List[str]) -> csr_matrix:
+        """학습 때 벡터라이저와 같은 TF-IDF 희소 행렬 (용어 해시는 배치 내 고유 용어당 한 번)"""
+        vocabulary = {}
+        indptr, indices, counts = [0], [], []
+
+        for text in texts:
+            for term, count in Counter(self.analyzer(text or "")).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        found, pos = lookup_hashes(self.vocab_hashes, hash_terms(list(vocabulary)))
+        local_to_column = np.where(found, self.vocab_columns[pos], -1)
+        columns = local_to_column[np.asarray(indices, dtype=np.int64)]
+        data = np.asarray(counts, dtype=np.float64)
+
+        # 어휘에 없는 용어 제거
+        known = columns >= 0
+        row_ids = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        matrix = csr_matrix(
+            (data[known], (row_ids[known], columns[known])),
+            shape=(len(texts), self.n_features)
+        )
+        matrix.sum_duplicates()
+
+        if self.binary:
+            matrix.data[:] = 1.0
+        if self.sublinear_tf:
+            np.log(matrix.data, out=matrix.data)
+            matrix.data += 1.0
+        if self.idf is not None:
+            matrix.data *= self.idf[matrix.indices]
+        if self.norm:
+            matrix = normalize(matrix, norm=self.norm, copy=False)
+        return matrix
+
+    def decision_function(self, X) -> np.ndarray:
+        return np.asarray(X @ self.coef.T) + self.intercept
+
+    def predict_proba(self, sentences: List[str]) -> np.ndarray:
+        """문장 전체를 변환하고 희소 행렬 곱 한 번으로 클래스 확률 계산"""
+        if not sentences:
+            return np.zeros((0, len(self.classes)))
+        scores = self.decision_function(self.transform(sentences))
+
+        if self.proba_mode == PROBA_SOFTMAX:
+            return softmax(scores, axis=1)
+        if self.proba_mode == PROBA_BINARY:
+            positive = expit(scores[:, 0])
+            return np.column_stack([1 - positive, positive])
+        proba = expit(scores)
+        proba /= proba.sum(axis=1, keepdims=True)
+        return proba
+
+
+def load_artifact(artifact_dir: str, mmap: bool = True, verify: bool = True) -> Optional[LinearArtifactModel]:
+    """
+    현재 버전 아티팩트 로드 (없으면 None)
+    verify=True면 파일 sha256을 metadata.json과 비교
+    """
+    version = current_version(artifact_dir)
+    if version is None:
+        return None
+
+    version_dir = os.path.join(artifact_dir, version)
+    with open(os.path.join(version_dir, "metadata.json"), 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    if metadata.get('format_version') != FORMAT_VERSION:
+        raise ArtifactError(f"지원하지 않는 아티팩트 형식: {metadata.get('format_version')}")
+
+    arrays = {}
+    for filename, checksum in metadata['checksums'].items():
+        path = os.path.join(version_dir, filename)
+        if verify and file_sha256(path) != checksum:
+            raise ArtifactError(f"체크섬 불일치: {path}")
+        # allow_pickle=False: 숫자 배열만 허용
+        arrays[filename] = np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+
+    return LinearArtifactModel(metadata, arrays, version)
+
+
+# 서비스에서 사용하는 모델: (아티팩트 이름, 모델 pickle, 벡터라이저 pickle)
+SERVICE_MODELS = [
+    ('sentence_type', 'bias_model.pkl', 'vectorizer.pkl'),
+    ('combined_bias', 'combined_bias_model.pkl', 'combined_vectorizer.pkl'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pickle 모델을 메모리 매핑 아티팩트로 내보내기")
+    parser.add_argument("--model-dir", default=MODEL_DIR)
+    parser.add_argument("--artifact-dir", default=None, help="기본값: {model-dir}/artifacts")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    artifact_root = args.artifact_dir or os.path.join(args.model_dir, "artifacts")
+
+    for name, model_file, vectorizer_file in SERVICE_MODELS:
+        try:
+            with open(os.path.join(args.model_dir, vectorizer_file), 'rb') as f:
+                vectorizer = pickle.load(f)
+            with open(os.path.join(args.model_dir, model_file), 'rb') as f:
+                model = pickle.load(f)
+            version = export_artifact(vectorizer, model, os.path.join(artifact_root, name), name=name)
+            print(f"✅ {name} 아티팩트 저장 완료: {version}")
+        except Exception as e:
+            # 내보내지 못한 모델은 서비스에서 pickle로 로드
+            print(f"⚠️ {name} 아티팩트 생성 건너뜀: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ FANS 정치 분석 시스템
 """
 
 from sentiment_analyzer import SentimentAnalyzer
+from lexicon_matcher import LexiconMatcher
+from analysis_document import AnalysisDocument
+from typing import Optional, Union
 import re
 
 class PoliticalAnalyzer:
@@ -24,27 +27,43 @@ class PoliticalAnalyzer:
             '의원': ['의원', '국회의원']
         }
 
-    def analyze_party_mentions(self, text: str) -> dict:
+        # 감성 사전과 정당 사전을 하나의 오토마톤으로 컴파일
+        lexicons = dict(self.sentiment_analyzer.lexicons)
+        lexicons.update(self.party_keywords)
+        self.matcher = LexiconMatcher(lexicons)
+
+    def build_document(self, text: str) -> AnalysisDocument:
+        """요청 단위로 재사용할 분석 문서 생성"""
+        return AnalysisDocument(text, self.matcher, self.sentiment_analyzer)
+
+    def _as_document(self, source: Union[str, AnalysisDocument]) -> AnalysisDocument:
+        if isinstance(source, AnalysisDocument):
+            return source
+        return self.build_document(source)
+
+    def analyze_party_mentions(self, text: Union[str, AnalysisDocument]) -> dict:
         """
         정당별 언급 분석
+        text 대신 build_document()로 만든 문서를 넘기면 매칭/문장 감성을 재사용
         """
+        document = self._as_document(text)
         result = {}
 
         for party_name, keywords in self.party_keywords.items():
             mentions = []
-            sentences = text.split('.')
-
-            for sent in sentences:
-                for keyword in keywords:
-                    if keyword in sent:
-                        sentiment = self.sentiment_analyzer.analyze(sent)
-                        mentions.append({
-                            'sentence': sent.strip(),
-                            'keyword': keyword,
-                            'sentiment': sentiment['sentiment'],
-                            'score': sentiment['score']
-                        })
-                        break
+
+            for idx, hits in enumerate(document.sentence_hits):
+                found = hits.keywords(party_name)
+                if not found:
+                    continue
+                keyword = next(k for k in keywords if k in found)
+                sentiment = document.sentence_sentiment(idx)
+                mentions.append({
+                    'sentence': document.sentence(idx).strip(),
+                    'keyword': keyword,
+                    'sentiment': sentiment['sentiment'],
+                    'score': sentiment['score']
+                })
 
             if mentions:
                 avg_score = sum(m['score'] for m in mentions) / len(mentions)
@@ -63,12 +82,15 @@ class PoliticalAnalyzer:
 
         return result
 
-    def calculate_bias_score(self, text: str) -> dict:
+    def calculate_bias_score(self, text: Union[str, AnalysisDocument],
+                             party_analysis: Optional[dict] = None) -> dict:
         """
         편향성 점수 계산 (-10 ~ +10)
         음수: 진보 성향, 양수: 보수 성향
+        이미 계산한 party_analysis를 넘기면 정당 분석을 다시 하지 않음
         """
-        party_analysis = self.analyze_party_mentions(text)
+        if party_analysis is None:
+            party_analysis = self.analyze_party_mentions(text)
 
         if '여당' in party_analysis and '야당' in party_analysis:
             ruling_score = party_analysis['여당']['avg_score']
@@ -0,0 +1,244 @@
+"""
+FANS 분석 결과 캐시
+본문 해시 + 분석기 버전을 키로 하는 2단 캐시
+- 메모리: 크기 제한 LRU
+- 디스크: SQLite (선택, 재시작 후에도 유지)
+  쓰기는 백그라운드 스레드가 모아서 한 번에 커밋하고, 읽기는 aget_many로 이벤트 루프 밖에서 수행
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 디스크 쓰기 배치: 최대 항목 수 / 첫 항목 이후 최대 대기 시간(초)
+WRITE_BATCH_SIZE = 256
+WRITE_BATCH_WAIT = 0.2
+_STOP = object()
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 정규화 (유니코드 NFC만 적용)
+    문장 단위 결과는 입력 문장 문자열을 그대로 돌려주므로 공백이 다른 본문은 다른 키로 취급
+    """
+    return unicodedata.normalize('NFC', text or '')
+
+
+def make_cache_key(kind: str, text: str, version: str) -> str:
+    """분석 종류, 분석기 버전, 정규화 본문으로 캐시 키 생성"""
+    payload = f"{kind}\0{version}\0{normalize_text(text)}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """LRU 메모리 계층 + SQLite 디스크 계층 결과 캐시"""
+
+    def __init__(self, max_entries: int = 2048, db_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: 메모리에 보관할 최대 항목 수 (0이면 메모리 계층 비활성)
+            db_path: SQLite 파일 경로 (None/빈 문자열이면 디스크 계층 비활성)
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path or None
+
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 읽기용 연결 (쓰기는 _writer 스레드가 자기 연결로 수행)
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_writes = 0
+        # 디스크 항목 수 근사치 (시작할 때 한 번 세고 이후 쓰기 스레드가 새로 추가한 행만큼 더함)
+        self.disk_entries: Optional[int] = None
+
+        if self.db_path:
+            self._open_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _open_db(self):
+        try:
+            self._db = self._connect()
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._db.commit()
+            self._writer = threading.Thread(target=self._write_loop, name="analysis-cache-writer", daemon=True)
+            self._writer.start()
+            logger.info(f"분석 결과 디스크 캐시 사용: {self.db_path}")
+        except sqlite3.Error as e:
+            logger.error(f"디스크 캐시 열기 실패, 메모리 캐시만 사용: {e}")
+            self._db = None
+
+    def _write_loop(self):
+        """대기 중인 쓰기를 모아 executemany + 커밋 한 번으로 저장"""
+        conn = self._connect()
+        try:
+            self.disk_entries = conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"디스크 캐시 항목 수 확인 실패: {e}")
+        stopping = False
+        while not stopping:
+            batch = [self._writes.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WAIT
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            stopping = len(rows) < len(batch)
+            if not rows:
+                continue
+            try:
+                keys = list({key for key, _, _ in rows})
+                existing = conn.execute(
+                    f"SELECT COUNT(*) FROM analysis_cache WHERE key IN ({','.join('?' * len(keys))})", keys
+                ).fetchone()[0]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO analysis_cache (key, value, created_at) VALUES (?, ?, ?)", rows
+                )
+                conn.commit()
+                self.disk_writes += len(rows)
+                if self.disk_entries is not None:
+                    self.disk_entries += len(keys) - existing
+            except sqlite3.Error as e:
+                logger.warning(f"디스크 캐시 저장 실패 ({len(rows)}건): {e}")
+        conn.close()
+
+    def _get_memory(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+            return None
+
+    def _get_disk_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """메모리에 없는 키들을 디스크에서 조회 (이벤트 루프 밖에서 호출)"""
+        values: List[Optional[Any]] = [None] * len(keys)
+        if self._db is not None and keys:
+            with self._db_lock:
+                for i, key in enumerate(keys):
+                    row = self._db.execute(
+                        "SELECT value FROM analysis_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        values[i] = json.loads(row[0])
+
+        with self._lock:
+            for key, value in zip(keys, values):
+                if value is None:
+                    self.misses += 1
+                else:
+                    self._remember(key, value)
+                    self.disk_hits += 1
+        return values
+
+    def get(self, key: str) -> Optional[Any]:
+        """동기 조회 (디스크 조회가 필요하면 호출 스레드가 기다림)"""
+        value = self._get_memory(key)
+        if value is not None:
+            return value
+        return self._get_disk_many([key])[0]
+
+    async def aget_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        여러 키 조회 (async 핸들러용)
+        메모리 계층은 바로 확인하고, 메모리에 없는 키만 모아 스레드에서 디스크 조회
+        """
+        values = [self._get_memory(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        if self._db is None:
+            with self._lock:
+                self.misses += len(missing)
+            return values
+
+        found = await asyncio.get_running_loop().run_in_executor(
+            None, self._get_disk_many, [keys[i] for i in missing]
+        )
+        for i, value in zip(missing, found):
+            values[i] = value
+        return values
+
+    async def aget(self, key: str) -> Optional[Any]:
+        return (await self.aget_many([key]))[0]
+
+    def put(self, key: str, value: Any):
+        """메모리에 저장하고 디스크 쓰기는 백그라운드 스레드에 맡김 (블로킹 없음)"""
+        with self._lock:
+            self._remember(key, value)
+
+        if self._writer is not None:
+            self._writes.put((key, json.dumps(value, ensure_ascii=False), time.time()))
+
+    def _remember(self, key: str, value: Any):
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """카운터만 복사 (디스크 항목 수는 쓰기 스레드가 유지하는 근사치, DB 조회 없음)"""
+        with self._lock:
+            memory_entries = len(self._memory)
+            memory_hits, disk_hits, misses = self.memory_hits, self.disk_hits, self.misses
+            evictions = self.evictions
+
+        lookups = memory_hits + disk_hits + misses
+        return {
+            "memory_entries": memory_entries,
+            "max_entries": self.max_entries,
+            "disk_enabled": self._db is not None,
+            "disk_entries": self.disk_entries if self._db is not None else None,
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "evictions": evictions,
+            "disk_writes": self.disk_writes,
+            "pending_writes": self._writes.qsize(),
+            "hit_rate": round((memory_hits + disk_hits) / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self):
+        """대기 중인 쓰기를 모두 저장한 뒤 닫음"""
+        if self._writer is not None:
+            self._writes.put(_STOP)
+            self._writer.join(timeout=10)
+            self._writer = None
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,213 @@
+"""
+FANS 문장 유형 / 편향 라벨 분류기
+train_model.py, train_combined_model.py로 학습한 모델을 한 번만 로드하고
+기사 문장 전체를 한 번의 희소 변환 + 예측으로 분류한다.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+from collections import Counter
+from typing import List, Optional
+
+import numpy as np
+
+from model_artifact import file_sha256, load_artifact
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
+
+SENTENCE_TYPES = ['사실형', '추론형', '예측형', '대화형']
+# 138번 무해성 데이터에서 파생한 편향 라벨 (train_combined_model.map_to_bias_label)
+BIAS_LABELS = ['혐오형', '정치편향형', '지역편향형', '차별형', '편향형', '중립형']
+NEUTRAL_LABEL = '중립형'
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+|\n+')
+MIN_SENTENCE_LENGTH = 5
+
+
+class ModelUnavailableError(Exception):
+    """분류 모델을 로드하지 못함"""
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 분리 (너무 짧은 조각은 제외)"""
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(text or "")]
+    return [s for s in sentences if len(s) >= MIN_SENTENCE_LENGTH]
+
+
+class TextClassifier:
+    """벡터라이저 + 분류기 한 쌍"""
+
+    def __init__(self, name: str, vectorizer, model, version: str = "unversioned"):
+        self.name = name
+        self.vectorizer = vectorizer
+        self.model = model
+        self.version = version
+        self.classes = np.asarray(model.classes_)
+
+    @classmethod
+    def from_pickles(cls, name: str, model_path: str, vectorizer_path: str) -> 'TextClassifier':
+        with open(vectorizer_path, 'rb') as f:
+            vectorizer = pickle.load(f)
+        with open(model_path, 'rb') as f:
+            model = pickle.load(f)
+        # pickle 파일 내용 해시 (재학습하거나 파일을 바꾸면 버전이 바뀜)
+        digest = hashlib.sha256(
+            f"{file_sha256(model_path)}:{file_sha256(vectorizer_path)}".encode('ascii')
+        ).hexdigest()
+        return cls(name, vectorizer, model, version=f"pickle-{digest[:16]}")
+
+    def predict_proba(self, sentences: List[str]) -> np.ndarray:
+        """문장 전체를 한 번에 변환하고 클래스 확률 행렬 반환 (문장 수 x 클래스 수)"""
+        if not sentences:
+            return np.zeros((0, len(self.classes)))
+        X = self.vectorizer.transform(sentences)
+        return self.model.predict_proba(X)
+
+
+class SentenceClassifier:
+    """문장 유형(159번) + 편향 라벨(138번 통합 모델) 분류기"""
+
+    def __init__(self, model_dir: str = MODEL_DIR):
+        """
+        models/artifacts/{이름}/ 아티팩트가 있으면 메모리 매핑으로 로드하고,
+        없으면 기존 pickle 파일로 로드
+        """
+        self.model_dir = model_dir
+        self.type_model = self._load_electra() or self._load(
+            "sentence_type", "bias_model.pkl", "vectorizer.pkl"
+        )
+        self.combined_model = self._load(
+            "combined_bias", "combined_bias_model.pkl", "combined_vectorizer.pkl"
+        )
+
+    def _load_electra(self):
+        """ELECTRA_MODEL_DIR가 설정되면 파인튜닝한 KcELECTRA로 문장 유형 분류"""
+        model_dir = os.getenv("ELECTRA_MODEL_DIR")
+        if not model_dir:
+            return None
+        try:
+            from electra_inference import ElectraSentenceClassifier
+            return ElectraSentenceClassifier(model_dir, backend=os.getenv("ELECTRA_BACKEND") or None)
+        except Exception as e:
+            logger.error(f"KcELECTRA 문장 분류기 로드 실패, TF-IDF 모델 사용: {e}")
+            return None
+
+    def _load(self, name: str, model_file: str, vectorizer_file: str):
+        try:
+            artifact = load_artifact(os.path.join(self.model_dir, "artifacts", name))
+            if artifact is not None:
+                logger.info(f"문장 분류 모델 아티팩트 로드: {name} {artifact.version} (클래스 {len(artifact.classes)}개)")
+                return artifact
+        except Exception as e:
+            logger.error(f"문장 분류 모델 아티팩트 로드 실패 ({name}), pickle 사용: {e}")
+
+        try:
+            classifier = TextClassifier.from_pickles(
+                name,
+                os.path.join(self.model_dir, model_file),
+                os.path.join(self.model_dir, vectorizer_file)
+            )
+            logger.info(f"문장 분류 모델 로드: {name} (클래스 {len(classifier.classes)}개)")
+            return classifier
+        except Exception as e:
+            logger.error(f"문장 분류 모델 로드 실패 ({name}): {e}")
+            return None
+
+    @property
+    def available(self) -> bool:
+        return self.type_model is not None and self.combined_model is not None
+
+    @property
+    def version(self) -> Optional[str]:
+        """로드한 두 모델의 이름/버전 (결과 캐시 키에 사용, 모델이 없으면 None)"""
+        if not self.available:
+            return None
+        return "+".join(f"{m.name}:{m.version}" for m in (self.type_model, self.combined_model))
+
+    def classify_sentences(self, sentences: List[str]) -> List[dict]:
+        """문장 목록 분류 (모델별로 변환/예측 한 번씩)"""
+        if not self.available:
+            raise ModelUnavailableError("문장 분류 모델이 로드되지 않았습니다")
+
+        type_proba = self.type_model.predict_proba(sentences)
+        combined_proba = self.combined_model.predict_proba(sentences)
+
+        type_classes = self.type_model.classes
+        combined_classes = self.combined_model.classes
+        bias_columns = np.flatnonzero(np.isin(combined_classes, BIAS_LABELS))
+        biased_columns = np.flatnonzero(
+            np.isin(combined_classes, BIAS_LABELS) & (combined_classes != NEUTRAL_LABEL)
+        )
+
+        type_best = type_proba.argmax(axis=1)
+        combined_best = combined_proba.argmax(axis=1)
+        bias_best = bias_columns[combined_proba[:, bias_columns].argmax(axis=1)] if len(bias_columns) else None
+        bias_scores = combined_proba[:, biased_columns].sum(axis=1)
+
+        results = []
+        for i, sentence in enumerate(sentences):
+            result = {
+                'sentence': sentence,
+                'type': str(type_classes[type_best[i]]),
+                'type_confidence': float(type_proba[i, type_best[i]]),
+                'combined_label': str(combined_classes[combined_best[i]]),
+                'combined_confidence': float(combined_proba[i, combined_best[i]]),
+                'bias_label': None,
+                'bias_confidence': 0.0,
+                'bias_score': float(bias_scores[i])
+            }
+            if bias_best is not None:
+                result['bias_label'] = str(combined_classes[bias_best[i]])
+                result['bias_confidence'] = float(combined_proba[i, bias_best[i]])
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def summarize(sentence_results: List[dict]) -> dict:
+        """기사 단위 집계"""
+        total = len(sentence_results)
+        type_counts = Counter(r['type'] for r in sentence_results)
+        bias_counts = Counter(r['bias_label'] for r in sentence_results if r['bias_label'])
+
+        def ratio(count: int) -> float:
+            return round(count / total, 4) if total else 0.0
+
+        return {
+            'sentence_count': total,
+            'type_distribution': {t: type_counts.get(t, 0) for t in SENTENCE_TYPES},
+            'type_ratio': {t: ratio(type_counts.get(t, 0)) for t in SENTENCE_TYPES},
+            'dominant_type': type_counts.most_common(1)[0][0] if total else None,
+            # 추론/예측 문장 비율: 사실 전달보다 해석이 많은 기사일수록 높음
+            'opinion_ratio': ratio(type_counts.get('추론형', 0) + type_counts.get('예측형', 0)),
+            'bias_distribution': dict(bias_counts),
+            'biased_sentence_ratio': ratio(sum(
+                1 for r in sentence_results
+                if r['combined_label'] in BIAS_LABELS and r['combined_label'] != NEUTRAL_LABEL
+            )),
+            'avg_bias_score': round(float(np.mean([r['bias_score'] for r in sentence_results])), 4) if total else 0.0
+        }
+
+    def classify_article(self, text: str) -> dict:
+        sentences = split_sentences(text)
+        results = self.classify_sentences(sentences)
+        return {'sentences': results, 'summary': self.summarize(results)}
+
+    def classify_articles(self, texts: List[str]) -> List[dict]:
+        """여러 기사의 문장을 모아 한 번에 분류한 뒤 기사별로 다시 나눔"""
+        per_article = [split_sentences(text) for text in texts]
+        flat = [s for sentences in per_article for s in sentences]
+        results = self.classify_sentences(flat)
+
+        articles = []
+        offset = 0
+        for sentences in per_article:
+            chunk = results[offset:offset + len(sentences)]
+            offset += len(sentences)
+            articles.append({'sentences': chunk, 'summary': self.summarize(chunk)})
+        return articles
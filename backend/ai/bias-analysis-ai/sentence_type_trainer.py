@@ -18,9 +18,11 @@ from transformers import (
     AutoModelForSequenceClassification,
     TrainingArguments,
     Trainer,
-    EarlyStoppingCallback
+    EarlyStoppingCallback,
+    DataCollatorWithPadding
 )
 from torch.utils.data import Dataset
+from electra_inference import predict_logits, torch_forward
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -32,34 +34,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class SentenceTypeDataset(Dataset):
-    """문장 유형 분류 데이터셋"""
+    """문장 유형 분류 데이터셋 (패딩은 배치 단위로 DataCollatorWithPadding에서)"""
 
     def __init__(self, texts, labels, tokenizer, max_length=512):
-        self.texts = texts
         self.labels = labels
-        self.tokenizer = tokenizer
-        self.max_length = max_length
+        # 한 번에 토큰화 (문장별 길이 그대로 유지)
+        self.encodings = tokenizer(texts, truncation=True, max_length=max_length)
 
     def __len__(self):
-        return len(self.texts)
+        return len(self.labels)
 
     def __getitem__(self, idx):
-        text = self.texts[idx]
-        label = self.labels[idx]
-
-        encoding = self.tokenizer(
-            text,
-            truncation=True,
-            padding='max_length',
-            max_length=self.max_length,
-            return_tensors='pt'
-        )
-
-        return {
-            'input_ids': encoding['input_ids'].flatten(),
-            'attention_mask': encoding['attention_mask'].flatten(),
-            'labels': torch.tensor(label, dtype=torch.long)
-        }
+        item = {key: values[idx] for key, values in self.encodings.items()}
+        item['labels'] = self.labels[idx]
+        return item
 
 class SentenceTypeTrainer:
     """문장 유형 분류 모델 학습기"""
@@ -71,6 +59,7 @@ class SentenceTypeTrainer:
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.label_map = {}
         self.reverse_label_map = {}
+        self.max_length = 512
 
     def load_aihub_data(self, data_path: str, sample_size: int = None) -> pd.DataFrame:
         """AI-Hub 데이터 로드"""
@@ -161,8 +150,8 @@ class SentenceTypeTrainer:
         self.model.to(self.device)
 
         # 데이터셋 생성
-        train_dataset = SentenceTypeDataset(train_texts, train_labels, self.tokenizer)
-        val_dataset = SentenceTypeDataset(val_texts, val_labels, self.tokenizer)
+        train_dataset = SentenceTypeDataset(train_texts, train_labels, self.tokenizer, self.max_length)
+        val_dataset = SentenceTypeDataset(val_texts, val_labels, self.tokenizer, self.max_length)
 
         # 학습 설정
         training_args = TrainingArguments(
@@ -185,6 +174,7 @@ class SentenceTypeTrainer:
             remove_unused_columns=False,
             push_to_hub=False,
             report_to="none",
+            group_by_length=True,
             seed=42
         )
 
@@ -195,6 +185,7 @@ class SentenceTypeTrainer:
             train_dataset=train_dataset,
             eval_dataset=val_dataset,
             tokenizer=self.tokenizer,
+            data_collator=DataCollatorWithPadding(self.tokenizer),
             callbacks=[EarlyStoppingCallback(early_stopping_patience=3)]
         )
 
@@ -221,21 +212,15 @@ class SentenceTypeTrainer:
             raise ValueError("모델이 로드되지 않았습니다")
 
         self.model.eval()
-        predictions = []
-
-        with torch.no_grad():
-            for text in test_texts:
-                inputs = self.tokenizer(
-                    text,
-                    truncation=True,
-                    padding=True,
-                    max_length=512,
-                    return_tensors='pt'
-                ).to(self.device)
-
-                outputs = self.model(**inputs)
-                pred = torch.argmax(outputs.logits, dim=-1)
-                predictions.append(pred.cpu().numpy()[0])
+        # 길이순 배치 + 배치별 동적 패딩 (서비스 추론과 같은 경로)
+        logits = predict_logits(
+            torch_forward(self.model, self.device),
+            self.tokenizer,
+            test_texts,
+            batch_size=64,
+            max_length=self.max_length
+        )
+        predictions = logits.argmax(axis=1) if logits is not None else []
 
         # 평가 지표 계산
         accuracy = accuracy_score(test_labels, predictions)
@@ -3,6 +3,9 @@ FANS 감성 분석 시스템
 규칙 기반 감성 분석 (긍정/중립/부정)
 """
 
+from lexicon_matcher import LexiconHits, LexiconMatcher
+import numpy as np
+
 class SentimentAnalyzer:
     def __init__(self):
         self.positive_keywords = {
@@ -24,12 +27,25 @@ class SentimentAnalyzer:
             '전했다', '보도', '알렸다', '설명', '언급'
         }
 
+        self.lexicons = {
+            'positive': self.positive_keywords,
+            'negative': self.negative_keywords,
+            'neutral': self.neutral_indicators
+        }
+        self.matcher = LexiconMatcher(self.lexicons)
+
     def analyze(self, text: str) -> dict:
         """
         텍스트 감성 분석
         """
-        positive_count = sum(1 for word in self.positive_keywords if word in text)
-        negative_count = sum(1 for word in self.negative_keywords if word in text)
+        return self.analyze_hits(self.matcher.scan(text))
+
+    def analyze_hits(self, hits: LexiconHits) -> dict:
+        """
+        사전 매칭 결과로 감성 분석 (서로 다른 키워드 수 기준)
+        """
+        positive_count = hits.distinct_count('positive')
+        negative_count = hits.distinct_count('negative')
 
         total = positive_count + negative_count
 
@@ -54,6 +70,40 @@ class SentimentAnalyzer:
             'score': (positive_count - negative_count) / max(total, 1)
         }
 
+    def analyze_batch(self, texts: list) -> list:
+        """
+        여러 텍스트 감성 분석
+        """
+        return self.analyze_hits_batch([self.matcher.scan(text) for text in texts])
+
+    def analyze_hits_batch(self, hits_list: list) -> list:
+        """
+        여러 매칭 결과를 한 번에 점수화 (analyze_hits와 같은 결과)
+        """
+        positive = np.array([hits.distinct_count('positive') for hits in hits_list], dtype=np.int64)
+        negative = np.array([hits.distinct_count('negative') for hits in hits_list], dtype=np.int64)
+        total = positive + negative
+        half = np.maximum(total, 1) * 2
+
+        sentiments = np.where(positive > negative, 'positive',
+                              np.where(negative > positive, 'negative', 'neutral'))
+        confidences = np.where(
+            positive == negative, 0.5,
+            np.minimum(0.5 + np.maximum(positive, negative) / half, 0.95)
+        )
+        scores = (positive - negative) / np.maximum(total, 1)
+
+        return [
+            {
+                'sentiment': str(sentiments[i]),
+                'confidence': float(confidences[i]),
+                'positive_count': int(positive[i]),
+                'negative_count': int(negative[i]),
+                'score': float(scores[i])
+            }
+            for i in range(len(hits_list))
+        ]
+
     def get_sentiment_label(self, text: str) -> str:
         """간단한 감성 라벨 반환"""
         result = self.analyze(text)
@@ -16,6 +16,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, accuracy_score
 import warnings
+from model_artifact import ArtifactError, export_artifact
 warnings.filterwarnings('ignore')
 
 # 경로 설정
@@ -242,6 +243,13 @@ class CombinedBiasAnalysisTrainer:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
         print(f"메타데이터 저장: {metadata_path}")
 
+        # 서비스용 메모리 매핑 아티팩트 (선형 모델만 가능)
+        try:
+            version = export_artifact(self.vectorizer, self.model, os.path.join(MODEL_DIR, "artifacts", "combined_bias"), name="combined_bias")
+            print(f"✅ 아티팩트 저장 완료: {version}")
+        except ArtifactError as e:
+            print(f"⚠️ 아티팩트 생성 건너뜀 (서비스는 pickle 사용): {e}")
+
         print("\n학습 완료 요약:")
         print(f"- 159번 데이터: {metadata['n_samples_159']:,}개")
         print(f"- 138번 데이터: {metadata['n_samples_138']:,}개")
@@ -18,6 +18,7 @@ from sklearn.naive_bayes import MultinomialNB
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, accuracy_score
 import warnings
+from model_artifact import ArtifactError, export_artifact
 warnings.filterwarnings('ignore')
 
 # 경로 설정
@@ -187,6 +188,13 @@ class BiasAnalysisTrainer:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
         print(f"✅ 메타데이터 저장 완료: {metadata_path}")
 
+        # 서비스용 메모리 매핑 아티팩트 (선형 모델만 가능)
+        try:
+            version = export_artifact(self.vectorizer, self.model, os.path.join(MODEL_DIR, "artifacts", "sentence_type"), name="sentence_type")
+            print(f"✅ 아티팩트 저장 완료: {version}")
+        except ArtifactError as e:
+            print(f"⚠️ 아티팩트 생성 건너뜀 (서비스는 pickle 사용): {e}")
+
     def test_model(self):
         """모델 테스트"""
         print("\n" + "=" * 50)
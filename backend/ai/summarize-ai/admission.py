@@ -0,0 +1,79 @@
+"""
+요약 요청 수락 정책
+모델 배치 처리 시간을 EWMA로 추적해 지금 요청을 넣으면 언제 끝날지 추정하고,
+대기열이 너무 길거나 요청 마감 시간 안에 끝나지 못할 것 같으면
+모델 대신 추출 요약(TextRank)으로 처리하도록 알려준다.
+"""
+
+import threading
+from typing import Optional, Tuple
+
+
+class AdmissionPolicy:
+    """대기열 길이 / 예상 완료 시간 기반 요약 tier 선택"""
+
+    def __init__(self, max_queue_depth: int = 32, alpha: float = 0.2,
+                 initial_batch_seconds: float = 1.0):
+        """
+        Args:
+            max_queue_depth: 이보다 많이 밀려 있으면 추출 요약
+            alpha: EWMA 가중치 (클수록 최근 배치 시간을 크게 반영)
+            initial_batch_seconds: 측정 전 배치 처리 시간 추정값
+        """
+        self.max_queue_depth = max_queue_depth
+        self.alpha = alpha
+        self.batch_seconds = initial_batch_seconds
+        self.observed = 0
+        self.admitted = 0
+        self.degraded = {"queue_depth": 0, "deadline": 0, "timeout": 0}
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """모델 배치 하나가 끝날 때마다 처리 시간 기록"""
+        with self._lock:
+            if self.observed == 0:
+                self.batch_seconds = seconds
+            else:
+                self.batch_seconds = self.alpha * seconds + (1 - self.alpha) * self.batch_seconds
+            self.observed += 1
+
+    def estimate_seconds(self, queue_depth: int, batch_size: int, jobs_pending: int = 0) -> float:
+        """
+        앞에 밀린 배치 + 자기 배치까지 끝나는 데 걸릴 예상 시간
+        Args:
+            jobs_pending: 모델 스레드를 쓰고 있거나 기다리는 작업 수 (배치 하나로 계산)
+        """
+        batches_ahead = queue_depth // max(batch_size, 1) + jobs_pending
+        return (batches_ahead + 1) * self.batch_seconds
+
+    def admit(self, queue_depth: int, batch_size: int, deadline_seconds: Optional[float],
+              jobs_pending: int = 0) -> Tuple[bool, Optional[str]]:
+        """
+        Returns:
+            (모델로 요약할지 여부, 추출 요약으로 돌린 이유)
+        """
+        reason = None
+        if queue_depth >= self.max_queue_depth:
+            reason = "queue_depth"
+        elif deadline_seconds is not None and self.estimate_seconds(queue_depth, batch_size, jobs_pending) > deadline_seconds:
+            reason = "deadline"
+
+        with self._lock:
+            if reason is None:
+                self.admitted += 1
+            else:
+                self.degraded[reason] += 1
+        return reason is None, reason
+
+    def record_timeout(self):
+        """수락했지만 마감 시간 안에 끝나지 않아 추출 요약으로 돌린 경우"""
+        with self._lock:
+            self.degraded["timeout"] += 1
+
+    def stats(self) -> dict:
+        return {
+            "max_queue_depth": self.max_queue_depth,
+            "ewma_batch_seconds": round(self.batch_seconds, 3),
+            "admitted": self.admitted,
+            "degraded": dict(self.degraded)
+        }
@@ -1,32 +1,110 @@
 # app/ai_module.py
+import os
 import re
-from typing import Optional
-from transformers import pipeline
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
 import torch
+from backends import load_backend
+from category_classifier import CategoryClassifier, NewsCategoryClassifier
+from extractive import extract_summary
+from long_document import chunk_sentences, split_sentences, spread_select
+from model_registry import ModelRegistry
+from summary_cache import SummaryCache, make_summary_key
+
+DEFAULT_MODEL_NAME = "eenzeenee/t5-base-korean-summarization"
+# 요약 모델 이름 (SUMMARY_MODEL 우선, docker-compose/.env에서 쓰는 MODEL_NAME도 허용)
+MODEL_NAME = os.getenv("SUMMARY_MODEL") or os.getenv("MODEL_NAME") or DEFAULT_MODEL_NAME
+WARMUP_TEXT = (
+    "정부는 오늘 새로운 경제정책을 발표했다. 전문가들은 내년 경제가 회복될 것으로 예측한다. "
+    "이번 정책이 성공하려면 국민의 협조가 필요하다고 강조했다."
+)
+
+# 모델 입력 최대 토큰 수 (넘는 기사는 긴 기사 모드로 처리)
+MAX_INPUT_TOKENS = int(os.getenv("SUMMARY_MAX_INPUT_TOKENS", 512))
+# 긴 기사 모드: 문장 경계로 나눈 조각을 한 배치로 요약(map)한 뒤 조각 요약들을 다시 요약(reduce)
+LONG_SUMMARY_ENABLED = os.getenv("LONG_SUMMARY_ENABLED", "true").lower() == "true"
+LONG_SUMMARY_MAX_CHUNKS = int(os.getenv("LONG_SUMMARY_MAX_CHUNKS", 8))
+LONG_SUMMARY_TIME_BUDGET = float(os.getenv("LONG_SUMMARY_TIME_BUDGET", 10))
+# map 단계에서 generate 한 번에 넣는 조각 수 (배치 사이마다 시간 예산 확인)
+LONG_SUMMARY_MAP_BATCH = max(int(os.getenv("LONG_SUMMARY_MAP_BATCH", 4)), 1)
+# 추출 요약(모델이 밀리거나 실패할 때): 최대 문장 수 / 생성 토큰 1개당 허용 글자 수
+EXTRACTIVE_MAX_SENTENCES = int(os.getenv("EXTRACTIVE_MAX_SENTENCES", 3))
+EXTRACTIVE_CHARS_PER_TOKEN = float(os.getenv("EXTRACTIVE_CHARS_PER_TOKEN", 3))
+
+# 디코딩 설정: sample은 기존 방식(매번 결과가 달라 캐시하지 않음), greedy/beam은 결정적
+DECODING_PROFILES = {
+    "sample": {"do_sample": True, "temperature": 0.7},
+    "greedy": {"do_sample": False, "num_beams": 1, "no_repeat_ngram_size": 3},
+    "beam": {"do_sample": False, "num_beams": 4, "early_stopping": True, "no_repeat_ngram_size": 3},
+}
+DETERMINISTIC_PROFILES = {"greedy", "beam"}
+# 기본값 greedy: 이전 기본 동작(sample)과 달리 같은 입력에 항상 같은 요약을 내며 캐시할 수 있음
+# 이전 동작이 필요하면 SUMMARY_DECODING=sample
+SUMMARY_DECODING = os.getenv("SUMMARY_DECODING", "greedy")
+
+# 같은 본문(재수집/전재 기사) 요약 재사용
+summary_cache = SummaryCache(
+    max_entries=int(os.getenv("SUMMARY_CACHE_SIZE", 2048)),
+    db_path=os.getenv("SUMMARY_CACHE_DB")
+)
+
+class CancelCriteria(StoppingCriteria):
+    """취소 이벤트가 설정되면 다음 토큰에서 생성 중단"""
+
+    def __init__(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full(
+            (input_ids.shape[0],), self.cancel_event.is_set(), dtype=torch.bool, device=input_ids.device
+        )
+
+class LongSummary(NamedTuple):
+    """긴 기사 요약 결과"""
+    summary: str
+    reduced: bool          # 조각 요약들을 다시 요약(reduce)까지 했는지
+    chunks_used: int       # 요약에 반영한 조각 수
+    chunks_total: int      # 기사 전체 조각 수
+    budget_limited: bool   # 시간 예산 때문에 조각을 줄이거나 reduce를 건너뛰었는지 (캐시하지 않음)
+
+    @property
+    def partial(self) -> bool:
+        """기사 일부 조각만 반영했거나 reduce 없이 이어 붙인 결과"""
+        return not self.reduced or self.chunks_used < self.chunks_total
 
 class NewsAISummarizer:
     def __init__(self):
         """뉴스 요약 AI 모델 초기화"""
         self.summarizer = None
+        self.model_name = MODEL_NAME
+        if SUMMARY_DECODING not in DECODING_PROFILES:
+            raise ValueError(f"알 수 없는 디코딩 설정: {SUMMARY_DECODING}")
+        self.decoding = SUMMARY_DECODING
+        # 긴 기사 map 배치 하나(LONG_SUMMARY_MAP_BATCH 조각) 처리 시간 EWMA (조각 수 상한 계산용)
+        self.map_batch_seconds: Optional[float] = None
         self._load_model()
 
     def _load_model(self):
-        """한국어 요약 모델 로드"""
+        """한국어 요약 모델 로드 (SUMMARY_BACKEND: torch 또는 onnx)"""
         try:
             # 경량화된 한국어 요약 모델 사용
-            model_name = "eenzeenee/t5-base-korean-summarization"
-            self.summarizer = pipeline(
-                "summarization",
-                model=model_name,
-                tokenizer=model_name,
-                device=0 if torch.cuda.is_available() else -1  # GPU 사용 가능하면 GPU, 아니면 CPU
-            )
+            model_name = self.model_name
+            self.summarizer = load_backend(model_name)
             print(f"[AI] 모델 로드 완료: {model_name}")
         except Exception as e:
             print(f"[AI] 모델 로드 실패: {e}")
             self.summarizer = None
 
-    def clean_text(self, text: str) -> str:
+    def warmup(self):
+        """짧은 생성 한 번으로 첫 요청 지연(그래프/메모리 초기화) 제거"""
+        if not self.summarizer:
+            raise RuntimeError("AI 모델을 사용할 수 없습니다.")
+        self.generate_batch([WARMUP_TEXT], max_length=20, min_length=5)
+
+    @staticmethod
+    def clean_text(text: str) -> str:
         """텍스트 전처리"""
         if not text:
             return ""
@@ -40,65 +118,380 @@ class NewsAISummarizer:
 
         return text.strip()
 
-    def summarize_news(self, title: str, content: str, max_length: int = 100) -> dict:
-        """뉴스 기사 요약"""
-        try:
-            if not self.summarizer:
-                return {
-                    "summary": "AI 모델을 사용할 수 없습니다.",
-                    "keywords": [],
-                    "success": False
-                }
-
-            # 텍스트 전처리
-            cleaned_title = self.clean_text(title or "")
-            cleaned_content = self.clean_text(content or "")
+    def prepare_input(self, title: str, content: str, max_length: int = 100) -> dict:
+        """요약 입력 전처리 (짧은 글은 모델 없이 바로 결과 반환)"""
+        # 텍스트 전처리
+        cleaned_title = self.clean_text(title or "")
+        cleaned_content = self.clean_text(content or "")
 
-            # 제목 + 내용 결합 (토큰 제한 고려)
-            full_text = f"{cleaned_title}. {cleaned_content}"
+        # 제목 + 내용 결합 (토큰 제한 고려)
+        full_text = f"{cleaned_title}. {cleaned_content}"
 
-            # 텍스트가 너무 짧으면 원문 반환
-            if len(full_text.strip()) < 50:
-                return {
+        # 텍스트가 너무 짧으면 원문 반환
+        if len(full_text.strip()) < 50:
+            return {
+                "result": {
                     "summary": cleaned_content or cleaned_title,
                     "keywords": self.extract_keywords(full_text),
-                    "success": True
+                    "success": True,
+                    "tier": "original"
                 }
+            }
+
+        # 토큰 길이 제한 (대략 512토큰) - 긴 기사 모드에서는 자르지 않고 조각으로 나눠 요약
+        if not LONG_SUMMARY_ENABLED and len(full_text) > 2000:
+            full_text = full_text[:2000] + "..."
+
+        # 입력 길이에 따라 max_length 자동 조정
+        actual_max_length = min(max_length, len(full_text) // 2) if len(full_text) > 50 else max_length
+        return {
+            "text": full_text,
+            "max_length": actual_max_length,
+            "min_length": min(30, actual_max_length - 10)
+        }
+
+    @property
+    def prefix(self) -> str:
+        """파이프라인과 같이 모델 설정의 prefix 사용"""
+        return self.summarizer.model.config.prefix or ""
 
-            # 토큰 길이 제한 (대략 512토큰)
-            if len(full_text) > 2000:
-                full_text = full_text[:2000] + "..."
-
-            # AI 요약 생성 (입력 길이에 따라 max_length 자동 조정)
-            actual_max_length = min(max_length, len(full_text) // 2) if len(full_text) > 50 else max_length
-            summary_result = self.summarizer(
-                full_text,
-                max_length=actual_max_length,
-                min_length=min(30, actual_max_length - 10),
-                do_sample=True,
-                temperature=0.7
+    @property
+    def max_input_tokens(self) -> int:
+        return min(MAX_INPUT_TOKENS, self.summarizer.tokenizer.model_max_length)
+
+    def generate_batch(self, texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """여러 입력을 패딩해 generate 한 번으로 요약"""
+        model = self.summarizer.model
+        tokenizer = self.summarizer.tokenizer
+
+        inputs = tokenizer(
+            [self.prefix + text for text in texts],
+            padding=True,
+            truncation=True,
+            max_length=self.max_input_tokens,
+            return_tensors="pt"
+        ).to(model.device)
+
+        with torch.inference_mode():
+            output_ids = model.generate(
+                **inputs,
+                max_length=max_length,
+                min_length=min_length,
+                **DECODING_PROFILES[self.decoding]
             )
 
-            summary = summary_result[0]['summary_text'] if summary_result else full_text
+        return tokenizer.batch_decode(output_ids, skip_special_tokens=True)
 
-            return {
-                "summary": summary,
-                "keywords": self.extract_keywords(full_text),
-                "success": True
-            }
+    def long_inputs(self, texts: List[str]) -> List[bool]:
+        """모델 입력 토큰 수를 넘어 긴 기사 모드로 처리할 입력 표시"""
+        if not LONG_SUMMARY_ENABLED or not texts:
+            return [False] * len(texts)
+        lengths = [len(ids) for ids in self.summarizer.tokenizer([self.prefix + t for t in texts])["input_ids"]]
+        return [length > self.max_input_tokens for length in lengths]
+
+    def summarize_long(self, text: str, max_length: int, min_length: int,
+                       time_budget: Optional[float] = None,
+                       generate: Optional[Callable[[str], str]] = None,
+                       cancel_event: Optional[threading.Event] = None) -> LongSummary:
+        """
+        긴 기사 map-reduce 요약
+        - map: 문장 경계로 나눈 조각들을 LONG_SUMMARY_MAP_BATCH개씩 배치로 요약
+        - reduce: 조각 요약을 이어 붙여 다시 요약
+        조각이 LONG_SUMMARY_MAX_CHUNKS개(또는 측정한 배치 시간으로 예산 안에 처리할 수 있는 수)를 넘으면
+        글 전체에 고르게 골라 가운데 조각 일부는 요약에 반영하지 않음 (chunks_used < chunks_total)
+        map 배치 사이마다 시간 예산을 확인해 남은 조각을 건너뛰고, reduce를 끝낼 수 없으면
+        조각 요약을 이어 붙인 결과 반환
+        Args:
+            generate: 마지막 요약 생성 함수 (기본: generate_batch, 스트리밍 시 토큰 전송 함수)
+            cancel_event: 설정되면 남은 map 배치와 reduce를 건너뛰고 조각 요약 반환 (스트리밍 연결 종료)
+        """
+        if generate is None:
+            generate = lambda source: self.generate_batch([source], max_length, min_length)[0]
+
+        budget = LONG_SUMMARY_TIME_BUDGET if time_budget is None else time_budget
+        started = time.monotonic()
+        tokenizer = self.summarizer.tokenizer
+
+        # prefix와 종료 토큰 자리를 뺀 조각당 토큰 수
+        chunk_tokens = self.max_input_tokens - len(tokenizer(self.prefix, add_special_tokens=False)["input_ids"]) - 1
+        chunks = chunk_sentences(split_sentences(text), tokenizer, chunk_tokens)
+        if len(chunks) <= 1:
+            return LongSummary(generate(chunks[0] if chunks else text), True, 1, 1, False)
+
+        # 이전 요청에서 측정한 배치 시간으로 예산 안에 끝낼 수 있는 조각 수까지만 선택 (reduce 자리 1배치 남김)
+        limit = LONG_SUMMARY_MAX_CHUNKS
+        budget_limited = False
+        if self.map_batch_seconds:
+            affordable = max(int(budget / self.map_batch_seconds) - 1, 1) * LONG_SUMMARY_MAP_BATCH
+            if affordable < min(limit, len(chunks)):
+                limit, budget_limited = affordable, True
+        selected = spread_select(chunks, limit)
+
+        partial_max_length = max(max_length, 64)
+        partials = []
+        for start in range(0, len(selected), LONG_SUMMARY_MAP_BATCH):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            elapsed = time.monotonic() - started
+            # 다음 배치 + reduce를 예산 안에 끝낼 수 없으면 남은 조각은 건너뜀 (최소 한 배치는 처리)
+            if partials and self.map_batch_seconds and elapsed + 2 * self.map_batch_seconds > budget:
+                budget_limited = True
+                break
+            batch_started = time.monotonic()
+            partials.extend(self.generate_batch(
+                selected[start:start + LONG_SUMMARY_MAP_BATCH], partial_max_length, min(20, partial_max_length - 10)
+            ))
+            self._observe_map_batch(time.monotonic() - batch_started)
+
+        combined = " ".join(p.strip() for p in partials if p.strip())
+        elapsed = time.monotonic() - started
+        if cancel_event is not None and cancel_event.is_set():
+            return LongSummary(combined, False, len(partials), len(chunks), budget_limited)
+
+        # reduce는 입력 하나라 map 배치 하나보다 오래 걸리지 않는다고 보고 남은 시간과 비교
+        if elapsed + self.map_batch_seconds > budget:
+            print(f"[AI] 긴 기사 요약 시간 예산 초과, 조각 요약 반환 ({len(partials)}/{len(chunks)}조각, {elapsed:.1f}초)")
+            return LongSummary(combined, False, len(partials), len(chunks), True)
+
+        return LongSummary(generate(combined), True, len(partials), len(chunks), budget_limited)
+
+    def _observe_map_batch(self, seconds: float, alpha: float = 0.3):
+        if self.map_batch_seconds is None:
+            self.map_batch_seconds = seconds
+        else:
+            self.map_batch_seconds = alpha * seconds + (1 - alpha) * self.map_batch_seconds
+
+    def create_streamer(self, timeout: Optional[float] = None) -> TextIteratorStreamer:
+        """
+        디코딩되는 토큰을 꺼내 쓸 수 있는 스트리머 (디코더 시작 토큰은 건너뜀)
+        timeout초 동안 토큰이 없으면 queue.Empty (긴 기사 map 단계처럼 토큰이 없는 동안 연결 확인용)
+        """
+        return TextIteratorStreamer(
+            self.summarizer.tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=timeout
+        )
+
+    def generate_stream(self, text: str, max_length: int, min_length: int,
+                        streamer: TextIteratorStreamer, cancel_event: threading.Event) -> str:
+        """입력 하나를 생성하며 토큰을 streamer로 전송 (cancel_event 설정 시 중단)"""
+        model = self.summarizer.model
+        tokenizer = self.summarizer.tokenizer
+        inputs = tokenizer(
+            [self.prefix + text],
+            truncation=True,
+            max_length=self.max_input_tokens,
+            return_tensors="pt"
+        ).to(model.device)
+
+        # 스트리머는 빔 서치를 지원하지 않으므로 빔 설정이면 greedy로 생성
+        profile = DECODING_PROFILES[self.decoding]
+        if profile.get("num_beams", 1) > 1:
+            profile = DECODING_PROFILES["greedy"]
+
+        with torch.inference_mode():
+            output_ids = model.generate(
+                **inputs,
+                max_length=max_length,
+                min_length=min_length,
+                streamer=streamer,
+                stopping_criteria=StoppingCriteriaList([CancelCriteria(cancel_event)]),
+                **profile
+            )
+        return tokenizer.decode(output_ids[0], skip_special_tokens=True)
+
+    def stream_summary(self, title: str, content: str, max_length: int,
+                       streamer: TextIteratorStreamer, cancel_event: threading.Event) -> str:
+        """
+        요약 하나를 토큰 단위로 streamer에 흘려보내고 전체 요약 반환
+        (짧은 글/캐시 적중/시간 예산 초과 결과는 한 번에 전송)
+        """
+        def send_all(text: str) -> str:
+            streamer.on_finalized_text(text, stream_end=True)
+            return text
+
+        try:
+            if cancel_event.is_set():
+                return send_all("")
+            if not self.summarizer:
+                return send_all("AI 모델을 사용할 수 없습니다.")
 
+            prepared = self.prepare_input(title, content, max_length)
+            if "result" in prepared:
+                return send_all(prepared["result"]["summary"])
+
+            key = self.cache_key(prepared) if self.cacheable else None
+            cached = summary_cache.get(key) if key else None
+            if cached is not None:
+                return send_all(cached)
+
+            text = prepared["text"]
+            generate = lambda source: self.generate_stream(
+                source, prepared["max_length"], prepared["min_length"], streamer, cancel_event
+            )
+            budget_limited = False
+            if self.long_inputs([text])[0]:
+                long_summary = self.summarize_long(
+                    text, prepared["max_length"], prepared["min_length"], generate=generate,
+                    cancel_event=cancel_event
+                )
+                if not long_summary.reduced:
+                    return send_all(long_summary.summary)
+                summary, budget_limited = long_summary.summary, long_summary.budget_limited
+            else:
+                summary = generate(text)
+
+            # 중간에 취소되었거나 시간 예산 때문에 조각을 줄인 요약은 캐시하지 않음
+            if key and summary and not cancel_event.is_set() and not budget_limited:
+                summary_cache.put(key, summary)
+            return summary
+        except Exception:
+            # 소비 쪽이 끝을 기다리며 멈추지 않도록 스트림 종료
+            streamer.on_finalized_text("", stream_end=True)
+            raise
+
+    @property
+    def model_id(self) -> str:
+        """모델 + 백엔드 (백엔드/양자화마다 생성 결과가 다를 수 있어 캐시 키에 포함)"""
+        if not self.summarizer:
+            return self.model_name
+        return f"{self.model_name}@{self.summarizer.model_id_suffix}"
+
+    @property
+    def cacheable(self) -> bool:
+        return self.decoding in DETERMINISTIC_PROFILES
+
+    def cache_key(self, prepared: dict) -> str:
+        """본문 + 모델 + 디코딩 설정 + 생성 길이 (긴 기사 분할 설정 포함)"""
+        decoding = {
+            **DECODING_PROFILES[self.decoding],
+            "max_input_tokens": self.max_input_tokens,
+            "long_summary": LONG_SUMMARY_ENABLED,
+            "long_max_chunks": LONG_SUMMARY_MAX_CHUNKS,
+            "long_map_batch": LONG_SUMMARY_MAP_BATCH
+        }
+        return make_summary_key(
+            prepared["text"], self.model_id, decoding, prepared["max_length"], prepared["min_length"]
+        )
+
+    def summarize_batch(self, requests: List[Tuple[str, str, int]]) -> List[dict]:
+        """
+        여러 요약 요청을 한 번에 처리
+        Args:
+            requests: (제목, 내용, max_length) 목록
+        Returns:
+            요청 순서대로 summarize_news와 같은 형식의 결과
+        """
+        results: List[Optional[dict]] = [None] * len(requests)
+
+        if not self.summarizer:
+            error = RuntimeError("AI 모델을 사용할 수 없습니다.")
+            return [self.fallback_result(title, content, max_length, error)
+                    for title, content, max_length in requests]
+
+        pending = []
+        for i, (title, content, max_length) in enumerate(requests):
+            prepared = self.prepare_input(title, content, max_length)
+            if "result" in prepared:
+                results[i] = prepared["result"]
+            else:
+                pending.append((i, prepared))
+
+        # 결정적 디코딩이면 캐시된 요약 사용
+        cache_keys: Dict[int, str] = {}
+        if self.cacheable:
+            misses = []
+            for i, prepared in pending:
+                key = self.cache_key(prepared)
+                cached = summary_cache.get(key)
+                if cached is not None:
+                    results[i] = self.success_result(cached, prepared["text"])
+                else:
+                    cache_keys[i] = key
+                    misses.append((i, prepared))
+            pending = misses
+
+        # 생성 길이가 같은 요청끼리 묶어 배치 생성 (긴 기사는 조각 요약)
+        groups: Dict[Tuple[int, int], List[Tuple[int, str]]] = {}
+        long_flags = self.long_inputs([prepared["text"] for _, prepared in pending])
+        for (i, prepared), is_long in zip(pending, long_flags):
+            if is_long:
+                try:
+                    long_summary = self.summarize_long(
+                        prepared["text"], prepared["max_length"], prepared["min_length"]
+                    )
+                    results[i] = self.success_result(long_summary.summary, prepared["text"])
+                    # 기사 일부 조각만 반영했으면 응답에 표시
+                    results[i]["partial"] = long_summary.partial
+                    results[i]["chunks"] = {"used": long_summary.chunks_used, "total": long_summary.chunks_total}
+                    # 시간 예산 때문에 조각을 줄이거나 reduce를 건너뛴 결과는 캐시하지 않음
+                    if not long_summary.budget_limited and i in cache_keys:
+                        summary_cache.put(cache_keys[i], long_summary.summary)
+                except Exception as e:
+                    print(f"[AI] 긴 기사 요약 실패: {e}")
+                    title, content, max_length = requests[i]
+                    results[i] = self.fallback_result(title, content, max_length, e)
+            else:
+                key = (prepared["max_length"], prepared["min_length"])
+                groups.setdefault(key, []).append((i, prepared["text"]))
+
+        for (max_length, min_length), items in groups.items():
+            try:
+                summaries = self.generate_batch([text for _, text in items], max_length, min_length)
+                for (i, text), summary in zip(items, summaries):
+                    results[i] = self.success_result(summary, text)
+                    if summary and i in cache_keys:
+                        summary_cache.put(cache_keys[i], summary)
+            except Exception as e:
+                print(f"[AI] 요약 생성 실패: {e}")
+                for i, _ in items:
+                    title, content, max_length = requests[i]
+                    results[i] = self.fallback_result(title, content, max_length, e)
+
+        return results
+
+    def length_buckets(self, requests: List[Tuple[str, str, int]], bucket_size: int) -> List[List[int]]:
+        """
+        요청을 입력 토큰 길이순으로 정렬해 bucket_size개씩 나눔
+        (길이가 비슷한 글끼리 묶어 패딩 낭비를 줄임)
+        """
+        texts = []
+        for title, content, max_length in requests:
+            prepared = self.prepare_input(title, content, max_length)
+            texts.append(prepared.get("text", ""))
+
+        if self.summarizer:
+            lengths = [len(ids) for ids in self.summarizer.tokenizer(texts, truncation=True)["input_ids"]]
+        else:
+            lengths = [len(text) for text in texts]
+
+        order = sorted(range(len(requests)), key=lambda i: lengths[i])
+        return [order[i:i + bucket_size] for i in range(0, len(order), bucket_size)]
+
+    def success_result(self, summary: str, text: str) -> dict:
+        return {
+            "summary": summary or text,
+            "keywords": self.extract_keywords(text),
+            "success": True,
+            "tier": "abstractive"
+        }
+
+    def fallback_result(self, title: str, content: str, max_length: int, error: Exception) -> dict:
+        """실패시 추출 요약을 대신 사용"""
+        return {
+            **summarize_extractive(title, content, max_length),
+            "success": False,
+            "error": str(error)
+        }
+
+    def summarize_news(self, title: str, content: str, max_length: int = 100) -> dict:
+        """뉴스 기사 요약"""
+        try:
+            return self.summarize_batch([(title, content, max_length)])[0]
         except Exception as e:
             print(f"[AI] 요약 생성 실패: {e}")
-            # 실패시 원본 텍스트의 앞부분을 요약으로 사용
-            fallback = (content or title or "")[:max_length] + "..."
-            return {
-                "summary": fallback,
-                "keywords": [],
-                "success": False,
-                "error": str(e)
-            }
+            return self.fallback_result(title, content, max_length, e)
 
-    def extract_keywords(self, text: str, top_k: int = 5) -> list:
+    @staticmethod
+    def extract_keywords(text: str, top_k: int = 5) -> list:
         """간단한 키워드 추출 (빈도 기반)"""
         try:
             if not text:
@@ -125,81 +518,46 @@ class NewsAISummarizer:
             print(f"[AI] 키워드 추출 실패: {e}")
             return []
 
+def summarize_extractive(title: str, content: str, max_length: int = 100) -> dict:
+    """
+    모델 없이 TextRank로 핵심 문장 추출 (요약 모델이 밀리거나 실패할 때)
+    max_length(생성 토큰 수)를 글자 수로 환산해 길이를 맞춤
+    """
+    cleaned_title = NewsAISummarizer.clean_text(title or "")
+    cleaned_content = NewsAISummarizer.clean_text(content or "")
+    full_text = f"{cleaned_title}. {cleaned_content}" if cleaned_title else cleaned_content
+
+    summary = extract_summary(
+        cleaned_content or cleaned_title,
+        max_sentences=EXTRACTIVE_MAX_SENTENCES,
+        max_chars=max(int(max_length * EXTRACTIVE_CHARS_PER_TOKEN), 1)
+    )
+    return {
+        "summary": summary,
+        "keywords": NewsAISummarizer.extract_keywords(full_text),
+        "success": True,
+        "tier": "extractive"
+    }
+
+# 모델은 레지스트리에서 한 번만 로드해 공유
+model_registry = ModelRegistry()
+model_registry.register("summarizer", NewsAISummarizer, warmup=NewsAISummarizer.warmup)
+
+
+def get_summarizer() -> NewsAISummarizer:
+    return model_registry.get("summarizer")
+
+
 # AIModule 클래스 (main.py 호환성)
 class AIModule:
-    def __init__(self):
-        self.summarizer = NewsAISummarizer()
-    
+    @property
+    def summarizer(self) -> NewsAISummarizer:
+        return get_summarizer()
+
     def summarize(self, text: str, max_length: int = 100) -> str:
         """간단한 요약 인터페이스"""
         result = self.summarizer.summarize_news("", text, max_length)
         return result["summary"]
 
-class NewsCategoryClassifier:
-    """뉴스 카테고리 분류기"""
-
-    def __init__(self):
-        """카테고리 키워드 맵 초기화"""
-        self.category_keywords = {
-            '정치': ['정부', '국회', '의원', '대통령', '장관', '정당', '민주당', '국민의힘', '선거',
-                   '법안', '정책', '행정', '여당', '야당', '여야', '의회', '입법', '총리', '청와대', '국정',
-                   '국회의원', '공약', '개헌', '탄핵', '청문회', '국감', '예산안', '법률안'],
-            '경제': ['경제', '금융', '증시', '주식', '코스피', '달러', '환율', '기업', '은행',
-                   '투자', '부동산', '시장', '매출', '수익', '금리', '채권', '펀드', '재계', '상장', '거래'],
-            '사회': ['경찰', '사건', '사고', '재판', '법원', '검찰', '범죄', '화재', '교통',
-                   '안전', '복지', '교육', '학교', '학생', '의료', '병원', '환경', '재난', '피해'],
-            'IT/과학': ['AI', '인공지능', '기술', '과학', '연구', '개발', 'IT', '소프트웨어',
-                      '하드웨어', '반도체', '전자', '로봇', '우주', '바이오', '의학', '실험', '혁신'],
-            '세계': ['미국', '중국', '일본', '러시아', '유럽', '트럼프', '바이든', '국제',
-                   '외교', '전쟁', '분쟁', '유엔', 'NATO', 'G7', '정상회담', '해외', '글로벌'],
-            '연예': ['배우', '가수', '아이돌', 'K-POP', '영화', '드라마', 'MV', '음악',
-                   '방송', '연예인', '스타', '엔터', '걸그룹', '보이그룹', '데뷔', '컴백'],
-            '스포츠': ['야구', '축구', '농구', '배구', '골프', '올림픽', 'MLB', 'NBA',
-                    '선수', '경기', '우승', '감독', '구단', '리그', '월드컵', '승리', '패배'],
-            '생활/문화': ['여행', '맛집', '레시피', '패션', '뷰티', '문화', '전시', '공연',
-                       '축제', '요리', '건강', '다이어트', '운동', '취미', '책', '미술', '음악회']
-        }
-
-    def classify(self, title: str, content: str = "") -> str:
-        """기사 제목과 내용을 분석하여 카테고리 분류"""
-        try:
-            # 제목과 내용 결합
-            text = f"{title} {content}".lower()
-
-            # 각 카테고리별 점수 계산
-            scores = {}
-            for category, keywords in self.category_keywords.items():
-                score = sum(1 for keyword in keywords if keyword.lower() in text)
-                if score > 0:
-                    scores[category] = score
-
-            # 점수가 가장 높은 카테고리 반환
-            if scores:
-                best_category = max(scores, key=scores.get)
-                # 최소 2개 이상의 키워드가 매칭되어야 함
-                if scores[best_category] >= 2:
-                    return best_category
-
-            # 분류 불가능한 경우 기타
-            return '기타'
-
-        except Exception as e:
-            print(f"[AI] 카테고리 분류 실패: {e}")
-            return '기타'
-
-    def classify_batch(self, articles: list) -> list:
-        """여러 기사 일괄 분류"""
-        results = []
-        for article in articles:
-            title = article.get('title', '')
-            content = article.get('content', '')
-            category = self.classify(title, content)
-            results.append({
-                'title': title,
-                'category': category
-            })
-        return results
-
-# 전역 인스턴스
-ai_summarizer = NewsAISummarizer()
-category_classifier = NewsCategoryClassifier()
\ No newline at end of file
+# 전역 인스턴스 (요약 모델은 get_summarizer()로 접근)
+category_classifier = CategoryClassifier()
\ No newline at end of file
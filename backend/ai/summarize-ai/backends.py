@@ -0,0 +1,193 @@
+"""
+요약 모델 실행 백엔드
+- torch: transformers 모델을 그대로 실행 (기본값이자 onnx 실패 시 대체 경로)
+- onnx: 인코더/디코더를 KV 캐시 포함 ONNX로 변환해 ONNX Runtime으로 실행
+        (선택적으로 int8 동적 양자화, optimum / onnxruntime은 사용할 때만 import)
+
+두 백엔드 모두 model.generate()와 tokenizer를 같은 방식으로 제공하므로
+요약 코드는 백엔드를 구분하지 않는다.
+
+ONNX 미리 변환 (이미지 빌드 시 등):
+    python backends.py eenzeenee/t5-base-korean-summarization --quantize
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import Optional
+
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+# torch | onnx
+SUMMARY_BACKEND = os.getenv("SUMMARY_BACKEND", "torch").lower()
+# onnx 백엔드 int8 동적 양자화 여부
+SUMMARY_QUANTIZE = os.getenv("SUMMARY_QUANTIZE", "true").lower() == "true"
+# 변환한 ONNX 파일 저장 위치 (모델별 하위 디렉토리)
+ONNX_CACHE_DIR = os.getenv("SUMMARY_ONNX_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "onnx"))
+
+QUANTIZED_SUFFIX = "quantized"
+
+
+def default_intra_threads() -> int:
+    """연산 하나를 나눠 실행할 스레드 수 (기본: CPU 코어를 워커 수로 나눔)"""
+    value = os.getenv("SUMMARY_INTRA_OP_THREADS")
+    if value:
+        return max(int(value), 1)
+    workers = max(int(os.getenv("SUMMARY_WORKERS", 1) or 1), 1)
+    return max((os.cpu_count() or 1) // workers, 1)
+
+
+def default_inter_threads() -> int:
+    """독립 연산을 동시에 실행할 스레드 수 (생성은 순차 연산이라 기본 1)"""
+    return max(int(os.getenv("SUMMARY_INTER_OP_THREADS", 1)), 1)
+
+
+class SummaryBackend:
+    """백엔드가 로드한 모델 + 토크나이저"""
+
+    def __init__(self, name: str, model, tokenizer, quantized: bool = False):
+        self.name = name
+        self.model = model
+        self.tokenizer = tokenizer
+        self.quantized = quantized
+
+    @property
+    def model_id_suffix(self) -> str:
+        """캐시 키에 넣을 백엔드 식별자 (백엔드/양자화마다 생성 결과가 조금씩 다름)"""
+        return f"{self.name}-int8" if self.quantized else self.name
+
+
+def onnx_model_dir(model_name: str) -> str:
+    return os.path.join(ONNX_CACHE_DIR, model_name.strip("/").replace("/", "--"))
+
+
+def export_onnx(model_name: str, quantize: bool = True) -> str:
+    """
+    모델을 KV 캐시 포함 ONNX로 변환해 저장 (이미 있으면 재사용)
+    quantize=True면 ONNX 파일마다 int8 동적 양자화본(*_quantized.onnx)도 생성
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    output_dir = onnx_model_dir(model_name)
+    if not glob.glob(os.path.join(output_dir, "*.onnx")):
+        started = time.perf_counter()
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, use_cache=True)
+        model.save_pretrained(output_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+        print(f"[AI] ONNX 변환 완료: {output_dir} ({time.perf_counter() - started:.1f}초)")
+
+    if quantize:
+        quantize_onnx(output_dir)
+    return output_dir
+
+
+def quantize_onnx(output_dir: str):
+    """인코더/디코더 ONNX 파일 int8 동적 양자화 (이미 양자화본이 있으면 건너뜀)"""
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+    for path in sorted(glob.glob(os.path.join(output_dir, "*.onnx"))):
+        if path.endswith(f"_{QUANTIZED_SUFFIX}.onnx"):
+            continue
+        if os.path.exists(path[:-len(".onnx")] + f"_{QUANTIZED_SUFFIX}.onnx"):
+            continue
+        quantizer = ORTQuantizer.from_pretrained(output_dir, file_name=os.path.basename(path))
+        quantizer.quantize(save_dir=output_dir, quantization_config=config, file_suffix=QUANTIZED_SUFFIX)
+        print(f"[AI] ONNX 양자화 완료: {os.path.basename(path)}")
+
+
+def onnx_file_names(output_dir: str, quantize: bool) -> dict:
+    """from_pretrained에 넘길 인코더/디코더 파일 이름 (양자화본 우선)"""
+    names = {}
+    for key, stem in (
+        ("encoder_file_name", "encoder_model"),
+        ("decoder_file_name", "decoder_model"),
+        ("decoder_with_past_file_name", "decoder_with_past_model"),
+    ):
+        for candidate in ([f"{stem}_{QUANTIZED_SUFFIX}.onnx"] if quantize else []) + [f"{stem}.onnx"]:
+            if os.path.exists(os.path.join(output_dir, candidate)):
+                names[key] = candidate
+                break
+    return names
+
+
+def load_torch(model_name: str) -> SummaryBackend:
+    torch.set_num_threads(default_intra_threads())
+    try:
+        torch.set_num_interop_threads(default_inter_threads())
+    except RuntimeError:
+        # 이미 병렬 작업이 시작된 뒤에는 바꿀 수 없음
+        pass
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    # GPU 사용 가능하면 GPU, 아니면 CPU
+    model.to("cuda" if torch.cuda.is_available() else "cpu")
+    model.eval()
+    return SummaryBackend("torch", model, tokenizer)
+
+
+def load_onnx(model_name: str, quantize: bool = True) -> SummaryBackend:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+    output_dir = export_onnx(model_name, quantize)
+    file_names = onnx_file_names(output_dir, quantize)
+
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = default_intra_threads()
+    options.inter_op_num_threads = default_inter_threads()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        output_dir,
+        use_cache=True,
+        session_options=options,
+        provider="CPUExecutionProvider",
+        **file_names
+    )
+    tokenizer = AutoTokenizer.from_pretrained(output_dir)
+    quantized = QUANTIZED_SUFFIX in file_names.get("encoder_file_name", "")
+    return SummaryBackend("onnx", model, tokenizer, quantized=quantized)
+
+
+def load_backend(model_name: str, backend: Optional[str] = None,
+                 quantize: Optional[bool] = None) -> SummaryBackend:
+    """
+    설정한 백엔드로 요약 모델 로드 (onnx 로드/변환 실패 시 torch로 대체)
+    Args:
+        backend: 'torch' 또는 'onnx' (None이면 SUMMARY_BACKEND)
+        quantize: onnx int8 양자화 여부 (None이면 SUMMARY_QUANTIZE)
+    """
+    backend = (backend or SUMMARY_BACKEND).lower()
+    quantize = SUMMARY_QUANTIZE if quantize is None else quantize
+    started = time.perf_counter()
+
+    loaded = None
+    if backend == "onnx":
+        try:
+            loaded = load_onnx(model_name, quantize)
+        except Exception as e:
+            print(f"[AI] ONNX 백엔드 로드 실패, torch로 대체: {e}")
+    elif backend != "torch":
+        print(f"[AI] 알 수 없는 백엔드({backend}), torch 사용")
+
+    if loaded is None:
+        loaded = load_torch(model_name)
+
+    print(
+        f"[AI] 요약 백엔드: {loaded.model_id_suffix}, intra_op={default_intra_threads()}, "
+        f"inter_op={default_inter_threads()}, {time.perf_counter() - started:.1f}초"
+    )
+    return loaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 모델 ONNX 변환")
+    parser.add_argument("model_name", nargs="?", default=os.getenv("SUMMARY_MODEL") or os.getenv("MODEL_NAME") or "eenzeenee/t5-base-korean-summarization")
+    parser.add_argument("--quantize", action="store_true", help="int8 동적 양자화본도 생성")
+    args = parser.parse_args()
+    print(export_onnx(args.model_name, quantize=args.quantize))
@@ -0,0 +1,151 @@
+"""
+요약 요청 마이크로 배치 스케줄러
+동시에 들어온 요청을 짧은 대기 시간(또는 최대 배치 크기)까지 모아
+모델 generate 한 번으로 처리하고 각 요청에 결과를 돌려준다.
+모델 실행은 전용 스레드 하나에서만 하므로 요청끼리 torch 스레드를 다투지 않는다.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+# 취소되어 처리하지 않은 요청 자리 표시
+_CANCELLED = object()
+
+
+class MicroBatchScheduler:
+    """요청 병합 스케줄러"""
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 8, max_wait_ms: float = 20.0):
+        """
+        Args:
+            process_batch: 요청 목록 -> 같은 순서의 결과 목록 (모델 스레드에서 실행)
+            max_batch_size: 한 번에 처리할 최대 요청 수
+            max_wait_ms: 첫 요청 이후 다른 요청을 기다리는 최대 시간
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max_wait_ms / 1000.0
+
+        # 모델 실행 전용 스레드 (배치 요청/스트리밍 등 다른 모델 작업도 여기서 실행)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="generate")
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # run()으로 모델 스레드를 기다리거나 쓰고 있는 작업 수
+        self.jobs_pending = 0
+        self.batches = 0
+        self.items = 0
+        self.batch_seconds = 0.0
+        # 모델 스레드 차례가 오기 전에 취소되어 계산하지 않은 요청 수
+        self.skipped = 0
+
+    def start(self):
+        """이벤트 루프 안에서 호출"""
+        self._queue = asyncio.Queue()
+        self._batch_ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        print(f"[AI] 배치 스케줄러 시작: max_batch_size={self.max_batch_size}, max_wait={self.max_wait * 1000:.0f}ms")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, item: Any) -> Any:
+        """요청 하나를 배치에 넣고 결과를 기다림"""
+        if self._queue is None:
+            raise RuntimeError("배치 스케줄러가 시작되지 않았습니다")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        if self._queue.qsize() >= self.max_batch_size - 1:
+            self._batch_ready.set()
+        return await future
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """배치 외 모델 작업을 같은 모델 스레드에서 실행"""
+        self.jobs_pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.jobs_pending -= 1
+
+    async def _collect(self) -> list:
+        """첫 요청을 받은 뒤 max_wait 동안 또는 배치가 찰 때까지 요청을 모음"""
+        batch = [await self._queue.get()]
+
+        if self.max_wait > 0 and self._queue.qsize() < self.max_batch_size - 1:
+            self._batch_ready.clear()
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        # 기다리는 동안 취소된 요청은 제외
+        return [(item, future) for item, future in batch if not future.done()]
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            started = time.perf_counter()
+            try:
+                results = await self.run(self._process_live, batch)
+                for (_, future), result in zip(batch, results):
+                    if result is not _CANCELLED and not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                self.batches += 1
+                self.items += len(batch)
+                self.batch_seconds += time.perf_counter() - started
+
+    def _process_live(self, batch: list) -> list:
+        """
+        모델 스레드에서 실행: 모델 스레드를 기다리는 동안 취소된 요청(wait_for 타임아웃 등)은 빼고 처리
+        이미 시작한 generate는 중간에 멈출 수 없으므로 그 배치의 취소된 요청은 그대로 계산됨
+        """
+        # future.cancelled()는 상태 값 읽기만 하므로 다른 스레드에서 호출해도 안전
+        live = [i for i, (_, future) in enumerate(batch) if not future.cancelled()]
+        results = [_CANCELLED] * len(batch)
+        self.skipped += len(batch) - len(live)
+        if not live:
+            return results
+
+        for i, result in zip(live, self.process_batch([batch[i][0] for i in live])):
+            results[i] = result
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+            "queue_depth": self.queue_depth,
+            "jobs_pending": self.jobs_pending,
+            "batches": self.batches,
+            "requests": self.items,
+            "skipped_cancelled": self.skipped,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "avg_batch_seconds": round(self.batch_seconds / self.batches, 3) if self.batches else 0.0
+        }
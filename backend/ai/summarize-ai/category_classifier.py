@@ -0,0 +1,456 @@
+"""
+FANS 뉴스 카테고리 분류기
+- 키워드 분류기: 카테고리 키워드 사전 매칭 (학습 모델이 없거나 확신이 낮을 때 사용)
+- 선형 분류기: HashingVectorizer + SGDClassifier(log_loss)
+  언론사 페이지에서 파싱한 raw_news_articles.original_category를 정답으로 삼아
+  partial_fit으로 조금씩 학습 (어휘 사전이 없어 새 기사로 계속 이어서 학습 가능)
+  한 번에 훑는 SGD의 predict_proba는 보정되어 있지 않으므로, 학습 스크립트가
+  held-out 예측(progressive validation)으로 온도(temperature) 하나를 맞춰 확률을 보정
+
+학습: python train_category_classifier.py
+"""
+
+import os
+import pickle
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import minimize_scalar
+from scipy.special import expit, log_softmax, softmax
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from lexicon_matcher import LexiconMatcher
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "category_sgd.pkl")
+
+# 온도 보정에 필요한 최소 held-out 기사 수 (이보다 적으면 보정하지 않음)
+MIN_CALIBRATION_SAMPLES = 200
+
+# 서비스 카테고리 (news_articles.category_id 순서)
+CATEGORIES = ['정치', '경제', '사회', '생활/문화', 'IT/과학', '세계', '스포츠', '연예']
+FALLBACK_CATEGORY = '기타'
+
+# 언론사 카테고리명 -> 서비스 카테고리
+CATEGORY_ALIASES = {
+    '국제': '세계', '해외': '세계', '글로벌': '세계', '월드': '세계',
+    '문화': '생활/문화', '생활': '생활/문화', '라이프': '생활/문화', '여행': '생활/문화',
+    '건강': '생활/문화', '책': '생활/문화', '날씨': '생활/문화',
+    'IT': 'IT/과학', '과학': 'IT/과학', '테크': 'IT/과학', '디지털': 'IT/과학',
+    '엔터': '연예', '엔터테인먼트': '연예', '방송': '연예', '연예가': '연예',
+    '증권': '경제', '금융': '경제', '산업': '경제', '부동산': '경제', '재테크': '경제',
+    '사건사고': '사회', '사회일반': '사회', '교육': '사회', '노동': '사회',
+    '북한': '정치', '국회': '정치', '행정': '정치',
+    '야구': '스포츠', '축구': '스포츠', '골프': '스포츠', '농구': '스포츠',
+}
+
+CATEGORY_KEYWORDS = {
+    '정치': ['정부', '국회', '의원', '대통령', '장관', '정당', '민주당', '국민의힘', '선거',
+           '법안', '정책', '행정', '여당', '야당', '여야', '의회', '입법', '총리', '청와대', '국정',
+           '국회의원', '공약', '개헌', '탄핵', '청문회', '국감', '예산안', '법률안'],
+    '경제': ['경제', '금융', '증시', '주식', '코스피', '달러', '환율', '기업', '은행',
+           '투자', '부동산', '시장', '매출', '수익', '금리', '채권', '펀드', '재계', '상장', '거래'],
+    '사회': ['경찰', '사건', '사고', '재판', '법원', '검찰', '범죄', '화재', '교통',
+           '안전', '복지', '교육', '학교', '학생', '의료', '병원', '환경', '재난', '피해'],
+    'IT/과학': ['AI', '인공지능', '기술', '과학', '연구', '개발', 'IT', '소프트웨어',
+              '하드웨어', '반도체', '전자', '로봇', '우주', '바이오', '의학', '실험', '혁신'],
+    '세계': ['미국', '중국', '일본', '러시아', '유럽', '트럼프', '바이든', '국제',
+           '외교', '전쟁', '분쟁', '유엔', 'NATO', 'G7', '정상회담', '해외', '글로벌'],
+    '연예': ['배우', '가수', '아이돌', 'K-POP', '영화', '드라마', 'MV', '음악',
+           '방송', '연예인', '스타', '엔터', '걸그룹', '보이그룹', '데뷔', '컴백'],
+    '스포츠': ['야구', '축구', '농구', '배구', '골프', '올림픽', 'MLB', 'NBA',
+            '선수', '경기', '우승', '감독', '구단', '리그', '월드컵', '승리', '패배'],
+    '생활/문화': ['여행', '맛집', '레시피', '패션', '뷰티', '문화', '전시', '공연',
+               '축제', '요리', '건강', '다이어트', '운동', '취미', '책', '미술', '음악회']
+}
+
+
+def normalize_category(label: Optional[str]) -> Optional[str]:
+    """언론사 카테고리명을 서비스 카테고리로 변환 (알 수 없으면 None, 학습에서 제외)"""
+    if not label:
+        return None
+    label = label.strip()
+    if label in CATEGORIES:
+        return label
+    if label in CATEGORY_ALIASES:
+        return CATEGORY_ALIASES[label]
+    # '경제일반', 'IT일반', '정치/북한' 처럼 접두/구분자가 붙은 경우
+    for part in re.split(r'[/·>\s]+', label):
+        if part in CATEGORIES:
+            return part
+        if part in CATEGORY_ALIASES:
+            return CATEGORY_ALIASES[part]
+    for category in CATEGORIES:
+        if label.startswith(category):
+            return category
+    for alias, category in CATEGORY_ALIASES.items():
+        if label.startswith(alias):
+            return category
+    return None
+
+
+def article_text(title: str, content: str = "", max_chars: int = 2000) -> str:
+    """분류 입력: 제목을 두 번 넣어 비중을 높이고 본문은 앞부분만 사용"""
+    return f"{title or ''} {title or ''} {(content or '')[:max_chars]}"
+
+
+def ovr_proba(scores: np.ndarray) -> np.ndarray:
+    """SGDClassifier(log_loss) 다중 클래스 predict_proba와 같은 계산 (클래스별 시그모이드 후 정규화, 보정 전)"""
+    proba = expit(scores)
+    return proba / proba.sum(axis=1, keepdims=True)
+
+
+def expected_calibration_error(proba: np.ndarray, targets: np.ndarray, bins: int = 10) -> float:
+    """신뢰도 구간별 |정확도 - 평균 신뢰도|의 가중 평균 (신뢰도 다이어그램을 숫자 하나로)"""
+    confidence = proba.max(axis=1)
+    correct = proba.argmax(axis=1) == targets
+    bin_index = np.minimum((confidence * bins).astype(int), bins - 1)
+    error = 0.0
+    for b in range(bins):
+        in_bin = bin_index == b
+        if in_bin.any():
+            error += in_bin.mean() * abs(correct[in_bin].mean() - confidence[in_bin].mean())
+    return float(error)
+
+
+def mean_nll(proba: np.ndarray, targets: np.ndarray) -> float:
+    return float(-np.log(np.clip(proba[np.arange(len(targets)), targets], 1e-12, None)).mean())
+
+
+class NewsCategoryClassifier:
+    """키워드 기반 뉴스 카테고리 분류기"""
+
+    def __init__(self):
+        """카테고리 키워드 맵 초기화"""
+        self.category_keywords = CATEGORY_KEYWORDS
+        self.matcher = LexiconMatcher(self.category_keywords, ignore_case=True)
+
+    def match(self, title: str, content: str = "") -> Tuple[str, Dict[str, List[str]]]:
+        """
+        카테고리 분류 + 카테고리별 매칭된 키워드
+        Returns:
+            (카테고리, {카테고리: 매칭된 서로 다른 키워드 목록})
+        """
+        # 제목과 내용 결합 후 전체 카테고리 키워드를 한 번에 매칭
+        hits = self.matcher.scan(f"{title} {content}")
+
+        # 각 카테고리별 점수 계산 (매칭된 서로 다른 키워드 수)
+        matched = {}
+        for category in self.category_keywords:
+            if hits.distinct_count(category) > 0:
+                matched[category] = sorted(hits.keywords(category))
+
+        # 점수가 가장 높은 카테고리 반환
+        if matched:
+            best_category = max(matched, key=lambda c: len(matched[c]))
+            # 최소 2개 이상의 키워드가 매칭되어야 함
+            if len(matched[best_category]) >= 2:
+                return best_category, matched
+
+        # 분류 불가능한 경우 기타
+        return FALLBACK_CATEGORY, matched
+
+    def classify(self, title: str, content: str = "") -> str:
+        """기사 제목과 내용을 분석하여 카테고리 분류"""
+        try:
+            return self.match(title, content)[0]
+        except Exception as e:
+            print(f"[AI] 카테고리 분류 실패: {e}")
+            return FALLBACK_CATEGORY
+
+    def classify_batch(self, articles: list) -> list:
+        """여러 기사 일괄 분류"""
+        results = []
+        for article in articles:
+            title = article.get('title', '')
+            content = article.get('content', '')
+            category = self.classify(title, content)
+            results.append({
+                'title': title,
+                'category': category
+            })
+        return results
+
+
+class LinearCategoryClassifier:
+    """HashingVectorizer + SGD 로지스틱 회귀 카테고리 분류기 (partial_fit 온라인 학습)"""
+
+    def __init__(self, n_features: int = 2 ** 18, alpha: float = 1e-6):
+        # 글자 2~3gram: 형태소 분석 없이 조사/어미 변화에 강함
+        self.vectorizer = HashingVectorizer(
+            analyzer='char_wb',
+            ngram_range=(2, 3),
+            n_features=n_features,
+            alternate_sign=False,
+            norm='l2'
+        )
+        self.model = SGDClassifier(loss='log_loss', alpha=alpha, average=True, random_state=42)
+        self.trained_samples = 0
+        # 학습에 사용한 raw_news_articles 마지막 id (이어서 학습할 위치)
+        self.last_article_id = 0
+        # 확률 보정 온도 (None이면 보정 전 SGD 확률) / 마지막 보정 결과
+        self.temperature: Optional[float] = None
+        self.calibration: Optional[dict] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.trained_samples > 0
+
+    @property
+    def classes(self) -> List[str]:
+        return list(self.model.classes_) if self.is_trained else list(CATEGORIES)
+
+    def partial_fit(self, texts: List[str], labels: List[str]) -> int:
+        """
+        라벨이 있는 기사로 이어서 학습
+        Returns:
+            학습에 사용한 기사 수 (서비스 카테고리로 변환되지 않는 라벨은 제외)
+        """
+        pairs = [(t, normalize_category(l)) for t, l in zip(texts, labels)]
+        pairs = [(t, l) for t, l in pairs if l is not None]
+        if not pairs:
+            return 0
+
+        X = self.vectorizer.transform([t for t, _ in pairs])
+        self.model.partial_fit(X, [l for _, l in pairs], classes=CATEGORIES)
+        self.trained_samples += len(pairs)
+        return len(pairs)
+
+    def decision_scores(self, texts: List[str]) -> np.ndarray:
+        """(기사 수, 카테고리 수) 선형 점수 (희소 행렬 곱 한 번으로 배치 전체 계산)"""
+        return self.model.decision_function(self.vectorizer.transform(texts))
+
+    def proba_from_scores(self, scores: np.ndarray) -> np.ndarray:
+        """보정 온도가 있으면 softmax(점수 / 온도), 없으면 보정 전 SGD 확률"""
+        # 보정 기능 이전에 저장된 pickle에는 temperature 속성이 없음
+        temperature = getattr(self, 'temperature', None)
+        if temperature is None:
+            return ovr_proba(scores)
+        return softmax(scores / temperature, axis=1)
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """(기사 수, 카테고리 수) 확률 행렬"""
+        return self.proba_from_scores(self.decision_scores(texts))
+
+    @property
+    def is_calibrated(self) -> bool:
+        return getattr(self, 'temperature', None) is not None
+
+    def calibrate(self, scores: np.ndarray, labels: List[str]) -> Optional[dict]:
+        """
+        held-out 예측 점수로 온도 하나를 음의 로그 우도 최소화로 맞춤 (temperature scaling)
+        Args:
+            scores: 학습 전에 계산한 decision_scores (progressive validation)
+            labels: 서비스 카테고리 정답
+        Returns:
+            보정 전/후 ECE, NLL (기사가 MIN_CALIBRATION_SAMPLES보다 적으면 None, 온도 유지)
+        """
+        if len(labels) < MIN_CALIBRATION_SAMPLES:
+            return None
+        index = {c: i for i, c in enumerate(self.classes)}
+        targets = np.asarray([index[label] for label in labels])
+
+        def nll(log_temperature: float) -> float:
+            log_proba = log_softmax(scores / np.exp(log_temperature), axis=1)
+            return float(-log_proba[np.arange(len(targets)), targets].mean())
+
+        fitted = minimize_scalar(nll, bounds=(-4.0, 4.0), method='bounded')
+        before = ovr_proba(scores)
+        self.temperature = float(np.exp(fitted.x))
+        after = self.proba_from_scores(scores)
+
+        self.calibration = {
+            'temperature': round(self.temperature, 4),
+            'samples': len(targets),
+            'ece_before': round(expected_calibration_error(before, targets), 4),
+            'ece_after': round(expected_calibration_error(after, targets), 4),
+            'nll_before': round(mean_nll(before, targets), 4),
+            'nll_after': round(mean_nll(after, targets), 4)
+        }
+        return self.calibration
+
+    def save(self, path: str):
+        """임시 파일에 쓴 뒤 교체 (서비스가 읽는 중인 파일을 깨뜨리지 않음)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path: str) -> Optional['LinearCategoryClassifier']:
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+
+class CategoryClassifier:
+    """
+    서비스용 카테고리 분류기
+    학습된 선형 모델의 확률이 min_confidence 이상이면 그 결과를, 아니면 키워드 분류 결과를 사용
+    """
+
+    def __init__(self, model_path: Optional[str] = None, min_confidence: Optional[float] = None):
+        self.model_path = model_path or os.getenv("CATEGORY_MODEL_PATH", DEFAULT_MODEL_PATH)
+        self.min_confidence = (
+            min_confidence if min_confidence is not None
+            else float(os.getenv("CATEGORY_MIN_CONFIDENCE", 0.5))
+        )
+        # update() 후 파일 저장 최소 간격(초) - 저장할 때마다 모델 전체를 pickle로 쓰고 워커가 다시 읽음
+        self.save_interval = float(os.getenv("CATEGORY_SAVE_INTERVAL", 60))
+        self.keyword_classifier = NewsCategoryClassifier()
+        self.linear: Optional[LinearCategoryClassifier] = None
+        self._model_mtime: Optional[float] = None
+        # 모델 가중치 보호: update()는 제자리 학습, score_batch()는 예측하는 동안만 잡음
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+        self._dirty = False
+        self._load()
+
+    def reload(self):
+        """학습 스크립트가 저장한 모델 다시 읽기"""
+        self._load()
+
+    def reload_if_changed(self):
+        """모델 파일이 바뀌었으면 다시 읽기 (다른 프로세스가 학습/저장한 경우)"""
+        try:
+            mtime = os.path.getmtime(self.model_path)
+        except OSError:
+            return
+        if mtime != self._model_mtime:
+            self._load()
+
+    def _load(self):
+        try:
+            self._model_mtime = os.path.getmtime(self.model_path) if os.path.exists(self.model_path) else None
+            self.linear = LinearCategoryClassifier.load(self.model_path)
+            # 파일에서 다시 읽었으므로 아직 저장하지 않은 학습 결과는 버려짐 (그 기사들은 last_article_id 이후라 다시 학습됨)
+            self._dirty = False
+            if self.linear is not None:
+                print(f"[AI] 카테고리 모델 로드: {self.model_path} ({self.linear.trained_samples}건 학습)")
+        except Exception as e:
+            print(f"[AI] 카테고리 모델 로드 실패, 키워드 분류 사용: {e}")
+            self.linear = None
+
+    def score_batch(self, articles: List[Tuple[str, str]]) -> List[dict]:
+        """
+        여러 기사 카테고리 + 확률
+        Returns:
+            [{'category', 'confidence', 'scores', 'method', 'matched_keywords'}]
+            (method: 'model' 또는 'keyword', matched_keywords: 분류된 카테고리의 매칭 키워드)
+        """
+        results: List[Optional[dict]] = [None] * len(articles)
+        matches = [self.keyword_classifier.match(title, content) for title, content in articles]
+
+        linear = self.linear
+        if linear is not None and linear.is_trained and articles:
+            texts = [article_text(t, c) for t, c in articles]
+            with self._lock:
+                probabilities = linear.predict_proba(texts)
+                classes = linear.classes
+            for i, row in enumerate(probabilities):
+                best = int(np.argmax(row))
+                if row[best] >= self.min_confidence:
+                    results[i] = {
+                        'category': classes[best],
+                        'confidence': round(float(row[best]), 4),
+                        'scores': {c: round(float(p), 4) for c, p in zip(classes, row)},
+                        'method': 'model'
+                    }
+
+        for i, (category, matched) in enumerate(matches):
+            if results[i] is None:
+                results[i] = {
+                    'category': category,
+                    'confidence': None,
+                    'scores': {},
+                    'method': 'keyword'
+                }
+            results[i]['matched_keywords'] = matched.get(results[i]['category'], [])
+        return results
+
+    def classify_with_scores(self, title: str, content: str = "") -> dict:
+        return self.score_batch([(title, content)])[0]
+
+    def classify(self, title: str, content: str = "") -> str:
+        """기사 제목과 내용을 분석하여 카테고리 분류"""
+        try:
+            return self.classify_with_scores(title, content)['category']
+        except Exception as e:
+            print(f"[AI] 카테고리 분류 실패: {e}")
+            return FALLBACK_CATEGORY
+
+    def classify_batch(self, articles: list) -> list:
+        """여러 기사 일괄 분류"""
+        pairs = [(a.get('title', '') or '', a.get('content', '') or '') for a in articles]
+        return [
+            {'title': title, **result}
+            for (title, _), result in zip(pairs, self.score_batch(pairs))
+        ]
+
+    def update(self, articles: List[dict], save: bool = True) -> dict:
+        """
+        라벨이 있는 기사로 모델 이어서 학습 후 저장
+        Args:
+            articles: [{'id', 'title', 'content', 'category'}] (category는 언론사 카테고리명 가능)
+                id(raw_news_articles.id)가 있으면 last_article_id 이하인 기사는 건너뛰고,
+                학습 후 last_article_id를 받은 기사의 가장 큰 id로 옮김
+                (train_category_classifier.py가 같은 기사를 다시 학습하지 않도록)
+        """
+        with self._lock:
+            # 학습 스크립트가 모델 파일을 새로 저장했으면 그 모델에 이어서 학습
+            self.reload_if_changed()
+            if self.linear is None:
+                self.linear = LinearCategoryClassifier()
+            linear = self.linear
+
+            fresh = [a for a in articles if a.get('id') is None or a['id'] > linear.last_article_id]
+            # 모델을 복사하지 않고 제자리에서 학습 (그동안 분류는 잠깐 기다림, 작은 배치는 수십 ms)
+            used = linear.partial_fit(
+                [article_text(a.get('title', ''), a.get('content', '')) for a in fresh],
+                [a.get('category') for a in fresh]
+            )
+            ids = [a['id'] for a in fresh if a.get('id') is not None]
+            if ids:
+                linear.last_article_id = max(ids)
+            if used or ids:
+                self._dirty = True
+                if save and time.monotonic() - self._saved_at >= self.save_interval:
+                    self._save_locked()
+
+        return {
+            'received': len(articles),
+            'trained': used,
+            'skipped_seen': len(articles) - len(fresh),
+            'total_trained': linear.trained_samples,
+            'last_article_id': linear.last_article_id
+        }
+
+    def _save_locked(self):
+        self.linear.save(self.model_path)
+        self._model_mtime = os.path.getmtime(self.model_path)
+        self._saved_at = time.monotonic()
+        self._dirty = False
+
+    def flush(self):
+        """저장 간격 때문에 미뤄 둔 학습 결과 저장 (종료 시 호출)"""
+        with self._lock:
+            if self._dirty and self.linear is not None:
+                self._save_locked()
+
+    def status(self) -> dict:
+        linear = self.linear
+        return {
+            'model_path': self.model_path,
+            'trained': bool(linear and linear.is_trained),
+            'trained_samples': linear.trained_samples if linear else 0,
+            'last_article_id': linear.last_article_id if linear else 0,
+            'calibrated': bool(linear and linear.is_calibrated),
+            'calibration': getattr(linear, 'calibration', None) if linear else None,
+            'min_confidence': self.min_confidence,
+            'unsaved_updates': self._dirty
+        }
@@ -0,0 +1,151 @@
+"""
+카테고리 일괄 분류 실행기
+큰 배치를 청크로 나눠 워커 프로세스 풀에서 분류하고, 청크가 끝나는 대로 입력 순서대로 돌려준다.
+동시에 실행하는 청크 수를 제한해 배치 크기와 관계없이 메모리 사용량을 일정하게 유지한다.
+
+워커는 category_classifier만 import하므로 요약 모델(torch)은 워커에 로드되지 않는다.
+단, 서비스는 `uvicorn main:app`으로 실행해야 한다. `python main.py`로 실행하면 spawn이
+main.py를 워커마다 __mp_main__으로 다시 import한다 (Dockerfile CMD 참고).
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Optional, Tuple
+
+from category_classifier import CategoryClassifier
+
+# 워커 프로세스별 분류기
+_classifier: Optional[CategoryClassifier] = None
+
+
+def init_worker():
+    """워커 프로세스 시작 시 분류기 한 번 로드"""
+    global _classifier
+    _classifier = CategoryClassifier()
+
+
+def classify_chunk(start: int, articles: List[Tuple[str, str]]) -> List[dict]:
+    """
+    청크 하나 분류 (워커 프로세스에서 실행)
+    Returns:
+        index(원래 배치 내 위치)를 붙인 분류 결과
+    """
+    if _classifier is None:
+        init_worker()
+    # 서비스가 /ai/category/update로 모델을 저장했으면 새 모델 사용
+    _classifier.reload_if_changed()
+    return [
+        {'index': start + i, 'title': title, **result}
+        for i, ((title, _), result) in enumerate(zip(articles, _classifier.score_batch(articles)))
+    ]
+
+
+class CategoryPool:
+    """카테고리 분류용 프로세스 풀"""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """
+        Args:
+            workers: 워커 프로세스 수 (0이면 프로세스 풀 없이 스레드 하나에서 실행)
+            chunk_size: 워커에 한 번에 보낼 기사 수
+        """
+        if workers is None:
+            workers = int(os.getenv("CATEGORY_WORKERS", min(os.cpu_count() or 1, 4)))
+        if chunk_size is None:
+            chunk_size = int(os.getenv("CATEGORY_CHUNK_SIZE", 256))
+
+        self.workers = workers
+        self.chunk_size = max(chunk_size, 1)
+        # 동시에 실행/대기하는 청크 수 (결과가 이보다 많이 쌓이지 않음)
+        self.max_in_flight = max(workers, 1) * 2
+        self._pool = None
+        # 풀을 다시 만들 때마다 증가 (동시에 손상을 감지한 청크가 풀을 여러 번 다시 만들지 않도록)
+        self._generation = 0
+        self._rebuild_lock: Optional[asyncio.Lock] = None
+        self.chunks = 0
+        self.articles = 0
+
+    def start(self):
+        self._rebuild_lock = asyncio.Lock()
+        self._pool = self._create_pool()
+        print(f"[AI] 카테고리 분류 풀 시작: workers={self.workers}, chunk_size={self.chunk_size}")
+
+    def _create_pool(self):
+        if self.workers <= 0:
+            init_worker()
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix="category")
+
+        # fork는 torch 스레드/이벤트 루프 상태까지 복제하므로 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker
+        )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _rebuild(self, generation: int):
+        """손상된 풀 교체 (같은 세대의 풀은 한 번만 다시 만듦)"""
+        async with self._rebuild_lock:
+            if self._generation != generation:
+                return
+            print("[AI] 카테고리 분류 워커 풀이 손상되어 재생성합니다")
+            self.shutdown()
+            self._pool = self._create_pool()
+            self._generation += 1
+
+    async def _run_chunk(self, start: int, articles: List[Tuple[str, str]]) -> List[dict]:
+        loop = asyncio.get_running_loop()
+        generation = self._generation
+        try:
+            return await loop.run_in_executor(self._pool, classify_chunk, start, articles)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 다시 만들고 한 번 재시도
+            await self._rebuild(generation)
+            return await loop.run_in_executor(self._pool, classify_chunk, start, articles)
+
+    async def classify(self, articles: List[Tuple[str, str]]) -> AsyncIterator[List[dict]]:
+        """
+        (제목, 내용) 목록을 청크별로 분류해 입력 순서대로 반환
+        최대 max_in_flight개 청크만 동시에 실행
+        """
+        if self._pool is None:
+            raise RuntimeError("카테고리 분류 풀이 시작되지 않았습니다")
+
+        starts = range(0, len(articles), self.chunk_size)
+        pending = []
+        try:
+            for start in starts:
+                chunk = articles[start:start + self.chunk_size]
+                pending.append(asyncio.ensure_future(self._run_chunk(start, chunk)))
+                if len(pending) >= self.max_in_flight:
+                    yield await self._finish(pending.pop(0))
+
+            while pending:
+                yield await self._finish(pending.pop(0))
+        finally:
+            # 클라이언트가 스트림 도중 끊으면 남은 청크 취소
+            for future in pending:
+                future.cancel()
+
+    async def _finish(self, future) -> List[dict]:
+        results = await future
+        self.chunks += 1
+        self.articles += len(results)
+        return results
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "chunk_size": self.chunk_size,
+            "max_in_flight": self.max_in_flight,
+            "chunks": self.chunks,
+            "pool_restarts": self._generation,
+            "articles": self.articles
+        }
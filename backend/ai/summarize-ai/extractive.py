@@ -0,0 +1,96 @@
+"""
+추출 요약 (TextRank)
+문장끼리 겹치는 글자 bigram으로 문장 그래프를 만들고 PageRank 점수가 높은 문장을 고른다.
+모델 없이 수 밀리초 안에 끝나므로 요약 모델이 밀릴 때의 대체 경로로 쓴다.
+"""
+
+import math
+import re
+from typing import List, Optional, Set
+
+from long_document import split_sentences
+
+WORD_PATTERN = re.compile(r'[가-힣A-Za-z0-9]+')
+
+
+def sentence_features(sentence: str) -> Set[str]:
+    """
+    단어별 글자 bigram 집합
+    (조사가 붙어도 '정책을' / '정책은'이 '정책'을 공유하도록 단어 대신 bigram 사용)
+    """
+    features = set()
+    for word in WORD_PATTERN.findall(sentence):
+        if len(word) == 1:
+            features.add(word)
+        for i in range(len(word) - 1):
+            features.add(word[i:i + 2])
+    return features
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """TextRank 문장 유사도: 공통 특징 수 / (log|a| + log|b|)"""
+    if not a or not b:
+        return 0.0
+    overlap = len(a & b)
+    if not overlap:
+        return 0.0
+    return overlap / (math.log(len(a) + 1) + math.log(len(b) + 1))
+
+
+def textrank_scores(features: List[Set[str]], damping: float = 0.85,
+                    iterations: int = 30, tolerance: float = 1e-4) -> List[float]:
+    """문장 그래프 가중 PageRank 점수"""
+    n = len(features)
+    if n == 0:
+        return []
+
+    weights = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            w = similarity(features[i], features[j])
+            weights[i][j] = weights[j][i] = w
+    out_sums = [sum(row) for row in weights]
+
+    scores = [1.0 / n] * n
+    for _ in range(iterations):
+        updated = []
+        for i in range(n):
+            rank = sum(
+                weights[j][i] / out_sums[j] * scores[j]
+                for j in range(n) if weights[j][i] and out_sums[j]
+            )
+            updated.append((1 - damping) / n + damping * rank)
+        delta = sum(abs(u - s) for u, s in zip(updated, scores))
+        scores = updated
+        if delta < tolerance:
+            break
+    return scores
+
+
+def extract_summary(text: str, max_sentences: int = 3, max_chars: Optional[int] = None,
+                    max_input_sentences: int = 80) -> str:
+    """
+    점수 높은 문장을 max_sentences개(또는 max_chars 글자)까지 골라 원래 순서로 이어 붙임
+    Args:
+        text: clean_text 결과 (문장부호 . ! ? 기준으로 문장 분리)
+        max_input_sentences: 그래프 크기 제한 (긴 기사는 앞쪽 문장만 사용)
+    """
+    sentences = split_sentences(text)[:max_input_sentences]
+    if not sentences:
+        return ""
+
+    scores = textrank_scores([sentence_features(s) for s in sentences])
+    # 점수가 같으면 앞 문장 우선 (기사는 앞부분에 핵심이 오는 경우가 많음)
+    ranked = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))
+
+    selected, length = [], 0
+    for i in ranked[:max(max_sentences, 1)]:
+        if selected and max_chars is not None and length + len(sentences[i]) + 1 > max_chars:
+            break
+        selected.append(i)
+        length += len(sentences[i]) + 1
+
+    summary = " ".join(sentences[i] for i in sorted(selected))
+    if max_chars is not None and len(summary) > max_chars:
+        summary = summary[:max_chars].rstrip() + "..."
+    return summary
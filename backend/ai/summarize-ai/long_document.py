@@ -0,0 +1,47 @@
+"""
+긴 기사 분할 유틸리티
+문장 경계에서 잘라 모델 입력 토큰 수를 넘지 않는 조각으로 묶는다.
+"""
+
+import re
+from typing import List
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 분리 (clean_text 결과 기준: 문장부호 . ! ? 뒤 공백)"""
+    return [s.strip() for s in SENTENCE_SPLIT.split(text or "") if s.strip()]
+
+
+def chunk_sentences(sentences: List[str], tokenizer, max_tokens: int) -> List[str]:
+    """
+    문장을 순서대로 이어 붙여 max_tokens 이하 조각으로 묶음
+    한 문장이 max_tokens보다 길면 그 문장만으로 조각을 만들고 생성 시 잘림
+    """
+    if not sentences:
+        return []
+
+    lengths = [len(ids) for ids in tokenizer(sentences, add_special_tokens=False)["input_ids"]]
+
+    chunks, current, current_tokens = [], [], 0
+    for sentence, length in zip(sentences, lengths):
+        if current and current_tokens + length > max_tokens:
+            chunks.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += length
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def spread_select(items: List[str], limit: int) -> List[str]:
+    """limit개를 넘으면 글 전체에 고르게 퍼지도록 골라냄 (처음과 끝 포함)"""
+    if len(items) <= limit:
+        return items
+    if limit == 1:
+        return items[:1]
+    step = (len(items) - 1) / (limit - 1)
+    return [items[round(i * step)] for i in range(limit)]
@@ -1,22 +1,78 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
-from ai_module import AIModule, category_classifier
+from typing import Dict, List, Optional
+from ai_module import AIModule, MODEL_NAME, category_classifier, model_registry, summarize_extractive, summary_cache
+from admission import AdmissionPolicy
+from backends import SUMMARY_BACKEND
+from batch_scheduler import MicroBatchScheduler
+from category_pool import CategoryPool
+import asyncio
+import json
+import queue
+import threading
+import time
 import uvicorn
 import os
 
 app = FastAPI(title="FANS AI Service", version="1.0.0")
 
-# AI 모듈 초기화
+# AI 모듈 초기화 (요약 모델은 레지스트리에서 공유)
 ai_module = AIModule()
 
+# eager: 시작 직후 모델 로드 + 워밍업, lazy: 첫 요청 때 로드
+MODEL_LOAD_MODE = os.getenv("MODEL_LOAD_MODE", "eager").lower()
+
+def summarize_requests(requests: list) -> list:
+    return ai_module.summarizer.summarize_batch(requests)
+
+# 일괄 요약: 한 번에 받을 최대 기사 수 / 길이 버킷당 기사 수
+MAX_SUMMARY_BATCH = int(os.getenv("MAX_SUMMARY_BATCH", 200))
+SUMMARY_BUCKET_SIZE = int(os.getenv("SUMMARY_BUCKET_SIZE", 16))
+
+# 대기열이 밀리거나 마감 시간 안에 끝나지 못할 요청은 추출 요약으로 처리
+summary_admission = AdmissionPolicy(max_queue_depth=int(os.getenv("SUMMARY_MAX_QUEUE_DEPTH", 32)))
+# 요청에 deadline_ms가 없을 때의 마감 시간
+# 호출 쪽 요청 타임아웃(api localAIService 10초)보다 충분히 짧아야 마감 초과 시 추출 요약을 계산해
+# 타임아웃 전에 돌려줄 수 있음 (마감 + 추출 요약 시간 < 클라이언트 타임아웃)
+SUMMARY_DEADLINE_MS = int(os.getenv("SUMMARY_DEADLINE_MS", 7000))
+
+def summarize_observed(requests: list) -> list:
+    """배치 처리 시간을 수락 정책에 기록"""
+    started = time.perf_counter()
+    try:
+        return summarize_requests(requests)
+    finally:
+        summary_admission.observe(time.perf_counter() - started)
+
+# 동시 요약 요청을 모아 한 번에 생성
+summary_scheduler = MicroBatchScheduler(
+    summarize_observed,
+    max_batch_size=int(os.getenv("SUMMARY_BATCH_SIZE", 8)),
+    max_wait_ms=float(os.getenv("SUMMARY_BATCH_WAIT_MS", 20))
+)
+
 class SummarizeRequest(BaseModel):
     text: str
     max_length: int = 40
+    deadline_ms: Optional[int] = None
 
 class SummarizeResponse(BaseModel):
     summary: str
     length: int
+    tier: str = "abstractive"
+    # 긴 기사에서 일부 조각만 반영했거나 reduce 없이 이어 붙인 요약
+    partial: bool = False
+
+class BatchSummarizeArticle(BaseModel):
+    id: Optional[int] = None
+    title: Optional[str] = ""
+    text: str
+
+class BatchSummarizeRequest(BaseModel):
+    articles: List[BatchSummarizeArticle]
+    max_length: int = 40
+    stream: bool = False
 
 class CategoryRequest(BaseModel):
     title: str
@@ -25,9 +81,40 @@ class CategoryRequest(BaseModel):
 class CategoryResponse(BaseModel):
     category: str
     title: str
+    confidence: Optional[float] = None
+    scores: Dict[str, float] = {}
+    method: str = "keyword"
 
 class BatchCategoryRequest(BaseModel):
     articles: List[dict]
+    stream: bool = False
+
+class LabeledArticle(BaseModel):
+    id: Optional[int] = None  # raw_news_articles.id (있으면 학습 위치 last_article_id를 옮김)
+    title: str
+    content: Optional[str] = ""
+    category: str
+
+class CategoryUpdateRequest(BaseModel):
+    articles: List[LabeledArticle]
+
+# 큰 카테고리 일괄 분류는 워커 프로세스 풀에서 청크 단위로 처리
+category_pool = CategoryPool()
+
+@app.on_event("startup")
+async def startup_event():
+    summary_scheduler.start()
+    category_pool.start()
+    if MODEL_LOAD_MODE == "eager":
+        # 모델 스레드에서 로드 (요청은 로드가 끝난 뒤 순서대로 처리)
+        asyncio.create_task(summary_scheduler.run(model_registry.load_all))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await summary_scheduler.stop()
+    category_pool.shutdown()
+    category_classifier.flush()
+    summary_cache.close()
 
 @app.get("/health")
 def health_check():
@@ -35,40 +122,276 @@ def health_check():
     return {
         "status": "healthy",
         "service": "ai-service",
-        "model": "eenzeenee/t5-base-korean-summarization"
+        "model": MODEL_NAME,
+        "backend": SUMMARY_BACKEND,
+        "batching": summary_scheduler.stats(),
+        "admission": summary_admission.stats(),
+        "category_pool": category_pool.stats()
     }
 
+@app.get("/ai/summarize/cache/stats")
+def summary_cache_stats():
+    """요약 캐시 적중/미스/제거 통계"""
+    return {
+        "decoding": os.getenv("SUMMARY_DECODING", "greedy"),
+        **summary_cache.stats()
+    }
+
+@app.get("/ready")
+def readiness_check():
+    """모델 로드 + 워밍업 완료 여부 (모델별 로드 시간, 메모리 포함)"""
+    status = model_registry.status()
+    if status["ready"]:
+        state = "ready"
+    elif MODEL_LOAD_MODE == "lazy" and not status["attempted"]:
+        # lazy 모드에서 첫 요청 전: 다른 서비스가 이 헬스체크를 기다렸다가 첫 요청을 보내므로 200으로 응답
+        # (첫 로드를 시도한 뒤에는 실제 상태를 보고해 로드 실패가 HEALTHCHECK에 드러남)
+        state = "lazy"
+    elif any(model["error"] for model in status["models"].values()):
+        state = "error"
+    else:
+        state = "loading"
+    return JSONResponse(
+        status_code=200 if state in ("ready", "lazy") else 503,
+        content={"status": state, "load_mode": MODEL_LOAD_MODE, **status}
+    )
+
+def admit_summary(deadline_ms: Optional[int]) -> bool:
+    """모델 요약을 기다려도 되는지 (대기열 길이 / 마감 시간 대비 예상 처리 시간)"""
+    admitted, _ = summary_admission.admit(
+        summary_scheduler.queue_depth,
+        summary_scheduler.max_batch_size,
+        (deadline_ms or SUMMARY_DEADLINE_MS) / 1000.0,
+        jobs_pending=summary_scheduler.jobs_pending
+    )
+    return admitted
+
+async def run_extractive(text: str, max_length: int) -> dict:
+    return await asyncio.get_running_loop().run_in_executor(None, summarize_extractive, "", text, max_length)
+
 @app.post("/ai/summarize", response_model=SummarizeResponse)
-def summarize_text(request: SummarizeRequest):
-    """텍스트 AI 요약 생성"""
+async def summarize_text(request: SummarizeRequest):
+    """
+    텍스트 AI 요약 생성 (동시 요청은 배치로 묶어 생성)
+    모델이 밀려 마감 시간 안에 끝나지 못하면 추출 요약 반환 (tier로 구분)
+    """
     try:
-        summary = ai_module.summarize(request.text, max_length=request.max_length)
+        result = None
+        if admit_summary(request.deadline_ms):
+            deadline = (request.deadline_ms or SUMMARY_DEADLINE_MS) / 1000.0
+            try:
+                result = await asyncio.wait_for(
+                    summary_scheduler.submit(("", request.text, request.max_length)), timeout=deadline
+                )
+            except asyncio.TimeoutError:
+                summary_admission.record_timeout()
+
+        if result is None:
+            result = await run_extractive(request.text, request.max_length)
+        summary = result["summary"]
 
         return SummarizeResponse(
             summary=summary,
-            length=len(summary)
+            length=len(summary),
+            tier=result.get("tier", "abstractive"),
+            partial=result.get("partial", False)
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI 요약 생성 실패: {str(e)}")
 
+def batch_item(request: BatchSummarizeRequest, index: int, result: dict) -> dict:
+    item = {
+        "index": index,
+        "id": request.articles[index].id,
+        "summary": result["summary"],
+        "length": len(result["summary"]),
+        "success": result.get("success", False),
+        "tier": result.get("tier", "abstractive"),
+        "partial": result.get("partial", False)
+    }
+    if "error" in result:
+        item["error"] = result["error"]
+    return item
+
+def fallback_results(requests: list, error: Exception) -> list:
+    """실패한 기사는 추출 요약 + success=false (NewsAISummarizer.fallback_result와 같은 형식)"""
+    return [
+        {**summarize_extractive(title, text, max_length), "success": False, "error": str(error)}
+        for title, text, max_length in requests
+    ]
+
+async def summarize_in_buckets(request: BatchSummarizeRequest):
+    """
+    길이 버킷마다 배치 생성 후 (원래 인덱스, 결과) 목록을 차례로 반환
+    버킷 하나가 실패해도 그 기사들만 추출 요약 + success=false, error로 반환하고 다음 버킷을 계속 처리
+    """
+    requests = [(a.title or "", a.text, request.max_length) for a in request.articles]
+    loop = asyncio.get_running_loop()
+    try:
+        summarizer = await summary_scheduler.run(lambda: ai_module.summarizer)
+        buckets = await summary_scheduler.run(summarizer.length_buckets, requests, SUMMARY_BUCKET_SIZE)
+    except Exception as e:
+        print(f"[AI] 일괄 요약 준비 실패: {e}")
+        yield [
+            batch_item(request, i, result)
+            for i, result in enumerate(await loop.run_in_executor(None, fallback_results, requests, e))
+        ]
+        return
+
+    for bucket in buckets:
+        bucket_requests = [requests[i] for i in bucket]
+        try:
+            results = await summary_scheduler.run(summarizer.summarize_batch, bucket_requests)
+        except Exception as e:
+            print(f"[AI] 일괄 요약 버킷 실패 ({len(bucket)}개): {e}")
+            results = await loop.run_in_executor(None, fallback_results, bucket_requests, e)
+        yield [batch_item(request, i, result) for i, result in zip(bucket, results)]
+
+@app.post("/ai/summarize/batch")
+async def summarize_batch(request: BatchSummarizeRequest):
+    """
+    여러 기사 일괄 요약 (입력 길이가 비슷한 기사끼리 버킷으로 묶어 생성)
+    stream=true면 버킷이 끝날 때마다 NDJSON 한 줄씩 결과 전송 (index로 원래 순서 확인)
+    """
+    if len(request.articles) > MAX_SUMMARY_BATCH:
+        raise HTTPException(
+            status_code=413,
+            detail=f"배치 크기 초과: {len(request.articles)} > {MAX_SUMMARY_BATCH}"
+        )
+
+    if request.stream:
+        async def stream_results():
+            async for bucket_results in summarize_in_buckets(request):
+                for item in bucket_results:
+                    yield json.dumps(item, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    try:
+        results = [None] * len(request.articles)
+        async for bucket_results in summarize_in_buckets(request):
+            for item in bucket_results:
+                results[item["index"]] = item
+
+        return {
+            "success": True,
+            "count": len(results),
+            "results": results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"일괄 요약 생성 실패: {str(e)}")
+
+def sse_event(data: dict, event: Optional[str] = None) -> str:
+    """server-sent events 메시지 형식"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+# 스트리밍 중 토큰이 없을 때(긴 기사 map 단계 등) 클라이언트 연결을 확인하는 간격(초)
+STREAM_POLL_SECONDS = 1.0
+
+def next_token(tokens) -> Optional[str]:
+    """다음 토큰 (스트림 끝이면 None, STREAM_POLL_SECONDS 동안 토큰이 없으면 빈 문자열)"""
+    try:
+        return next(tokens, None)
+    except queue.Empty:
+        return ""
+
+def log_abandoned_generation(future: asyncio.Future):
+    """스트림이 닫힌 뒤 끝난 생성 작업의 예외 확인 (버려진 future의 예외가 조용히 사라지지 않도록)"""
+    if not future.cancelled() and future.exception() is not None:
+        print(f"[AI] 스트리밍 요약 생성 실패 (연결 종료 후): {future.exception()}")
+
+@app.post("/ai/summarize/stream")
+async def summarize_stream(request: SummarizeRequest, http_request: Request):
+    """
+    요약을 생성되는 대로 토큰 단위로 전송 (SSE)
+    - data: {"token": ...} 반복 후 event: done 으로 전체 요약 전송
+    - 클라이언트가 연결을 끊으면 생성을 중단해 모델 스레드를 비움
+    - 모델이 밀려 있으면 추출 요약을 done 이벤트 하나로 전송
+    """
+    if not admit_summary(request.deadline_ms):
+        result = await run_extractive(request.text, request.max_length)
+        done = sse_event(
+            {"summary": result["summary"], "length": len(result["summary"]), "tier": result["tier"]},
+            event="done"
+        )
+        return StreamingResponse(iter([done]), media_type="text/event-stream")
+
+    summarizer = await summary_scheduler.run(lambda: ai_module.summarizer)
+    if not summarizer.summarizer:
+        raise HTTPException(status_code=503, detail="AI 모델을 사용할 수 없습니다.")
+    streamer = summarizer.create_streamer(timeout=STREAM_POLL_SECONDS)
+    cancel_event = threading.Event()
+    generation = asyncio.ensure_future(summary_scheduler.run(
+        summarizer.stream_summary, "", request.text, request.max_length, streamer, cancel_event
+    ))
+
+    async def event_stream():
+        loop = asyncio.get_running_loop()
+        tokens = iter(streamer)
+        try:
+            while True:
+                token = await loop.run_in_executor(None, next_token, tokens)
+                if token is None:
+                    break
+                if await http_request.is_disconnected():
+                    # 생성을 중단하고 모델 스레드에서 끝날 때까지 기다림
+                    # (map 배치 사이/디코딩 중에 멈추고, 아직 대기 중이던 작업은 시작하자마자 반환)
+                    cancel_event.set()
+                    try:
+                        await generation
+                    except Exception as e:
+                        print(f"[AI] 스트리밍 요약 중단 중 오류: {e}")
+                    return
+                if token:
+                    yield sse_event({"token": token})
+
+            summary = await generation
+            yield sse_event({"summary": summary, "length": len(summary), "tier": "abstractive"}, event="done")
+        except Exception as e:
+            yield sse_event({"detail": f"AI 요약 생성 실패: {str(e)}"}, event="error")
+        finally:
+            # 연결이 끊겨 스트림이 닫혀도 생성 중단 (여기서는 await할 수 없으므로 결과/예외는 콜백에서 확인)
+            cancel_event.set()
+            if not generation.done():
+                generation.add_done_callback(log_abandoned_generation)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/ai/classify-category", response_model=CategoryResponse)
 def classify_category(request: CategoryRequest):
     """뉴스 기사 카테고리 분류"""
     try:
-        category = category_classifier.classify(request.title, request.content)
+        result = category_classifier.classify_with_scores(request.title, request.content)
 
-        return CategoryResponse(
-            category=category,
-            title=request.title
-        )
+        return CategoryResponse(title=request.title, **result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"카테고리 분류 실패: {str(e)}")
 
 @app.post("/ai/classify-batch")
-def classify_batch(request: BatchCategoryRequest):
-    """여러 기사 일괄 카테고리 분류"""
+async def classify_batch(request: BatchCategoryRequest):
+    """
+    여러 기사 일괄 카테고리 분류 (청크 단위로 워커 프로세스에서 병렬 처리)
+    결과마다 index(입력 순서), confidence, matched_keywords 포함
+    stream=true면 청크가 끝나는 대로 NDJSON 한 줄씩 입력 순서대로 전송
+    """
+    articles = [(a.get('title', '') or '', a.get('content', '') or '') for a in request.articles]
+
+    if request.stream:
+        async def stream_results():
+            async for chunk_results in category_pool.classify(articles):
+                yield "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in chunk_results)
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
     try:
-        results = category_classifier.classify_batch(request.articles)
+        results = []
+        async for chunk_results in category_pool.classify(articles):
+            results.extend(chunk_results)
 
         return {
             "success": True,
@@ -78,6 +401,31 @@ def classify_batch(request: BatchCategoryRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"일괄 분류 실패: {str(e)}")
 
+@app.post("/ai/category/update")
+def update_category_model(request: CategoryUpdateRequest):
+    """
+    라벨이 있는 기사로 카테고리 모델 이어서 학습 (partial_fit)
+    category는 언론사 카테고리명도 가능 (서비스 카테고리로 변환되지 않으면 제외)
+    id가 last_article_id 이하인 기사는 이미 학습했으므로 건너뜀 (스케줄러 updateCategoryModel이 호출)
+    """
+    try:
+        return {
+            "success": True,
+            **category_classifier.update([article.model_dump() for article in request.articles])
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"카테고리 모델 학습 실패: {str(e)}")
+
+@app.post("/ai/category/reload")
+def reload_category_model():
+    """학습 스크립트가 저장한 카테고리 모델 다시 로드"""
+    category_classifier.reload()
+    return category_classifier.status()
+
+@app.get("/ai/category/status")
+def category_model_status():
+    return category_classifier.status()
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+모델 레지스트리
+모델마다 한 번만 로드해 서비스 전체에서 공유하고,
+로드/워밍업 시간과 메모리 사용량을 준비 상태(/ready)로 보여준다.
+"""
+
+import os
+import resource
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def current_rss_bytes() -> int:
+    """현재 프로세스 상주 메모리 (리눅스는 /proc, 그 외는 최대 RSS)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class ModelEntry:
+    """등록된 모델 하나의 상태"""
+
+    def __init__(self, name: str, loader: Callable[[], Any], warmup: Optional[Callable[[Any], None]]):
+        self.name = name
+        self.loader = loader
+        self.warmup = warmup
+        self.instance = None
+        self.attempted = False
+        self.ready = False
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.rss_bytes: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def status(self) -> dict:
+        return {
+            "loaded": self.instance is not None,
+            "ready": self.ready,
+            "load_seconds": round(self.load_seconds, 2) if self.load_seconds is not None else None,
+            "warmup_seconds": round(self.warmup_seconds, 2) if self.warmup_seconds is not None else None,
+            "rss_mb": round(self.rss_bytes / 1024 / 1024, 1) if self.rss_bytes is not None else None,
+            "error": self.error
+        }
+
+
+class ModelRegistry:
+    """이름별 모델 공유 레지스트리 (처음 요청될 때 또는 load_all()로 로드)"""
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any],
+                 warmup: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            loader: 모델 객체를 만드는 함수
+            warmup: 로드 직후 한 번 실행할 함수 (실패하면 준비 안 됨으로 표시)
+        """
+        self._entries[name] = ModelEntry(name, loader, warmup)
+
+    def get(self, name: str) -> Any:
+        """모델 반환 (아직 로드 전이면 로드 + 워밍업)"""
+        entry = self._entries[name]
+        if entry.instance is None:
+            with entry.lock:
+                if entry.instance is None:
+                    self._load(entry)
+        return entry.instance
+
+    def _load(self, entry: ModelEntry):
+        entry.attempted = True
+        entry.error = None
+        rss_before = current_rss_bytes()
+        started = time.perf_counter()
+        try:
+            instance = entry.loader()
+        except Exception as e:
+            entry.error = str(e)
+            raise
+        entry.load_seconds = time.perf_counter() - started
+
+        if entry.warmup is not None:
+            started = time.perf_counter()
+            try:
+                entry.warmup(instance)
+                entry.ready = True
+            except Exception as e:
+                entry.error = str(e)
+                print(f"[AI] 모델 워밍업 실패 ({entry.name}): {e}")
+            entry.warmup_seconds = time.perf_counter() - started
+        else:
+            entry.ready = True
+
+        # 로드 + 워밍업 동안 늘어난 상주 메모리
+        entry.rss_bytes = max(current_rss_bytes() - rss_before, 0)
+        entry.instance = instance
+        print(f"[AI] 모델 준비: {entry.name} ({entry.load_seconds:.1f}초, ready={entry.ready})")
+
+    def load_all(self):
+        """등록된 모델 전부 미리 로드 (eager 모드)"""
+        for name in self._entries:
+            self.get(name)
+
+    def is_ready(self) -> bool:
+        return all(entry.ready for entry in self._entries.values())
+
+    def attempted(self) -> bool:
+        """한 번이라도 로드를 시도한 모델이 있는지 (lazy 모드에서 첫 요청 전인지 구분)"""
+        return any(entry.attempted for entry in self._entries.values())
+
+    def status(self) -> dict:
+        return {
+            "ready": self.is_ready(),
+            "attempted": self.attempted(),
+            "rss_mb": round(current_rss_bytes() / 1024 / 1024, 1),
+            "models": {name: entry.status() for name, entry in self._entries.items()}
+        }
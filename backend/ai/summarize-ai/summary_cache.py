@@ -0,0 +1,204 @@
+"""
+FANS 요약 결과 캐시
+정규화한 본문 해시 + 모델 + 디코딩 설정 + 생성 길이를 키로 하는 2단 캐시
+(재수집/전재 기사는 다시 생성하지 않음, 결정적 디코딩일 때만 사용)
+- 메모리: 크기 제한 LRU
+- 디스크: SQLite (선택, 재시작 후에도 유지)
+  조회는 모델 스레드에서 키 하나씩 하고, 쓰기는 백그라운드 스레드가 모아서 한 번에 커밋
+  (모델 스레드가 요약마다 SQLite 커밋을 기다리지 않도록)
+bias-analysis-ai의 result_cache.py와 구조가 같지만 서비스마다 도커 빌드 컨텍스트가 달라
+모듈을 공유하지 않는다 (lexicon_matcher.py와 같은 방식). 한쪽을 고치면 다른 쪽도 확인할 것.
+"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Optional
+
+# 디스크 쓰기 배치: 최대 항목 수 / 첫 항목 이후 최대 대기 시간(초)
+WRITE_BATCH_SIZE = 256
+WRITE_BATCH_WAIT = 0.2
+_STOP = object()
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화 (유니코드 NFC + 공백 정리, 요약 입력은 clean_text로 이미 공백이 정리된 텍스트)"""
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+
+def make_summary_key(text: str, model_id: str, decoding: dict, max_length: int, min_length: int) -> str:
+    """모델, 디코딩 설정, 생성 길이, 정규화 본문으로 캐시 키 생성"""
+    params = json.dumps(decoding, sort_keys=True)
+    payload = f"{model_id}\0{params}\0{max_length}\0{min_length}\0{normalize_text(text)}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SummaryCache:
+    """LRU 메모리 계층 + SQLite 디스크 계층 요약 캐시"""
+
+    def __init__(self, max_entries: int = 2048, db_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: 메모리에 보관할 최대 항목 수 (0이면 메모리 계층 비활성)
+            db_path: SQLite 파일 경로 (None/빈 문자열이면 디스크 계층 비활성)
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path or None
+
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 읽기용 연결 (쓰기는 _writer 스레드가 자기 연결로 수행)
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_writes = 0
+        # 디스크 항목 수 근사치 (시작할 때 한 번 세고 이후 쓰기 스레드가 새로 추가한 행만큼 더함)
+        self.disk_entries: Optional[int] = None
+
+        if self.db_path:
+            self._open_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _open_db(self):
+        try:
+            self._db = self._connect()
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS summary_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._db.commit()
+            self._writer = threading.Thread(target=self._write_loop, name="summary-cache-writer", daemon=True)
+            self._writer.start()
+            print(f"[AI] 요약 디스크 캐시 사용: {self.db_path}")
+        except sqlite3.Error as e:
+            print(f"[AI] 요약 디스크 캐시 열기 실패, 메모리 캐시만 사용: {e}")
+            self._db = None
+
+    def _write_loop(self):
+        """대기 중인 쓰기를 모아 executemany + 커밋 한 번으로 저장"""
+        conn = self._connect()
+        try:
+            self.disk_entries = conn.execute("SELECT COUNT(*) FROM summary_cache").fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"[AI] 요약 디스크 캐시 항목 수 확인 실패: {e}")
+        stopping = False
+        while not stopping:
+            batch = [self._writes.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WAIT
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._writes.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+
+            rows = [item for item in batch if item is not _STOP]
+            stopping = len(rows) < len(batch)
+            if not rows:
+                continue
+            try:
+                keys = list({key for key, _, _ in rows})
+                existing = conn.execute(
+                    f"SELECT COUNT(*) FROM summary_cache WHERE key IN ({','.join('?' * len(keys))})", keys
+                ).fetchone()[0]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO summary_cache (key, value, created_at) VALUES (?, ?, ?)", rows
+                )
+                conn.commit()
+                self.disk_writes += len(rows)
+                if self.disk_entries is not None:
+                    self.disk_entries += len(keys) - existing
+            except sqlite3.Error as e:
+                print(f"[AI] 요약 디스크 캐시 저장 실패 ({len(rows)}건): {e}")
+        conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """조회 (모델 스레드에서 호출, 이벤트 루프에서 직접 호출하지 않음)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+        value = None
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute("SELECT value FROM summary_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self._remember(key, value)
+                self.disk_hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """메모리에 저장하고 디스크 쓰기는 백그라운드 스레드에 맡김 (블로킹 없음)"""
+        with self._lock:
+            self._remember(key, value)
+
+        if self._writer is not None:
+            self._writes.put((key, json.dumps(value, ensure_ascii=False), time.time()))
+
+    def _remember(self, key: str, value: Any):
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """카운터만 복사 (DB 조회 없이, 모델 스레드의 조회를 막지 않음)"""
+        with self._lock:
+            memory_entries = len(self._memory)
+            memory_hits, disk_hits, misses = self.memory_hits, self.disk_hits, self.misses
+            evictions = self.evictions
+
+        lookups = memory_hits + disk_hits + misses
+        return {
+            "memory_entries": memory_entries,
+            "max_entries": self.max_entries,
+            "disk_enabled": self._db is not None,
+            "disk_entries": self.disk_entries if self._db is not None else None,
+            "memory_hits": memory_hits,
+            "disk_hits": disk_hits,
+            "misses": misses,
+            "evictions": evictions,
+            "disk_writes": self.disk_writes,
+            "pending_writes": self._writes.qsize(),
+            "hit_rate": round((memory_hits + disk_hits) / lookups, 4) if lookups else 0.0
+        }
+
+    def close(self):
+        """대기 중인 쓰기를 모두 저장한 뒤 닫음"""
+        if self._writer is not None:
+            self._writes.put(_STOP)
+            self._writer.join(timeout=10)
+            self._writer = None
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,120 @@
+"""
+FANS 카테고리 분류 모델 학습 스크립트
+raw_news_articles.original_category(언론사 페이지에서 파싱한 카테고리)를 정답으로
+HashingVectorizer + SGDClassifier를 청크 단위 partial_fit으로 학습한다.
+
+- 기사 전체를 메모리에 올리지 않고 서버 측 커서로 청크씩 읽음
+- 저장된 모델이 있으면 마지막으로 학습한 기사 id 다음부터 이어서 학습
+- 정확도는 청크마다 학습 전에 먼저 예측해 보는 방식(progressive validation)으로 측정
+- 그 held-out 예측 중 최근 기사들로 확률 보정 온도를 맞추고 보정 전/후 ECE를 출력
+
+사용법:
+    python train_category_classifier.py            # 새 기사로 이어서 학습
+    python train_category_classifier.py --reset    # 처음부터 다시 학습
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+
+import numpy as np
+import psycopg2
+
+from category_classifier import (
+    DEFAULT_MODEL_PATH, LinearCategoryClassifier, article_text, normalize_category
+)
+
+
+def get_db_connection():
+    """PostgreSQL 데이터베이스 연결"""
+    return psycopg2.connect(
+        host=os.getenv('DB_HOST', 'postgres'),
+        port=int(os.getenv('DB_PORT', 5432)),
+        user=os.getenv('POSTGRES_USER', 'fans_user'),
+        password=os.getenv('POSTGRES_PASSWORD', 'fans_password'),
+        database=os.getenv('POSTGRES_DB', 'fans_db')
+    )
+
+
+def iter_labeled_chunks(conn, after_id: int, chunk_size: int):
+    """id 순서로 라벨이 있는 기사를 chunk_size개씩 반환"""
+    # 이름 있는 커서: 결과를 서버에 두고 itersize만큼씩 가져옴
+    with conn.cursor(name="category_training") as cursor:
+        cursor.itersize = chunk_size
+        cursor.execute("""
+            SELECT id, title, content, original_category
+            FROM raw_news_articles
+            WHERE id > %s AND original_category IS NOT NULL
+            ORDER BY id
+        """, (after_id,))
+
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+
+
+def train(model_path: str, chunk_size: int = 1000, reset: bool = False,
+          calibration_samples: int = 5000) -> LinearCategoryClassifier:
+    linear = None if reset else LinearCategoryClassifier.load(model_path)
+    if linear is None:
+        linear = LinearCategoryClassifier()
+    print(f"📚 학습 시작: {linear.last_article_id}번 기사 이후 (기존 학습 {linear.trained_samples}건)")
+
+    started = time.time()
+    correct, evaluated, skipped = 0, 0, 0
+    # 보정용 held-out 예측 (학습 전 점수, 정답) - 현재 모델에 가까운 최근 기사만 유지
+    held_out = deque(maxlen=calibration_samples)
+
+    conn = get_db_connection()
+    try:
+        for rows in iter_labeled_chunks(conn, linear.last_article_id, chunk_size):
+            texts = [article_text(title, content) for _, title, content, _ in rows]
+            labels = [normalize_category(label) for _, _, _, label in rows]
+
+            # 학습 전에 먼저 예측해 정확도 측정
+            known = [i for i, label in enumerate(labels) if label is not None]
+            if linear.is_trained and known:
+                scores = linear.decision_scores([texts[i] for i in known])
+                predicted = np.asarray(linear.classes)[scores.argmax(axis=1)]
+                correct += int(sum(p == labels[i] for p, i in zip(predicted, known)))
+                evaluated += len(known)
+                held_out.extend(zip(scores, (labels[i] for i in known)))
+
+            used = linear.partial_fit(texts, labels)
+            skipped += len(rows) - used
+            linear.last_article_id = rows[-1][0]
+
+            accuracy = f"{correct / evaluated:.3f}" if evaluated else "-"
+            print(f"  ~{linear.last_article_id}번: 학습 {used}건, 누적 {linear.trained_samples}건, 정확도 {accuracy}")
+    finally:
+        conn.close()
+
+    if held_out:
+        report = linear.calibrate(np.vstack([score for score, _ in held_out]), [label for _, label in held_out])
+        if report:
+            print(
+                f"🎯 확률 보정: 온도 {report['temperature']}, 기사 {report['samples']}건, "
+                f"ECE {report['ece_before']} -> {report['ece_after']}, NLL {report['nll_before']} -> {report['nll_after']}"
+            )
+        else:
+            print(f"⚠️ held-out 기사 {len(held_out)}건으로는 보정하지 않음 (기존 온도 유지: {getattr(linear, 'temperature', None)})")
+
+    linear.save(model_path)
+    print(f"✅ 저장 완료: {model_path} ({time.time() - started:.1f}초, 라벨 변환 불가 {skipped}건 제외)")
+    return linear
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="언론사 카테고리 라벨로 카테고리 분류 모델 학습")
+    parser.add_argument("--model-path", default=os.getenv("CATEGORY_MODEL_PATH", DEFAULT_MODEL_PATH))
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--reset", action="store_true", help="저장된 모델을 무시하고 처음부터 학습")
+    parser.add_argument("--calibration-samples", type=int, default=5000,
+                        help="확률 보정에 쓰는 최근 held-out 기사 수")
+    args = parser.parse_args()
+
+    train(args.model_path, chunk_size=args.chunk_size, reset=args.reset,
+          calibration_samples=args.calibration_samples)
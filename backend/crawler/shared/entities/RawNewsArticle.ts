@@ -40,6 +40,16 @@ export class RawNewsArticle {
     @Column({ type: 'text', nullable: true, name: 'processing_error' })
     processingError?: string;
 
+    // 워커 선점 임대 (simple-classifier가 FOR UPDATE SKIP LOCKED로 선점)
+    @Column({ type: 'varchar', length: 100, nullable: true, name: 'claimed_by' })
+    claimedBy?: string;
+
+    @Column({ type: 'timestamptz', nullable: true, name: 'lease_expires_at' })
+    leaseExpiresAt?: Date;
+
+    @Column({ type: 'int', default: 0, name: 'claim_attempts' })
+    claimAttempts!: number;
+
     @CreateDateColumn({ type: 'timestamptz', name: 'created_at' })
     createdAt!: Date;
 
@@ -9,6 +9,9 @@ export class Source {
     @Column({ type: 'varchar', length: 100, unique: true })
     name!: string;
 
+    @Column({ type: 'text', array: true, default: () => "'{}'" })
+    aliases!: string[];
+
     @Column({ type: 'varchar', length: 500, nullable: true })
     logo_url?: string;
 
@@ -49,6 +49,7 @@ CREATE TABLE users (
 CREATE TABLE sources (
     id INTEGER PRIMARY KEY, -- OID를 직접 사용
     name VARCHAR(100) NOT NULL UNIQUE,
+    aliases TEXT[] NOT NULL DEFAULT '{}', -- 원본 언론사명 매칭용 별칭 (simple-classifier)
     logo_url VARCHAR(500)
 );
 
@@ -438,6 +439,11 @@ CREATE TABLE raw_news_articles (
     processed_at TIMESTAMPTZ,
     processing_error TEXT,
 
+    -- 워커 선점 임대 (FOR UPDATE SKIP LOCKED)
+    claimed_by VARCHAR(100),
+    lease_expires_at TIMESTAMPTZ,
+    claim_attempts INTEGER NOT NULL DEFAULT 0,
+
     -- 타임스탬프
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
@@ -447,6 +453,7 @@ CREATE TABLE raw_news_articles (
 CREATE INDEX idx_raw_news_processed ON raw_news_articles(processed);
 CREATE INDEX idx_raw_news_created_at ON raw_news_articles(created_at DESC);
 CREATE INDEX idx_raw_news_url ON raw_news_articles(url);
+CREATE INDEX idx_raw_news_claimable ON raw_news_articles(created_at) WHERE processed = FALSE;
 
 -- Raw News Articles updated_at 트리거
 CREATE TRIGGER trigger_raw_news_updated
@@ -659,23 +666,34 @@ INSERT INTO categories (name) VALUES
     ('IT/과학'), ('세계'), ('스포츠'), ('연예')
 ON CONFLICT (name) DO NOTHING;
 
--- 14개 타겟 언론사 (OID 기반) + 기타
-INSERT INTO sources (id, name) VALUES
-    (001, '연합뉴스'),
-    (020, '동아일보'),
-    (021, '문화일보'),
-    (022, '세계일보'),
-    (023, '조선일보'),
-    (025, '중앙일보'),
-    (028, '한겨레'),
-    (032, '경향신문'),
-    (055, '한국일보'),
-    (056, '매일경제'),
-    (214, '한국경제'),
-    (421, '머니투데이'),
-    (437, 'YTN'),
-    (448, 'JTBC'),
-    (449, '기타')
+-- 14개 타겟 언론사 (OID 기반) + 기타 + 추가 주요 언론사 (450-460)
+INSERT INTO sources (id, name, aliases) VALUES
+    (001, '연합뉴스', '{}'),
+    (020, '동아일보', '{}'),
+    (021, '문화일보', '{}'),
+    (022, '세계일보', '{}'),
+    (023, '조선일보', '{}'),
+    (025, '중앙일보', '{}'),
+    (028, '한겨레', '{한겨레신문}'),
+    (032, '경향신문', '{}'),
+    (055, '한국일보', '{}'),
+    (056, '매일경제', '{매경}'),
+    (214, '한국경제', '{한국경제신문,한경}'),
+    (421, '머니투데이', '{}'),
+    (437, 'YTN', '{}'),
+    (448, 'JTBC', '{}'),
+    (449, '기타', '{}'),
+    (450, '전자신문', '{}'),
+    (451, '파이낸셜뉴스', '{파이낸셜신문,fnnews}'),
+    (452, '헤럴드경제', '{}'),
+    (453, '서울경제', '{}'),
+    (454, 'KBS', '{}'),
+    (455, 'SBS', '{}'),
+    (456, '아시아경제', '{}'),
+    (457, '디지털타임스', '{}'),
+    (458, 'MBC', '{}'),
+    (459, '대전일보', '{}'),
+    (460, '부산일보', '{}')
 ON CONFLICT (id) DO NOTHING;
 
 -- 초기 증시 샘플 데이터 (실제 API 연동 전까지 사용)
@@ -0,0 +1,19 @@
+-- Raw News Articles 선점(claim) 임대 컬럼
+-- 여러 simple-classifier 워커가 FOR UPDATE SKIP LOCKED로 미처리 기사를 나눠 선점하고,
+-- 처리 중 워커가 죽으면 임대 만료 후 다른 워커가 다시 선점한다.
+
+-- 1. 임대 컬럼 추가
+ALTER TABLE raw_news_articles
+    ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE,
+    ADD COLUMN IF NOT EXISTS claim_attempts INTEGER NOT NULL DEFAULT 0;
+
+-- 2. 선점 쿼리용 인덱스 (미처리 기사만, 오래된 순)
+CREATE INDEX IF NOT EXISTS idx_raw_news_claimable
+    ON raw_news_articles(created_at)
+    WHERE processed = FALSE;
+
+-- 3. 코멘트 추가
+COMMENT ON COLUMN raw_news_articles.claimed_by IS '기사를 선점한 워커 ID (처리 완료/실패 시 NULL)';
+COMMENT ON COLUMN raw_news_articles.lease_expires_at IS '선점 임대 만료 시각 (지나면 다른 워커가 다시 선점 가능)';
+COMMENT ON COLUMN raw_news_articles.claim_attempts IS '선점 횟수 (CLAIM_MAX_ATTEMPTS 이상이면 더 이상 선점하지 않음)';
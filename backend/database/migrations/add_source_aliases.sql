@@ -0,0 +1,31 @@
+-- 언론사 별칭(aliases) 컬럼
+-- simple-classifier가 sources.name / aliases를 주기적으로 읽어 크롤링한 원본 언론사명을 source_id로 변환한다.
+-- 새 언론사나 표기가 다른 이름은 이 테이블에 추가하면 재배포 없이 반영된다 (SOURCE_CACHE_TTL 이내).
+
+-- 1. 별칭 컬럼 추가
+ALTER TABLE sources
+    ADD COLUMN IF NOT EXISTS aliases TEXT[] NOT NULL DEFAULT '{}';
+
+-- 2. simple-classifier SOURCE_MAP에만 있던 언론사 (450-460)
+INSERT INTO sources (id, name) VALUES
+    (450, '전자신문'),
+    (451, '파이낸셜뉴스'),
+    (452, '헤럴드경제'),
+    (453, '서울경제'),
+    (454, 'KBS'),
+    (455, 'SBS'),
+    (456, '아시아경제'),
+    (457, '디지털타임스'),
+    (458, 'MBC'),
+    (459, '대전일보'),
+    (460, '부산일보')
+ON CONFLICT (id) DO NOTHING;
+
+-- 3. 기본 별칭
+UPDATE sources SET aliases = ARRAY['한겨레신문'] WHERE id = 28 AND aliases = '{}';
+UPDATE sources SET aliases = ARRAY['매경'] WHERE id = 56 AND aliases = '{}';
+UPDATE sources SET aliases = ARRAY['한국경제신문', '한경'] WHERE id = 214 AND aliases = '{}';
+UPDATE sources SET aliases = ARRAY['파이낸셜신문', 'fnnews'] WHERE id = 451 AND aliases = '{}';
+
+-- 4. 코멘트 추가
+COMMENT ON COLUMN sources.aliases IS '크롤링한 원본 언론사명 매칭용 별칭 (simple-classifier가 SOURCE_CACHE_TTL마다 다시 읽음)';
@@ -20,6 +20,11 @@ CREATE TABLE IF NOT EXISTS raw_news_articles (
     processed_at TIMESTAMP WITH TIME ZONE,
     processing_error TEXT,
 
+    -- 워커 선점 임대 (FOR UPDATE SKIP LOCKED)
+    claimed_by VARCHAR(100),
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+    claim_attempts INTEGER NOT NULL DEFAULT 0,
+
     -- 타임스탬프
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -29,6 +34,7 @@ CREATE TABLE IF NOT EXISTS raw_news_articles (
 CREATE INDEX IF NOT EXISTS idx_raw_news_processed ON raw_news_articles(processed);
 CREATE INDEX IF NOT EXISTS idx_raw_news_created_at ON raw_news_articles(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_raw_news_url ON raw_news_articles(url);
+CREATE INDEX IF NOT EXISTS idx_raw_news_claimable ON raw_news_articles(created_at) WHERE processed = FALSE;
 
 -- 3. 트리거 생성 (updated_at 자동 업데이트)
 CREATE OR REPLACE FUNCTION update_raw_news_updated_at()
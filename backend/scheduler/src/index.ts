@@ -8,6 +8,7 @@ import { processRawNews } from './jobs/processRawNews';
 import { generateAISummaries } from './jobs/generateSummaries';
 import { extractKeywords } from './jobs/extractKeywords';
 import { analyzeBias } from './jobs/analyzeBias';
+import { updateCategoryModel } from './jobs/updateCategoryModel';
 import { logger } from './utils/logger';
 
 // 환경변수 로드
@@ -77,6 +78,18 @@ async function startScheduler() {
     }
   });
 
+  // 5. 카테고리 모델 학습 작업 (10분마다, 새로 수집된 원본 기사의 언론사 카테고리로 이어서 학습)
+  cron.schedule(SCHEDULE_INTERVAL, async () => {
+    logger.info('🏷️  [JOB START] Category Model Update');
+
+    try {
+      await updateCategoryModel();
+      logger.info('✅ [JOB COMPLETE] Category Model Update');
+    } catch (error: any) {
+      logger.error(`❌ [JOB FAILED] Category Model Update: ${error.message}`);
+    }
+  });
+
   logger.info('✅ 스케줄러 초기화 완료');
   logger.info('🔄 작업 실행 대기 중...\n');
 
@@ -1,6 +1,6 @@
 /**
  * 편향 분석 작업
- * Bias Analysis AI의 정치 편향 분석 엔드포인트 호출
+ * Bias Analysis AI의 일괄 정치 분석 엔드포인트 호출 (감성/키워드 분석은 하지 않음)
  */
 
 import axios from 'axios';
@@ -9,6 +9,8 @@ import { getDbClient } from '../utils/database';
 
 const BIAS_ANALYSIS_AI_URL = process.env.BIAS_ANALYSIS_AI_URL || 'http://bias-analysis-ai:8002';
 const BATCH_SIZE = parseInt(process.env.BIAS_BATCH_SIZE || '50');
+// 한 번의 HTTP 요청에 담을 기사 수
+const REQUEST_CHUNK_SIZE = parseInt(process.env.BIAS_REQUEST_CHUNK_SIZE || '100');
 
 interface Article {
   id: number;
@@ -49,21 +51,38 @@ export async function analyzeBias(): Promise<void> {
     let successCount = 0;
     let failCount = 0;
 
-    // 2. 각 기사에 대해 편향 분석
-    for (const article of articles) {
+    // 2. 기사 묶음 단위로 편향 분석 (요청 한 번에 여러 기사)
+    for (let i = 0; i < articles.length; i += REQUEST_CHUNK_SIZE) {
+      const chunk = articles.slice(i, i + REQUEST_CHUNK_SIZE);
+
+      let results: any[];
       try {
-        // Bias Analysis AI 호출
         const response = await axios.post(
-          `${BIAS_ANALYSIS_AI_URL}/analyze/political`,
+          `${BIAS_ANALYSIS_AI_URL}/analyze/political/batch`,
           {
-            text: `${article.title}\n\n${article.content}`,
-            article_id: article.id
+            articles: chunk.map(article => ({
+              text: `${article.title}\n\n${article.content}`,
+              article_id: article.id
+            }))
           },
-          { timeout: 15000 }
+          { timeout: 15000 + chunk.length * 500 }
         );
+        results = response.data?.results || [];
+      } catch (error: any) {
+        failCount += chunk.length;
+        logger.error(`❌ 편향 분석 일괄 요청 실패 (${chunk.length}개): ${error.message}`);
+        continue;
+      }
 
-        if (response.data) {
-          const biasData = response.data;
+      // 결과는 요청 순서와 같음
+      for (let j = 0; j < chunk.length; j++) {
+        const article = chunk[j];
+        const biasData = results[j];
+
+        try {
+          if (!biasData) {
+            throw new Error('편향 분석 결과가 없습니다');
+          }
 
           // 3. bias_analysis 테이블에 저장
           await client.query(
@@ -95,17 +114,11 @@ export async function analyzeBias(): Promise<void> {
 
           successCount++;
           logger.debug(`✅ 기사 ID ${article.id} 편향 분석 완료: ${biasData.stance}`);
-        } else {
-          throw new Error('편향 분석 결과가 없습니다');
+        } catch (error: any) {
+          failCount++;
+          logger.error(`❌ 기사 ID ${article.id} 편향 분석 실패: ${error.message}`);
         }
-      } catch (error: any) {
-        failCount++;
-        logger.error(`❌ 기사 ID ${article.id} 편향 분석 실패: ${error.message}`);
-        continue;
       }
-
-      // API 호출 제한을 위한 짧은 지연
-      await new Promise(resolve => setTimeout(resolve, 150));
     }
 
     logger.info(`✅ 편향 분석 완료: ${successCount}개 성공, ${failCount}개 실패`);
@@ -1,6 +1,6 @@
 /**
  * 키워드 추출 작업
- * Bias Analysis AI의 키워드 추출 엔드포인트 호출
+ * Bias Analysis AI의 일괄 키워드 추출 엔드포인트 호출
  */
 
 import axios from 'axios';
@@ -9,6 +9,8 @@ import { getDbClient } from '../utils/database';
 
 const BIAS_ANALYSIS_AI_URL = process.env.BIAS_ANALYSIS_AI_URL || 'http://bias-analysis-ai:8002';
 const BATCH_SIZE = parseInt(process.env.KEYWORD_BATCH_SIZE || '50');
+// 한 번의 HTTP 요청에 담을 기사 수
+const REQUEST_CHUNK_SIZE = parseInt(process.env.KEYWORD_REQUEST_CHUNK_SIZE || '100');
 
 interface Article {
   id: number;
@@ -51,21 +53,38 @@ export async function extractKeywords(): Promise<void> {
     let successCount = 0;
     let failCount = 0;
 
-    // 2. 각 기사에 대해 키워드 추출
-    for (const article of articles) {
+    // 2. 기사 묶음 단위로 키워드 추출 (요청 한 번에 여러 기사)
+    for (let i = 0; i < articles.length; i += REQUEST_CHUNK_SIZE) {
+      const chunk = articles.slice(i, i + REQUEST_CHUNK_SIZE);
+
+      let results: { keywords: Keyword[] }[];
       try {
-        // Bias Analysis AI 호출
         const response = await axios.post(
-          `${BIAS_ANALYSIS_AI_URL}/analyze/keywords`,
+          `${BIAS_ANALYSIS_AI_URL}/analyze/keywords/batch`,
           {
-            text: `${article.title}\n\n${article.content}`,
-            article_id: article.id
+            articles: chunk.map(article => ({
+              text: `${article.title}\n\n${article.content}`,
+              article_id: article.id
+            }))
           },
-          { timeout: 10000 }
+          { timeout: 10000 + chunk.length * 200 }
         );
+        results = response.data?.results || [];
+      } catch (error: any) {
+        failCount += chunk.length;
+        logger.error(`❌ 키워드 추출 일괄 요청 실패 (${chunk.length}개): ${error.message}`);
+        continue;
+      }
 
-        if (response.data && response.data.keywords) {
-          const keywords: Keyword[] = response.data.keywords;
+      // 결과는 요청 순서와 같음
+      for (let j = 0; j < chunk.length; j++) {
+        const article = chunk[j];
+
+        try {
+          const keywords = results[j]?.keywords;
+          if (!keywords) {
+            throw new Error('키워드 결과가 없습니다');
+          }
 
           // 3. 키워드 DB 저장
           for (const kw of keywords) {
@@ -91,17 +110,11 @@ export async function extractKeywords(): Promise<void> {
 
           successCount++;
           logger.debug(`✅ 기사 ID ${article.id} 키워드 추출 완료: ${keywords.length}개`);
-        } else {
-          throw new Error('키워드 결과가 없습니다');
+        } catch (error: any) {
+          failCount++;
+          logger.error(`❌ 기사 ID ${article.id} 키워드 추출 실패: ${error.message}`);
         }
-      } catch (error: any) {
-        failCount++;
-        logger.error(`❌ 기사 ID ${article.id} 키워드 추출 실패: ${error.message}`);
-        continue;
       }
-
-      // API 호출 제한을 위한 짧은 지연
-      await new Promise(resolve => setTimeout(resolve, 100));
     }
 
     logger.info(`✅ 키워드 추출 완료: ${successCount}개 성공, ${failCount}개 실패`);
@@ -9,6 +9,8 @@ import { query, getDbClient } from '../utils/database';
 
 const SUMMARIZE_AI_URL = process.env.SUMMARIZE_AI_URL || 'http://summarize-ai:8000';
 const BATCH_SIZE = parseInt(process.env.SUMMARY_BATCH_SIZE || '50');
+// 한 번의 HTTP 요청에 담을 기사 수 (summarize-ai가 길이 버킷으로 나눠 생성)
+const REQUEST_CHUNK_SIZE = parseInt(process.env.SUMMARY_REQUEST_CHUNK_SIZE || '50');
 
 interface Article {
   id: number;
@@ -45,18 +47,35 @@ export async function generateAISummaries(): Promise<void> {
     let successCount = 0;
     let failCount = 0;
 
-    // 2. 각 기사에 대해 AI 요약 생성
-    for (const article of articles) {
+    // 2. 기사 묶음 단위로 AI 요약 생성 (요청 한 번에 여러 기사)
+    for (let i = 0; i < articles.length; i += REQUEST_CHUNK_SIZE) {
+      const chunk = articles.slice(i, i + REQUEST_CHUNK_SIZE);
+
+      let results: { summary: string }[];
       try {
-        // AI 요약 API 호출
         const response = await axios.post(
-          `${SUMMARIZE_AI_URL}/ai/summarize`,
-          { text: article.content },
-          { timeout: 15000 } // 15초 타임아웃
+          `${SUMMARIZE_AI_URL}/ai/summarize/batch`,
+          {
+            articles: chunk.map(article => ({ id: article.id, text: article.content }))
+          },
+          { timeout: 15000 + chunk.length * 2000 }
         );
+        results = response.data?.results || [];
+      } catch (error: any) {
+        failCount += chunk.length;
+        logger.error(`❌ AI 요약 일괄 요청 실패 (${chunk.length}개): ${error.message}`);
+        continue;
+      }
+
+      // 결과는 요청 순서와 같음
+      for (let j = 0; j < chunk.length; j++) {
+        const article = chunk[j];
 
-        if (response.data && response.data.summary) {
-          const summary = response.data.summary;
+        try {
+          const summary = results[j]?.summary;
+          if (!summary) {
+            throw new Error('요약 결과가 없습니다');
+          }
 
           // DB 업데이트
           await client.query(
@@ -66,19 +85,11 @@ export async function generateAISummaries(): Promise<void> {
 
           successCount++;
           logger.debug(`✅ 기사 ID ${article.id} 요약 완료`);
-        } else {
-          throw new Error('요약 결과가 없습니다');
+        } catch (error: any) {
+          failCount++;
+          logger.error(`❌ 기사 ID ${article.id} 요약 실패: ${error.message}`);
         }
-      } catch (error: any) {
-        failCount++;
-        logger.error(`❌ 기사 ID ${article.id} 요약 실패: ${error.message}`);
-
-        // 에러가 발생해도 계속 진행
-        continue;
       }
-
-      // API 호출 제한을 위한 짧은 지연
-      await new Promise(resolve => setTimeout(resolve, 100));
     }
 
     logger.info(`✅ AI 요약 생성 완료: ${successCount}개 성공, ${failCount}개 실패`);
@@ -9,15 +9,24 @@ import { query } from '../utils/database';
 
 const CLASSIFICATION_API_URL = process.env.CLASSIFICATION_API_URL || 'http://classification-api:5000';
 const BATCH_SIZE = parseInt(process.env.RAW_NEWS_BATCH_SIZE || '100');
+// 동시에 보낼 처리 요청 수 (classification-api가 기사를 나눠 선점하므로 겹치지 않음)
+const PARALLEL_CALLS = Math.max(parseInt(process.env.RAW_NEWS_PARALLEL_CALLS || '1'), 1);
+// classification-api의 CLAIM_MAX_ATTEMPTS와 같아야 함 (이 횟수 이상 선점된 기사는 더 이상 처리하지 않음)
+const CLAIM_MAX_ATTEMPTS = parseInt(process.env.CLAIM_MAX_ATTEMPTS || '5');
 
 /**
  * Raw 뉴스 처리 메인 함수
  */
 export async function processRawNews(): Promise<void> {
   try {
-    // 1. 처리 대기 중인 원본 기사 확인
+    // 1. 지금 선점 가능한 원본 기사 확인 (classification-api 선점 쿼리와 같은 조건)
+    //    다른 워커가 임대 중인 기사, 재시도 횟수를 넘긴 기사는 제외
     const countResult = await query(
-      'SELECT COUNT(*) FROM raw_news_articles WHERE processed = FALSE'
+      `SELECT COUNT(*) FROM raw_news_articles
+       WHERE processed = FALSE
+         AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
+         AND claim_attempts < $1`,
+      [CLAIM_MAX_ATTEMPTS]
     );
 
     const pendingCount = parseInt(countResult.rows[0].count);
@@ -29,20 +38,29 @@ export async function processRawNews(): Promise<void> {
 
     logger.info(`🔄 ${pendingCount}개 원본 기사 처리 시작...`);
 
-    // 2. Classification API 호출
-    const response = await axios.post(
-      `${CLASSIFICATION_API_URL}/process-raw-news`,
-      { limit: BATCH_SIZE },
-      { timeout: 300000 } // 5분 타임아웃
+    // 2. Classification API 호출 (대기 기사 수만큼만 병렬 호출)
+    const calls = Math.min(PARALLEL_CALLS, Math.ceil(pendingCount / BATCH_SIZE));
+    const responses = await Promise.all(
+      Array.from({ length: calls }, () =>
+        axios.post(
+          `${CLASSIFICATION_API_URL}/process-raw-news`,
+          { limit: BATCH_SIZE },
+          { timeout: 300000 } // 5분 타임아웃
+        )
+      )
     );
 
-    if (response.data.success) {
-      logger.info(
-        `✅ 원본 기사 처리 완료: ${response.data.processed}개 성공, ${response.data.failed || 0}개 실패`
-      );
-    } else {
-      throw new Error(response.data.error || '처리 실패');
+    let processed = 0;
+    let failed = 0;
+    for (const response of responses) {
+      if (!response.data.success) {
+        throw new Error(response.data.error || '처리 실패');
+      }
+      processed += response.data.processed || 0;
+      failed += response.data.failed || 0;
     }
+
+    logger.info(`✅ 원본 기사 처리 완료: ${processed}개 성공, ${failed}개 실패 (요청 ${calls}개)`);
   } catch (error: any) {
     if (error.code === 'ECONNREFUSED') {
       logger.error('❌ Classification API 연결 실패 (서비스가 실행중인지 확인하세요)');
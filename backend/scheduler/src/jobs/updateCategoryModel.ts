@@ -0,0 +1,71 @@
+/**
+ * 카테고리 분류 모델 온라인 학습 작업
+ * 새로 수집된 원본 기사의 언론사 카테고리(original_category)로 summarize-ai 카테고리 모델을 이어서 학습
+ */
+
+import axios from 'axios';
+import { logger } from '../utils/logger';
+import { query } from '../utils/database';
+
+const SUMMARIZE_AI_URL = process.env.SUMMARIZE_AI_URL || 'http://summarize-ai:8000';
+const BATCH_SIZE = parseInt(process.env.CATEGORY_UPDATE_BATCH_SIZE || '500');
+// 분류기는 본문 앞 2000자만 사용하므로 그 이상은 보내지 않음
+const MAX_CONTENT_CHARS = 2000;
+
+/**
+ * 카테고리 모델 학습 메인 함수
+ * 모델이 마지막으로 학습한 기사 id(last_article_id) 다음부터 id 순서로 보냄
+ * (train_category_classifier.py와 같은 기준이라 두 경로가 같은 기사를 두 번 학습하지 않음)
+ */
+export async function updateCategoryModel(): Promise<void> {
+  try {
+    // 1. 모델이 학습한 마지막 기사 id 확인
+    const status = await axios.get(`${SUMMARIZE_AI_URL}/ai/category/status`, { timeout: 10000 });
+    const lastArticleId: number = status.data.last_article_id || 0;
+
+    // 2. 그 이후에 들어온 라벨 있는 원본 기사 조회
+    const result = await query(
+      `SELECT id, title, LEFT(content, $3) AS content, original_category
+       FROM raw_news_articles
+       WHERE id > $1 AND original_category IS NOT NULL
+       ORDER BY id
+       LIMIT $2`,
+      [lastArticleId, BATCH_SIZE, MAX_CONTENT_CHARS]
+    );
+
+    if (result.rows.length === 0) {
+      logger.info('📭 카테고리 모델에 학습할 새 기사가 없습니다');
+      return;
+    }
+
+    // 3. 학습 요청 (id를 함께 보내 모델이 last_article_id를 옮김)
+    const response = await axios.post(
+      `${SUMMARIZE_AI_URL}/ai/category/update`,
+      {
+        articles: result.rows.map((row: any) => ({
+          id: row.id,
+          title: row.title || '',
+          content: row.content || '',
+          category: row.original_category
+        }))
+      },
+      { timeout: 120000 }
+    );
+
+    if (!response.data.success) {
+      throw new Error(response.data.error || '학습 실패');
+    }
+
+    logger.info(
+      `✅ 카테고리 모델 학습: ${response.data.trained}/${result.rows.length}개 사용, ` +
+      `누적 ${response.data.total_trained}개 (마지막 기사 ${response.data.last_article_id})`
+    );
+  } catch (error: any) {
+    if (error.code === 'ECONNREFUSED') {
+      logger.error('❌ Summarize AI 연결 실패 (서비스가 실행중인지 확인하세요)');
+    } else {
+      logger.error(`❌ 카테고리 모델 학습 실패: ${error.message}`);
+    }
+    throw error;
+  }
+}
@@ -6,10 +6,16 @@ Spark ML 없이 Flask로만 구현
 from flask import Flask, request, jsonify
 import logging
 import os
+import socket
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from db_pool import DatabasePool
+from source_resolver import SourceResolver
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,22 +26,44 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# 원본 기사 선점(claim): 여러 워커가 같은 기사를 중복 처리하지 않도록 임대(lease) 후 처리
+# gunicorn 워커 프로세스마다 달라야 하므로 WORKER_ID를 지정해도 pid를 붙임
+WORKER_ID = f"{os.getenv('WORKER_ID') or socket.gethostname()}-{os.getpid()}"
+# 임대 시간(초): 워커가 죽어 처리하지 못한 기사는 이 시간이 지나면 다른 워커가 다시 선점
+CLAIM_LEASE_SECONDS = int(os.getenv('CLAIM_LEASE_SECONDS', 300))
+# 선점 최대 횟수: 계속 실패하는 기사는 이 횟수 이후 더 이상 선점하지 않음
+CLAIM_MAX_ATTEMPTS = int(os.getenv('CLAIM_MAX_ATTEMPTS', 5))
+
 # Summarize AI URL (카테고리 분류용)
 SUMMARIZE_AI_URL = os.getenv('SUMMARIZE_AI_URL', 'http://summarize-ai:8000')
+# /ai/classify-batch 한 번에 보낼 기사 수 / 요청 타임아웃(초)
+AI_CLASSIFY_CHUNK_SIZE = int(os.getenv('AI_CLASSIFY_CHUNK_SIZE', 50))
+AI_CLASSIFY_TIMEOUT = float(os.getenv('AI_CLASSIFY_TIMEOUT', 30))
 
-def get_db_connection():
-    """PostgreSQL 데이터베이스 연결"""
-    return psycopg2.connect(
-        host=os.getenv('DB_HOST', 'postgres'),
-        port=int(os.getenv('DB_PORT', 5432)),
-        user=os.getenv('POSTGRES_USER', 'fans_user'),
-        password=os.getenv('POSTGRES_PASSWORD', 'fans_password'),
-        database=os.getenv('POSTGRES_DB', 'fans_db')
+def create_http_session():
+    """
+    keep-alive 연결을 재사용하는 HTTP 세션 (연결 오류/일시적 5xx는 짧게 재시도)
+    읽기 타임아웃은 재시도하지 않음 (이미 느린 AI 서비스에 같은 배치를 다시 보내 부하만 늘어남)
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        read=False,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['POST']
     )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
-# 언론사 매핑 (주요 언론사만 개별 ID로 관리)
-# 나머지는 "기타"(449)로 통합되지만, raw_news_articles.original_source에는 원본 이름이 저장되어
-# 편향성 분석 등에서는 정확한 언론사 정보 사용 가능
+# 워커 프로세스마다 하나씩 만들어 요청 간 공유
+http_session = create_http_session()
+
+# 언론사 매핑 (sources 테이블을 읽지 못했을 때만 사용, 평소에는 source_resolver가 sources.name/aliases 사용)
+# 주요 언론사만 개별 ID로 관리하고 나머지는 "기타"(449)로 통합되지만,
+# raw_news_articles.original_source에는 원본 이름이 저장되어 편향성 분석 등에서는 정확한 언론사 정보 사용 가능
 SOURCE_MAP = {
     # 주요 언론사
     '연합뉴스': 1, '동아일보': 20, '문화일보': 21,
@@ -52,50 +80,287 @@ SOURCE_MAP = {
     '대전일보': 459, '부산일보': 460,
 }
 
+def classify_categories_with_ai(articles):
+    """
+    AI를 사용한 카테고리 일괄 분류
+    AI_CLASSIFY_CHUNK_SIZE개씩 /ai/classify-batch로 보내고 결과의 index로 원래 기사에 매핑
+
+    Returns:
+        기사 순서대로 카테고리 목록 (분류 실패한 기사는 None)
+    """
+    categories = [None] * len(articles)
+
+    for start in range(0, len(articles), AI_CLASSIFY_CHUNK_SIZE):
+        chunk = articles[start:start + AI_CLASSIFY_CHUNK_SIZE]
+        try:
+            # Summarize AI의 일괄 카테고리 분류 엔드포인트 호출
+            response = http_session.post(
+                f"{SUMMARIZE_AI_URL}/ai/classify-batch",
+                json={
+                    "articles": [
+                        {"title": a['title'] or "", "content": a['content'] or ""}
+                        for a in chunk
+                    ]
+                },
+                timeout=AI_CLASSIFY_TIMEOUT
+            )
+
+            if response.status_code != 200:
+                logger.warning(f"⚠️ AI 카테고리 분류 API 오류 (status: {response.status_code})")
+                continue
+
+            for result in response.json().get('results', []):
+                index = result.get('index')
+                if index is not None and 0 <= index < len(chunk):
+                    categories[start + index] = result.get('category', '기타')
+
+        except requests.exceptions.Timeout:
+            logger.warning(f"⚠️ AI 카테고리 분류 타임아웃 ({len(chunk)}개)")
+        except requests.exceptions.ConnectionError as e:
+            # 서비스에 연결되지 않으면 남은 청크도 실패하므로 원본 카테고리로 처리
+            logger.error(f"❌ AI 카테고리 분류 서비스 연결 실패: {e}")
+            break
+        except Exception as e:
+            logger.error(f"❌ AI 카테고리 분류 실패: {e}")
+
+    classified = sum(1 for c in categories if c)
+    logger.info(f"🤖 AI 카테고리 분류: {classified}/{len(articles)}개")
+    return categories
+
+# 카테고리 ID 매핑
+CATEGORY_MAP = {
+    '정치': 1,
+    '경제': 2,
+    '사회': 3,
+    '생활/문화': 4,
+    'IT/과학': 5,
+    '세계': 6,
+    '스포츠': 7,
+    '연예': 8
+}
+
+# 연결마다 한 번 PREPARE해 두는 쿼리 (배열 파라미터로 받아 행 수와 관계없이 같은 문장/계획 재사용)
+PREPARED_STATEMENTS = {
+    'claim_raw_articles': """
+        PREPARE claim_raw_articles(integer, integer, text, double precision) AS
+        WITH claimable AS (
+            SELECT id
+            FROM raw_news_articles
+            WHERE processed = FALSE
+              AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
+              AND claim_attempts < $1
+            ORDER BY created_at ASC
+            LIMIT $2
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE raw_news_articles AS r
+        SET claimed_by = $3,
+            lease_expires_at = NOW() + make_interval(secs => $4),
+            claim_attempts = r.claim_attempts + 1
+        FROM claimable
+        WHERE r.id = claimable.id
+        RETURNING r.id, r.title, r.content, r.url, r.image_url, r.journalist, r.pub_date,
+                  r.original_source, r.original_category, r.created_at
+    """,
+    'insert_news': """
+        PREPARE insert_news(text[], text[], text[], text[], text[], timestamptz[], integer[], bigint[]) AS
+        INSERT INTO news_articles
+        (title, content, url, image_url, journalist, pub_date, source_id, category_id)
+        SELECT * FROM unnest($1, $2, $3, $4, $5, $6, $7, $8)
+        ON CONFLICT (url) DO NOTHING
+        RETURNING id
+    """,
+    # 아래 쓰기는 모두 아직 이 워커가 선점하고 있는 행만 대상 (임대 만료 후 다른 워커가 다시 선점한 행 제외)
+    'lock_claimed': """
+        PREPARE lock_claimed(bigint[], text) AS
+        SELECT id FROM raw_news_articles
+        WHERE id = ANY($1) AND claimed_by = $2
+        FOR UPDATE
+    """,
+    'mark_processed': """
+        PREPARE mark_processed(bigint[], text) AS
+        UPDATE raw_news_articles
+        SET processed = TRUE, processed_at = NOW(), processing_error = NULL,
+            claimed_by = NULL, lease_expires_at = NULL
+        WHERE id = ANY($1) AND claimed_by = $2
+        RETURNING id
+    """,
+    'record_errors': """
+        PREPARE record_errors(bigint[], text[], text) AS
+        UPDATE raw_news_articles AS r
+        SET processing_error = v.error, claimed_by = NULL, lease_expires_at = NULL
+        FROM unnest($1, $2) AS v(id, error)
+        WHERE r.id = v.id AND r.claimed_by = $3
+    """,
+}
+
+# 프로세스(gunicorn 워커)마다 하나의 연결 풀
+db_pool = DatabasePool(
+    connect_kwargs={
+        'host': os.getenv('DB_HOST', 'postgres'),
+        'port': int(os.getenv('DB_PORT', 5432)),
+        'user': os.getenv('POSTGRES_USER', 'fans_user'),
+        'password': os.getenv('POSTGRES_PASSWORD', 'fans_password'),
+        'database': os.getenv('POSTGRES_DB', 'fans_db'),
+    },
+    prepared_statements=PREPARED_STATEMENTS,
+    minconn=int(os.getenv('DB_POOL_MIN', 1)),
+    maxconn=int(os.getenv('DB_POOL_MAX', 4)),
+    timeout=float(os.getenv('DB_POOL_TIMEOUT', 30)),
+    check_after=float(os.getenv('DB_POOL_CHECK_AFTER', 30)),
+)
+
+def load_sources():
+    """sources 테이블의 언론사 이름/별칭"""
+    with db_pool.connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT id, name, aliases FROM sources")
+            return cursor.fetchall()
+
+# 언론사 목록은 SOURCE_CACHE_TTL초마다 다시 읽음 (새 언론사는 sources에 추가만 하면 반영)
+source_resolver = SourceResolver(
+    load_sources,
+    fallback=SOURCE_MAP,
+    default_id=SOURCE_MAP['기타'],
+    ttl=float(os.getenv('SOURCE_CACHE_TTL', 300)),
+    cache_size=int(os.getenv('SOURCE_CACHE_SIZE', 4096)),
+)
+
 def classify_source(original_source):
-    """언론사 텍스트를 source_id로 매핑"""
-    if not original_source:
-        return 449  # 기타
+    """언론사 텍스트를 source_id로 매핑 (없으면 기타)"""
+    return source_resolver.resolve(original_source)
 
-    # 완전 일치 검색
-    if original_source in SOURCE_MAP:
-        return SOURCE_MAP[original_source]
+def claim_raw_articles(conn, limit):
+    """
+    미처리 원본 기사를 limit개까지 선점하고 바로 커밋
+    FOR UPDATE SKIP LOCKED로 다른 워커가 선점 중인 행은 건너뛰므로 동시에 호출해도 겹치지 않음
+    임대가 만료된 기사(처리 중 워커가 죽은 경우)는 다시 선점 대상
+    """
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+    cursor.execute(
+        "EXECUTE claim_raw_articles (%s, %s, %s, %s)",
+        (CLAIM_MAX_ATTEMPTS, limit, WORKER_ID, CLAIM_LEASE_SECONDS)
+    )
+    raw_articles = sorted(cursor.fetchall(), key=lambda a: a['created_at'])
+    # 선점 잠금은 여기서 풀고, AI 분류 동안은 임대 시간으로만 보호
+    conn.commit()
+    cursor.close()
+    return raw_articles
+
+def build_news_rows(raw_articles, ai_categories):
+    """
+    분류 결과로 news_articles 삽입 행 생성
+
+    Returns:
+        (rows, errors) - rows: (raw id, 삽입 값 튜플) 목록, errors: (raw id, 에러 메시지) 목록
+    """
+    rows, errors = [], []
+    for raw_article, ai_category in zip(raw_articles, ai_categories):
+        try:
+            # AI 분류 결과가 있으면 사용, 없으면 원본 카테고리 사용
+            if ai_category:
+                final_category = ai_category
+            else:
+                final_category = raw_article['original_category'] or '사회'
+
+            category_id = CATEGORY_MAP.get(final_category, 3)  # 기본값: 사회(3)
+
+            # 언론사 분류
+            source_id = classify_source(raw_article['original_source'])
+
+            logger.debug(f"✅ 카테고리 확정: {raw_article['title'][:50]}... -> {final_category} (언론사: {source_id})")
+
+            rows.append((raw_article['id'], (
+                raw_article['title'],
+                raw_article['content'],
+                raw_article['url'],
+                raw_article['image_url'],
+                raw_article['journalist'],
+                raw_article['pub_date'],
+                source_id,
+                category_id
+            )))
+        except Exception as e:
+            logger.error(f"❌ 기사 처리 실패 (ID: {raw_article['id']}): {e}")
+            errors.append((raw_article['id'], str(e)))
+    return rows, errors
+
+def execute_insert_news(cursor, values_list):
+    """insert_news 실행 (행 값 튜플 목록을 열별 배열로 바꿔 전달), 실제 삽입된 행 수 반환"""
+    columns = [list(column) for column in zip(*values_list)]
+    cursor.execute("""
+        EXECUTE insert_news (
+            %s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+            %s::timestamptz[], %s::integer[], %s::bigint[]
+        )
+    """, columns)
+    return len(cursor.fetchall())
 
-    # 부분 일치 검색
-    for source_name, source_id in SOURCE_MAP.items():
-        if source_name in original_source or original_source in source_name:
-            return source_id
+def bulk_insert_news(cursor, rows):
+    """
+    news_articles 다중 행 INSERT 한 번으로 삽입 (RETURNING으로 실제 삽입된 행 수 확인)
+    일괄 삽입이 실패하면 savepoint로 되돌린 뒤 한 행씩 삽입해 문제 행만 에러로 기록
 
-    return 449  # 기타
+    Returns:
+        (삽입된 행 수, 성공한 raw id 목록, 에러 목록)
+    """
+    if not rows:
+        return 0, [], []
 
-def classify_category_with_ai(title, content):
-    """AI를 사용한 카테고리 분류"""
+    cursor.execute("SAVEPOINT bulk_insert")
     try:
-        # Summarize AI의 카테고리 분류 엔드포인트 호출
-        response = requests.post(
-            f"{SUMMARIZE_AI_URL}/ai/classify-category",
-            json={
-                "title": title or "",
-                "content": content or ""
-            },
-            timeout=5
-        )
+        inserted = execute_insert_news(cursor, [values for _, values in rows])
+        cursor.execute("RELEASE SAVEPOINT bulk_insert")
+        return inserted, [raw_id for raw_id, _ in rows], []
+    except psycopg2.Error as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT bulk_insert")
+        logger.warning(f"⚠️ 일괄 삽입 실패, 행 단위로 재시도: {e}")
+
+    inserted, succeeded, errors = 0, [], []
+    for raw_id, values in rows:
+        cursor.execute("SAVEPOINT row_insert")
+        try:
+            inserted += execute_insert_news(cursor, [values])
+            cursor.execute("RELEASE SAVEPOINT row_insert")
+            succeeded.append(raw_id)
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT row_insert")
+            logger.error(f"❌ 기사 삽입 실패 (ID: {raw_id}): {e}")
+            errors.append((raw_id, str(e).strip()))
+    return inserted, succeeded, errors
+
+def lock_claimed(cursor, raw_ids):
+    """
+    아직 이 워커가 선점 중인 행만 잠그고 id 집합 반환
+    잠근 행은 트랜잭션이 끝날 때까지 다른 워커가 선점하지 못함 (SKIP LOCKED로 건너뜀)
+    """
+    if not raw_ids:
+        return set()
+    cursor.execute("EXECUTE lock_claimed (%s::bigint[], %s)", (list(raw_ids), WORKER_ID))
+    return {row['id'] for row in cursor.fetchall()}
 
-        if response.status_code == 200:
-            result = response.json()
-            category = result.get('category', '기타')
-            logger.debug(f"✅ AI 카테고리 분류: {title[:30]}... -> {category}")
-            return category
-        else:
-            logger.warning(f"⚠️ AI 카테고리 분류 API 오류 (status: {response.status_code})")
-            return None
-
-    except requests.exceptions.Timeout:
-        logger.warning("⚠️ AI 카테고리 분류 타임아웃")
-        return None
-    except Exception as e:
-        logger.error(f"❌ AI 카테고리 분류 실패: {e}")
-        return None
+def mark_processed(cursor, raw_ids):
+    """
+    처리 완료 표시 + 임대 해제 (UPDATE 한 번, 이 워커가 선점 중인 행만)
+
+    Returns:
+        실제로 처리 완료 표시한 raw id 목록
+    """
+    if not raw_ids:
+        return []
+    cursor.execute("EXECUTE mark_processed (%s::bigint[], %s)", (list(raw_ids), WORKER_ID))
+    marked = {row['id'] for row in cursor.fetchall()}
+    return [raw_id for raw_id in raw_ids if raw_id in marked]
+
+def record_errors(cursor, errors):
+    """행별 에러 기록 + 임대 해제 (다음 호출에서 CLAIM_MAX_ATTEMPTS까지 재시도, 이 워커가 선점 중인 행만)"""
+    if not errors:
+        return
+    raw_ids, messages = zip(*errors)
+    cursor.execute(
+        "EXECUTE record_errors (%s::bigint[], %s::text[], %s)",
+        (list(raw_ids), list(messages), WORKER_ID)
+    )
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -103,6 +368,8 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'Simple Classification API (No Spark)',
+        'db_pool': db_pool.stats(),
+        'sources': source_resolver.stats(),
     })
 
 @app.route('/process-raw-news', methods=['POST'])
@@ -111,6 +378,7 @@ def process_raw_news():
     raw_news_articles에서 미처리 기사를 읽어서 분류하고 news_articles로 이동
 
     ⚠️ Spark ML 사용 안함! 기사 페이지에서 파싱한 원본 카테고리 사용
+    여러 워커/프로세스가 동시에 호출해도 기사를 나눠 선점하므로 중복 처리하지 않음
 
     Request Body (선택적):
     {
@@ -123,117 +391,63 @@ def process_raw_news():
 
         logger.info(f"🔄 원본 기사 처리 시작 (최대 {limit}개)...")
 
-        conn = get_db_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        # 미처리 raw 기사 조회
-        cursor.execute("""
-            SELECT id, title, content, url, image_url, journalist, pub_date,
-                   original_source, original_category
-            FROM raw_news_articles
-            WHERE processed = FALSE
-            ORDER BY created_at ASC
-            LIMIT %s
-        """, (limit,))
-
-        raw_articles = cursor.fetchall()
+        # 미처리 raw 기사 선점 (AI 분류 동안은 연결을 풀에 반납)
+        with db_pool.connection() as conn:
+            raw_articles = claim_raw_articles(conn, limit)
 
         if not raw_articles:
             logger.info("✅ 처리할 원본 기사가 없습니다")
-            cursor.close()
-            conn.close()
             return jsonify({
                 'message': 'No raw articles to process',
                 'processed': 0,
                 'success': True
             })
 
-        logger.info(f"📚 {len(raw_articles)}개 원본 기사 처리 중...")
-
-        processed_count = 0
-        failed_count = 0
-
-        # 카테고리 ID 매핑
-        category_map = {
-            '정치': 1,
-            '경제': 2,
-            '사회': 3,
-            '생활/문화': 4,
-            'IT/과학': 5,
-            '세계': 6,
-            '스포츠': 7,
-            '연예': 8
-        }
-
-        for raw_article in raw_articles:
-            try:
-                # AI 기반 카테고리 분류
-                ai_category = classify_category_with_ai(
-                    raw_article['title'],
-                    raw_article['content']
-                )
-
-                # AI 분류 결과가 있으면 사용, 없으면 원본 카테고리 사용
-                if ai_category:
-                    final_category = ai_category
-                else:
-                    final_category = raw_article['original_category'] or '사회'
-
-                category_id = category_map.get(final_category, 3)  # 기본값: 사회(3)
-
-                # 언론사 분류
-                source_id = classify_source(raw_article['original_source'])
-
-                logger.info(f"✅ 카테고리 확정: {raw_article['title'][:50]}... -> {final_category} (언론사: {source_id})")
-
-                # news_articles에 삽입
-                cursor.execute("""
-                    INSERT INTO news_articles
-                    (title, content, url, image_url, journalist, pub_date, source_id, category_id)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (url) DO NOTHING
-                """, (
-                    raw_article['title'],
-                    raw_article['content'],
-                    raw_article['url'],
-                    raw_article['image_url'],
-                    raw_article['journalist'],
-                    raw_article['pub_date'],
-                    source_id,
-                    category_id
-                ))
-
-                # raw_news_articles 상태 업데이트
-                cursor.execute("""
-                    UPDATE raw_news_articles
-                    SET processed = TRUE, processed_at = %s
-                    WHERE id = %s
-                """, (datetime.now(), raw_article['id']))
-
-                processed_count += 1
-
-            except Exception as e:
-                logger.error(f"❌ 기사 처리 실패 (ID: {raw_article['id']}): {e}")
-
-                # 에러 기록
-                cursor.execute("""
-                    UPDATE raw_news_articles
-                    SET processing_error = %s
-                    WHERE id = %s
-                """, (str(e), raw_article['id']))
-
-                failed_count += 1
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-        logger.info(f"✅ 처리 완료: {processed_count}개 성공, {failed_count}개 실패")
+        logger.info(f"📚 {len(raw_articles)}개 원본 기사 처리 중... (워커: {WORKER_ID})")
+
+        # AI 기반 카테고리 분류 (청크 단위 일괄 요청)
+        ai_categories = classify_categories_with_ai(raw_articles)
+
+        # 일괄 쓰기: 다중 행 INSERT 1회 + 처리 완료/에러 UPDATE 각 1회
+        rows, errors = build_news_rows(raw_articles, ai_categories)
+        with db_pool.connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+            # 분류하는 동안 임대가 만료되어 다른 워커가 다시 선점한 기사는 쓰지 않음
+            owned = lock_claimed(cursor, [a['id'] for a in raw_articles])
+            lost_count = len(raw_articles) - len(owned)
+            if lost_count:
+                logger.warning(f"⚠️ 임대 만료로 다른 워커에 넘어간 기사 {lost_count}개는 건너뜁니다")
+            rows = [row for row in rows if row[0] in owned]
+            errors = [error for error in errors if error[0] in owned]
+
+            inserted_count, succeeded_ids, insert_errors = bulk_insert_news(cursor, rows)
+            errors.extend(insert_errors)
+
+            succeeded_ids = mark_processed(cursor, succeeded_ids)
+            record_errors(cursor, errors)
+
+            conn.commit()
+            cursor.close()
+
+        processed_count = len(succeeded_ids)
+        # 이미 news_articles에 같은 url이 있어 삽입되지 않은 기사
+        skipped_count = max(processed_count - inserted_count, 0)
+        failed_count = len(errors)
+
+        logger.info(
+            f"✅ 처리 완료: {processed_count}개 성공 (삽입 {inserted_count}, 중복 {skipped_count}), "
+            f"{failed_count}개 실패"
+        )
 
         return jsonify({
             'message': f'Processed {processed_count} articles successfully',
             'processed': processed_count,
+            'inserted': inserted_count,
+            'skipped': skipped_count,
             'failed': failed_count,
+            'lease_lost': lost_count,
+            'errors': [{'id': raw_id, 'error': error} for raw_id, error in errors],
             'total': len(raw_articles),
             'success': True
         })
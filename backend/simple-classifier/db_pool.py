@@ -0,0 +1,203 @@
+"""
+PostgreSQL 연결 풀
+프로세스마다 하나의 ThreadedConnectionPool을 두고 요청 간 연결을 재사용한다.
+
+- 최대 연결 수를 넘으면 PoolError 대신 연결이 반납될 때까지 대기 (DB_POOL_TIMEOUT초)
+- 한동안 쓰지 않은 연결은 꺼낼 때 SELECT 1로 확인하고, 끊겼으면 버리고 새로 연결
+- 연결마다 처음 한 번 자주 쓰는 쿼리를 PREPARE해 두고 이후에는 EXECUTE로 실행
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(extensions.connection):
+    """풀 관리용 상태(연결 시간, 마지막 사용 시각, PREPARE 여부)를 가진 연결"""
+
+    def __init__(self, *args, **kwargs):
+        started = time.perf_counter()
+        super().__init__(*args, **kwargs)
+        self.connect_seconds = time.perf_counter() - started
+        self.last_used = time.monotonic()
+        self.prepared = False
+        self.counted = False
+
+
+class DatabasePool:
+    """헬스 체크 / 대기 / PREPARE를 더한 ThreadedConnectionPool 래퍼"""
+
+    def __init__(self, connect_kwargs: dict, prepared_statements: dict = None,
+                 minconn: int = 1, maxconn: int = 4, timeout: float = 30.0,
+                 check_after: float = 30.0):
+        """
+        Args:
+            connect_kwargs: psycopg2.connect 인자
+            prepared_statements: {이름: "PREPARE 이름(...) AS ..." 문} - 새 연결마다 한 번 실행
+            minconn / maxconn: 풀 최소/최대 연결 수
+            timeout: 연결이 모두 사용 중일 때 최대 대기 시간(초)
+            check_after: 이 시간(초) 이상 쓰지 않은 연결은 꺼낼 때 SELECT 1로 확인
+        """
+        self.connect_kwargs = connect_kwargs
+        self.prepared_statements = prepared_statements or {}
+        self.minconn = max(minconn, 0)
+        self.maxconn = max(maxconn, 1)
+        self.timeout = timeout
+        self.check_after = check_after
+
+        self._pool = None
+        self._create_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # 풀 크기만큼만 동시에 꺼낼 수 있도록 제한 (초과 요청은 대기)
+        self._slots = threading.BoundedSemaphore(self.maxconn)
+
+        self.in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.connect_seconds = 0.0
+        self.health_check_failures = 0
+
+    def _get_pool(self):
+        # gunicorn 워커 프로세스 안에서 처음 사용할 때 생성 (fork 전에 연결을 만들지 않음)
+        if self._pool is None:
+            with self._create_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.minconn, self.maxconn,
+                        connection_factory=PooledConnection, **self.connect_kwargs
+                    )
+                    logger.info(f"🔌 DB 연결 풀 생성: min={self.minconn}, max={self.maxconn}")
+        return self._pool
+
+    def _acquire_slot(self):
+        if self._slots.acquire(blocking=False):
+            return
+        started = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.timeout)
+        waited = time.perf_counter() - started
+        with self._stats_lock:
+            self.waits += 1
+            self.wait_seconds += waited
+            if not acquired:
+                self.timeouts += 1
+        if not acquired:
+            raise PoolError(f"DB 연결 대기 시간 초과 ({self.timeout}초, 최대 {self.maxconn}개 사용 중)")
+
+    def _is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - conn.last_used < self.check_after:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _prepare(self, conn):
+        with conn.cursor() as cursor:
+            for statement in self.prepared_statements.values():
+                cursor.execute(statement)
+        conn.commit()
+        conn.prepared = True
+
+    def _checkout(self):
+        pool = self._get_pool()
+        # 끊긴 연결을 버리고 다시 꺼내는 횟수 제한 (DB가 내려간 경우 무한 반복 방지)
+        for _ in range(self.maxconn + 1):
+            conn = pool.getconn()
+            if not conn.counted:
+                conn.counted = True
+                with self._stats_lock:
+                    self.connects += 1
+                    self.connect_seconds += conn.connect_seconds
+
+            if not self._is_healthy(conn):
+                with self._stats_lock:
+                    self.health_check_failures += 1
+                logger.warning("⚠️ 끊긴 DB 연결을 폐기하고 다시 연결합니다")
+                pool.putconn(conn, close=True)
+                continue
+
+            try:
+                if not conn.prepared:
+                    self._prepare(conn)
+            except Exception:
+                pool.putconn(conn, close=True)
+                raise
+            return conn
+        raise PoolError("정상 DB 연결을 얻지 못했습니다")
+
+    def _release(self, conn, broken: bool):
+        if not conn.closed and not broken:
+            # 커밋/롤백하지 않은 트랜잭션이 다음 요청으로 넘어가지 않도록 정리
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    broken = True
+        conn.last_used = time.monotonic()
+        self._get_pool().putconn(conn, close=conn.closed or broken)
+
+    @contextmanager
+    def connection(self):
+        """
+        풀에서 연결을 꺼내 빌려주고 끝나면 반납
+        블록에서 예외가 나면 롤백하고, 연결 자체 오류(OperationalError 등)면 연결을 폐기
+        """
+        self._acquire_slot()
+        try:
+            conn = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self.in_use += 1
+            self.checkouts += 1
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            try:
+                self._release(conn, broken)
+            finally:
+                with self._stats_lock:
+                    self.in_use -= 1
+                self._slots.release()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                'min': self.minconn,
+                'max': self.maxconn,
+                'in_use': self.in_use,
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_seconds_total': round(self.wait_seconds, 3),
+                'timeouts': self.timeouts,
+                'connects': self.connects,
+                'connect_ms_avg': round(self.connect_seconds / self.connects * 1000, 1) if self.connects else None,
+                'health_check_failures': self.health_check_failures,
+                'prepared_statements': list(self.prepared_statements)
+            }
@@ -0,0 +1,172 @@
+"""
+언론사 이름 → source_id 변환
+sources 테이블의 name / aliases를 읽어 조회용 인덱스를 만들고, TTL마다 다시 읽어 새 언론사를 반영한다.
+(언론사를 추가할 때 sources에 행만 넣으면 되고 재배포는 필요 없음)
+
+조회 순서 (원본 언론사 문자열 길이에 비례하는 시간):
+1. 완전 일치 dict
+2. 원본이 언론사 이름의 일부인 경우 ('한겨' → 한겨레): 이름의 부분 문자열 dict
+3. 원본에 언론사 이름이 들어 있는 경우 ('조선일보 정치부' → 조선일보): 긴 이름 우선 정규식
+결과는 원본 문자열별로 크기 제한 LRU 캐시에 저장하고, 인덱스를 다시 읽을 때 비운다.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# (id, name, aliases) 행 목록
+SourceRows = Iterable[Tuple[int, str, Optional[List[str]]]]
+
+
+def normalize_name(name: str) -> str:
+    """공백 제거 + 대소문자 무시 ('JTBC 뉴스' / 'jtbc뉴스'를 같게 취급)"""
+    return WHITESPACE_PATTERN.sub('', name or '').casefold()
+
+
+class SourceIndex:
+    """한 시점의 언론사 목록으로 만든 조회용 인덱스"""
+
+    def __init__(self, rows: SourceRows, default_id: int, min_substring: int = 2):
+        """
+        Args:
+            rows: (id, name, aliases) 목록
+            default_id: 일치하는 언론사가 없을 때 ("기타")
+            min_substring: 부분 일치에 쓰는 최소 글자 수 (한 글자는 오탐이 많아 제외)
+        """
+        self.default_id = default_id
+        self.exact: Dict[str, int] = {}
+        self.substrings: Dict[str, Optional[int]] = {}
+
+        for source_id, name, aliases in rows:
+            for alias in [name, *(aliases or [])]:
+                key = normalize_name(alias)
+                if key:
+                    self.exact.setdefault(key, source_id)
+
+        names = [key for key, source_id in self.exact.items() if source_id != default_id]
+        for key in names:
+            source_id = self.exact[key]
+            for length in range(max(min_substring, 1), len(key) + 1):
+                for start in range(len(key) - length + 1):
+                    part = key[start:start + length]
+                    # 여러 언론사에 걸치는 부분 문자열('일보' 등)은 어느 쪽인지 알 수 없으므로 제외
+                    if self.substrings.setdefault(part, source_id) != source_id:
+                        self.substrings[part] = None
+
+        # 긴 이름 우선 ('한국경제TV'가 '한국경제'보다 먼저 일치)
+        names.sort(key=len, reverse=True)
+        self.contained = re.compile('|'.join(map(re.escape, names))) if names else None
+        self.source_count = len(set(self.exact.values()))
+
+    def resolve(self, original_source: str) -> int:
+        key = normalize_name(original_source)
+        if not key:
+            return self.default_id
+
+        if key in self.exact:
+            return self.exact[key]
+
+        source_id = self.substrings.get(key)
+        if source_id is not None:
+            return source_id
+
+        if self.contained is not None:
+            match = self.contained.search(key)
+            if match:
+                return self.exact[match.group(0)]
+
+        return self.default_id
+
+
+class SourceResolver:
+    """sources 테이블 기반 인덱스 + TTL 갱신 + 원본 문자열별 LRU 캐시"""
+
+    def __init__(self, loader: Callable[[], SourceRows], fallback: Dict[str, int],
+                 default_id: int = 449, ttl: float = 300.0, cache_size: int = 4096):
+        """
+        Args:
+            loader: sources 테이블에서 (id, name, aliases) 행을 읽는 함수
+            fallback: DB에서 읽지 못했을 때 쓸 {이름: id}
+            ttl: 인덱스를 다시 읽는 주기(초)
+            cache_size: 원본 문자열별 결과 캐시 최대 크기
+        """
+        self.loader = loader
+        self.fallback_index = SourceIndex(
+            [(source_id, name, None) for name, source_id in fallback.items()], default_id
+        )
+        self.default_id = default_id
+        self.ttl = ttl
+        self.cache_size = max(cache_size, 1)
+
+        self._index = self.fallback_index
+        self._origin = 'fallback'
+        self._expires_at = 0.0
+        self._loaded_at = None
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.load_failures = 0
+
+    def _refresh(self, now: float):
+        try:
+            index = SourceIndex(list(self.loader()), self.default_id)
+            if not index.exact:
+                raise ValueError("sources 테이블이 비어 있습니다")
+            self._index, self._origin = index, 'database'
+            self._loaded_at = time.time()
+            logger.info(f"📰 언론사 인덱스 갱신: {index.source_count}개 언론사, 이름/별칭 {len(index.exact)}개")
+        except Exception as e:
+            # 이전 인덱스(또는 SOURCE_MAP)로 계속 처리하고 다음 주기에 다시 시도
+            self.load_failures += 1
+            logger.warning(f"⚠️ 언론사 목록 로드 실패, {self._origin} 인덱스 유지: {e}")
+        self._cache.clear()
+        self._expires_at = now + self.ttl
+
+    def resolve(self, original_source: Optional[str]) -> int:
+        if not original_source:
+            return self.default_id
+
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._expires_at:
+                self._refresh(now)
+
+            source_id = self._cache.get(original_source)
+            if source_id is not None:
+                self._cache.move_to_end(original_source)
+                self.hits += 1
+                return source_id
+
+            self.misses += 1
+            source_id = self._index.resolve(original_source)
+            self._cache[original_source] = source_id
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return source_id
+
+    def invalidate(self):
+        """다음 조회 때 sources 테이블을 다시 읽도록 표시"""
+        with self._lock:
+            self._expires_at = 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'origin': self._origin,
+                'sources': self._index.source_count,
+                'names': len(self._index.exact),
+                'loaded_at': self._loaded_at,
+                'ttl_seconds': self.ttl,
+                'cache_size': len(self._cache),
+                'hits': self.hits,
+                'misses': self.misses,
+                'load_failures': self.load_failures
+            }